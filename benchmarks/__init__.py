@@ -0,0 +1,24 @@
+"""Micro benchmarks of the message path.
+
+Each benchmark is a module that can be run from the root of the repository,
+ex. ``python -m benchmarks.sentiment``.
+"""
+
+import timeit
+from typing import Callable
+
+
+def measure(name: str, function: Callable[[], object], count: int, repeat: int = 5):
+    """Prints the best throughput of a function processing `count` items.
+
+    :param name: The name printed with the result
+    :type name: str
+    :param function: The function to measure
+    :type function: Callable[[], object]
+    :param count: The number of items processed by a call of the function
+    :type count: int
+    :param repeat: The number of measures, the best one is kept
+    :type repeat: int
+    """
+    best = min(timeit.repeat(function, number=1, repeat=repeat))
+    print(f"{name:<40} {count / best:>12,.0f} items/s")
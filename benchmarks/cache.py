@@ -0,0 +1,63 @@
+"""Measures `lib.cache.AsyncCache` under bursts of concurrent lookups of a
+few popular keys, like a command used by many members at once."""
+
+import asyncio
+import random
+
+from benchmarks import measure
+from lib.cache import AsyncCache
+
+# The time an upstream takes to answer, in seconds
+LATENCY = 0.005
+
+
+def build_burst(size: int, keys: int):
+    rng = random.Random(42)
+
+    # A few keys are much more popular than the others
+    return [f"city-{int(rng.paretovariate(1.2)) % keys}" for _ in range(size)]
+
+
+async def fetch(key: str) -> str:
+    await asyncio.sleep(LATENCY)
+    return key.upper()
+
+
+async def uncached(burst):
+    await asyncio.gather(*(fetch(key) for key in burst))
+
+
+async def cached(cache: AsyncCache, burst):
+    await asyncio.gather(
+        *(cache.get_or_load(key, lambda key=key: fetch(key)) for key in burst)
+    )
+
+
+async def hits(cache: AsyncCache, burst):
+    for key in burst:
+        await cache.get_or_load(key, lambda key=key: fetch(key))
+
+
+def main():
+    burst = build_burst(10_000, keys=200)
+
+    measure("no cache", lambda: asyncio.run(uncached(burst)), len(burst))
+    measure(
+        "AsyncCache, cold",
+        lambda: asyncio.run(cached(AsyncCache(ttl=60), burst)),
+        len(burst),
+    )
+
+    cache = AsyncCache(ttl=60)
+    asyncio.run(cached(cache, burst))
+    measure("AsyncCache, warm", lambda: asyncio.run(hits(cache, burst)), len(burst))
+
+    # Every lookup without the cache is a request to the upstream
+    print(
+        f"\nupstream requests: {len(burst):,} without cache, {cache.stats.loads:,} with"
+    )
+    print(cache.stats)
+
+
+if __name__ == "__main__":
+    main()
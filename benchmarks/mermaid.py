@@ -0,0 +1,83 @@
+"""Measures the cost of `MermaidCog.on_message_analysis` for the messages
+without a mermaid diagram, with and without the fence prefilter."""
+
+import asyncio
+import random
+from unittest.mock import MagicMock
+
+import discord
+from discord.ext import commands
+
+from benchmarks import measure
+from bot.classes.message_analysis import MessageAnalysis
+from bot.extensions.mermaid_cog import MermaidCog
+
+MESSAGES = [
+    "did anyone try the new python release",
+    "check r/linux for the kernel patch",
+    "```py\nprint('hello world')\n```",
+    "what time is the meeting tomorrow? 5pm EST?",
+    "::weather montreal",
+    "I pushed the fix to the main branch",
+]
+
+
+def build_bot() -> commands.Bot:
+    bot = commands.Bot(command_prefix="::", intents=discord.Intents.none())
+    bot._connection.user = MagicMock(id=0)
+    bot.app = MagicMock()
+    bot.app.config.get = MagicMock(return_value="https://mermaid.ink")
+
+    return bot
+
+
+def build_corpus(size: int):
+    rng = random.Random(42)
+
+    return [
+        MagicMock(
+            content=rng.choice(MESSAGES),
+            guild=None,
+            reference=None,
+            author=MagicMock(id=1),
+        )
+        for _ in range(size)
+    ]
+
+
+async def parse_first(cog: MermaidCog, analysis: MessageAnalysis):
+    # The listener before the prefilter, every message was parsed as a command
+    ctx = await cog.bot.get_context(analysis.message)
+    if analysis.message.reference or ctx.command:
+        return
+
+    if codeblock := analysis.code_block("mermaid"):
+        codeblock.code.strip()
+
+
+def run(listener, cog: MermaidCog, corpus):
+    async def process():
+        for message in corpus:
+            await listener(cog, MessageAnalysis(message))
+
+    asyncio.run(process())
+
+
+def main():
+    cog = MermaidCog(build_bot())
+    corpus = build_corpus(10_000)
+
+    measure(
+        "get_context on every message",
+        lambda: run(parse_first, cog, corpus),
+        len(corpus),
+    )
+    measure(
+        "fence prefilter",
+        lambda: run(MermaidCog.on_message_analysis, cog, corpus),
+        len(corpus),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Compares the throughput of NLTK's analyzer with `lib.sentiment`."""
+
+import random
+
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+from benchmarks import measure
+from lib.sentiment import SentimentAnalyzer
+
+NEUTRAL_MESSAGES = [
+    "did anyone try the new python release",
+    "check r/linux for the kernel patch",
+    "```py\nprint('hello world')\n```",
+    "what time is the meeting tomorrow? 5pm EST?",
+    "@grace what is the weather in montreal",
+    "I pushed the fix to the main branch",
+]
+SENTIMENT_MESSAGES = [
+    "I love this community, thanks for the help!",
+    "this bug is so annoying, I hate segfaults",
+    "Linus is not wrong but he could be nicer",
+    "lol that pun was terrible :)",
+]
+
+
+def build_corpus(size: int, sentiment_ratio: float):
+    rng = random.Random(42)
+
+    return [
+        rng.choice(
+            SENTIMENT_MESSAGES if rng.random() < sentiment_ratio else NEUTRAL_MESSAGES
+        )
+        for _ in range(size)
+    ]
+
+
+def main():
+    nltk_analyzer = SentimentIntensityAnalyzer()
+    analyzer = SentimentAnalyzer()
+
+    for sentiment_ratio in (0.0, 0.3, 1.0):
+        corpus = build_corpus(10_000, sentiment_ratio)
+        print(f"\n{sentiment_ratio:.0%} of messages with sentiment words")
+
+        measure(
+            "nltk SentimentIntensityAnalyzer",
+            lambda: [nltk_analyzer.polarity_scores(text) for text in corpus],
+            len(corpus),
+        )
+        measure(
+            "lib.sentiment SentimentAnalyzer",
+            lambda: analyzer.polarity_scores_batch(corpus),
+            len(corpus),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compares the throughput of NLTK's `TweetTokenizer` with `lib.tokenizer`."""
+
+import random
+
+from nltk.tokenize import TweetTokenizer
+
+from benchmarks import measure
+from lib.tokenizer import tokenize
+
+ASCII_MESSAGES = [
+    "did anyone try the new python release",
+    "Hey @grace, what do you think of #rust?",
+    "I love linux, but Linus can be harsh sometimes!",
+    "it's not a bug, it's a feature",
+]
+OTHER_MESSAGES = [
+    "check https://github.com/Code-Society-Lab/grace for the code",
+    "meeting at 5:30pm EST... don't be late :)",
+    "Rust is 🦀🦀🦀",
+]
+
+
+def build_corpus(size: int, ascii_ratio: float):
+    rng = random.Random(42)
+
+    # Makes every message unique, the cache would hide the tokenization
+    return [
+        rng.choice(ASCII_MESSAGES if rng.random() < ascii_ratio else OTHER_MESSAGES)
+        + f" number{chr(97 + index % 26)}{index // 26 * 'x'}"
+        for index in range(size)
+    ]
+
+
+def main():
+    tweet_tokenizer = TweetTokenizer()
+
+    for ascii_ratio in (1.0, 0.8, 0.0):
+        corpus = build_corpus(10_000, ascii_ratio)
+        print(f"\n{ascii_ratio:.0%} of plain ASCII messages")
+
+        measure(
+            "nltk TweetTokenizer",
+            lambda: [tweet_tokenizer.tokenize(text) for text in corpus],
+            len(corpus),
+        )
+
+        def uncached():
+            tokenize.cache_clear()
+            return [tokenize(text) for text in corpus]
+
+        measure("lib.tokenizer tokenize", uncached, len(corpus))
+        # The same messages tokenized again, ex. by another cog
+        repeated = corpus[:1000] * 10
+        measure(
+            "lib.tokenizer tokenize (cached)",
+            lambda: list(map(tokenize, repeated)),
+            len(repeated),
+        )
+
+
+if __name__ == "__main__":
+    main()
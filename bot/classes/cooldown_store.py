@@ -0,0 +1,73 @@
+import time
+from typing import Dict
+
+from discord.ext.commands import Command
+
+from bot.models.command_cooldown import CommandCooldown
+from lib.cooldowns import PersistentCooldownMapping, make_persistent
+
+
+class CooldownStore:
+    """Keeps the cooldowns of every command across restarts.
+
+    When a command is added to the bot, its cooldown is replaced by a
+    `PersistentCooldownMapping` restored from the database. The buckets used
+    since the last save are written back in batch by `flush`, which also
+    deletes the expired ones, and when the command is removed (ex. when its
+    extension is reloaded).
+    """
+
+    def __init__(self):
+        self.__mappings: Dict[str, PersistentCooldownMapping] = {}
+
+    def __len__(self) -> int:
+        return sum(len(mapping) for mapping in self.__mappings.values())
+
+    def attach(self, command: Command):
+        """Makes the cooldown of a command, and of its subcommands, persistent.
+
+        :param command: The command added to the bot
+        :type command: Command
+        """
+        for cmd in self.__walk(command):
+            mapping = make_persistent(cmd._buckets)
+
+            if mapping is None:
+                continue
+
+            mapping.restore(CommandCooldown.load(cmd.qualified_name))
+
+            cmd._buckets = mapping
+            self.__mappings[cmd.qualified_name] = mapping
+
+    def detach(self, command: Command):
+        """Saves and forgets the cooldown of a command and of its subcommands.
+
+        :param command: The command removed from the bot
+        :type command: Command
+        """
+        for cmd in self.__walk(command):
+            if mapping := self.__mappings.pop(cmd.qualified_name, None):
+                self.__save(cmd.qualified_name, mapping)
+
+    def flush(self):
+        """Writes the buckets used since the last flush to the database and
+        deletes the expired ones.
+        """
+        for name, mapping in self.__mappings.items():
+            self.__save(name, mapping)
+
+        CommandCooldown.delete_expired(time.time())
+
+    @staticmethod
+    def __walk(command: Command):
+        yield command
+
+        if walk_commands := getattr(command, "walk_commands", None):
+            yield from walk_commands()
+
+    @staticmethod
+    def __save(name: str, mapping: PersistentCooldownMapping):
+        CommandCooldown.save(
+            name, mapping._cooldown.per, mapping.dump(changed_only=True)
+        )
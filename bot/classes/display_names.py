@@ -0,0 +1,103 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from discord import Guild, HTTPException
+
+
+class DisplayNames:
+    """Resolves the display name of members for embeds that list many of
+    them (ex. the thank leaderboard).
+
+    Names are looked up in the gateway cache of the guild and of the bot
+    first. The others are fetched from the API concurrently, at most
+    `max_concurrency` at once, and kept for `ttl` seconds in a bounded cache.
+
+    :param bot: The bot used to fetch the users.
+    :type bot: Grace
+    :param ttl: The number of seconds a fetched name is kept.
+    :type ttl: float
+    :param max_size: The maximum number of fetched names kept.
+    :type max_size: int
+    :param max_concurrency: The maximum number of concurrent fetches.
+    :type max_concurrency: int
+    """
+
+    def __init__(
+        self,
+        bot,
+        ttl: float = 3600,
+        max_size: int = 1024,
+        max_concurrency: int = 5,
+    ):
+        self.bot = bot
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+
+        self.__names: OrderedDict[int, Tuple[str, float]] = OrderedDict()
+        self.__semaphore = asyncio.Semaphore(max_concurrency)
+
+    def get_cached(self, user_id: int, guild: Optional[Guild] = None) -> Optional[str]:
+        """Returns the name of a user without calling the API.
+
+        :param user_id: The id of the user.
+        :type user_id: int
+        :param guild: The guild of the member, if any.
+        :type guild: Optional[discord.Guild]
+
+        :return: The display name or None if it is not cached.
+        :rtype: Optional[str]
+        """
+        user = (guild and guild.get_member(user_id)) or self.bot.get_user(user_id)
+        if user is not None:
+            return user.display_name
+
+        if cached := self.__names.get(user_id):
+            name, expires_at = cached
+
+            if expires_at > time.monotonic():
+                return name
+            del self.__names[user_id]
+
+        return None
+
+    async def resolve(
+        self, user_ids: Iterable[int], guild: Optional[Guild] = None
+    ) -> Dict[int, str]:
+        """Returns the display name of each user, fetching the missing ones
+        concurrently.
+
+        Users that can't be fetched (ex. deleted accounts) are named
+        "Unknown user".
+
+        :param user_ids: The ids of the users.
+        :type user_ids: Iterable[int]
+        :param guild: The guild of the members, if any.
+        :type guild: Optional[discord.Guild]
+
+        :return: The display name of each user.
+        :rtype: Dict[int, str]
+        """
+        names = {user_id: self.get_cached(user_id, guild) for user_id in user_ids}
+        missing = [user_id for user_id, name in names.items() if name is None]
+
+        fetched = await asyncio.gather(*(self.__fetch(user_id) for user_id in missing))
+        names.update(zip(missing, fetched))
+
+        return names
+
+    async def __fetch(self, user_id: int) -> str:
+        async with self.__semaphore:
+            try:
+                user = await self.bot.fetch_user(user_id)
+            except HTTPException:
+                return "Unknown user"
+
+        self.__names[user_id] = (user.display_name, time.monotonic() + self.ttl)
+        self.__names.move_to_end(user_id)
+
+        if len(self.__names) > self.max_size:
+            self.__names.popitem(last=False)
+
+        return user.display_name
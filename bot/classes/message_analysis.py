@@ -0,0 +1,100 @@
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from typing import FrozenSet, Optional, Tuple
+
+from discord import Message
+
+from lib.timezones import TimezoneMention, find_timezones
+from lib.tokenizer import tokenize
+
+CODE_BLOCK_PATTERN = re.compile(r"```(\w+)?\n(.*?)```", re.DOTALL)
+SUBREDDIT_PATTERN = re.compile(r"(?<![/.])\br/([A-Za-z0-9_]{3,21})")
+
+
+@dataclass(frozen=True)
+class CodeBlock:
+    """A fenced code block found in a message.
+
+    :param language: The language tag of the block, if any (ex. ``mermaid``).
+    :type language: Optional[str]
+    :param code: The raw content of the block.
+    :type code: str
+    """
+
+    language: Optional[str]
+    code: str
+
+
+@dataclass(frozen=True, eq=False)
+class MessageAnalysis:
+    """An immutable analysis of a message shared by every `on_message_analysis`
+    listener.
+
+    The bot builds a single analysis per message and dispatches it with the
+    `message_analysis` event. Each value is computed the first time a
+    listener asks for it and is then reused by the other listeners, so a
+    message is tokenized and scanned at most once no matter how many cogs
+    are listening.
+
+    :param message: The analyzed message.
+    :type message: discord.Message
+    """
+
+    message: Message
+
+    @cached_property
+    def content(self) -> str:
+        """Returns the raw content of the message."""
+        return self.message.content
+
+    @cached_property
+    def lowered(self) -> str:
+        """Returns the lowercased content of the message."""
+        return self.content.lower()
+
+    @cached_property
+    def tokens(self) -> Tuple[str, ...]:
+        """Returns the lowercased tokens of the message, in order."""
+        return tuple(token.lower() for token in tokenize(self.content))
+
+    @cached_property
+    def token_set(self) -> FrozenSet[str]:
+        """Returns the distinct lowercased tokens of the message."""
+        return frozenset(self.tokens)
+
+    @cached_property
+    def code_blocks(self) -> Tuple[CodeBlock, ...]:
+        """Returns the fenced code blocks of the message."""
+        return tuple(
+            CodeBlock(language, code)
+            for language, code in CODE_BLOCK_PATTERN.findall(self.content)
+        )
+
+    @cached_property
+    def subreddits(self) -> FrozenSet[str]:
+        """Returns the subreddits mentioned (ex. ``r/python``) in the message."""
+        return frozenset(SUBREDDIT_PATTERN.findall(self.content))
+
+    @cached_property
+    def timezones(self) -> Tuple[TimezoneMention, ...]:
+        """Returns the timezone abbreviations found in the message."""
+        return tuple(find_timezones(self.content))
+
+    @property
+    def from_bot(self) -> bool:
+        """Returns true if the message was sent by a bot."""
+        return self.message.author.bot
+
+    def code_block(self, language: str) -> Optional[CodeBlock]:
+        """Returns the first code block tagged with the given language.
+
+        :param language: The language tag of the block (ex. ``mermaid``).
+        :type language: str
+
+        :return: The first matching code block or None.
+        :rtype: Optional[CodeBlock]
+        """
+        return next(
+            (block for block in self.code_blocks if block.language == language), None
+        )
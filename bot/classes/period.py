@@ -0,0 +1,55 @@
+from datetime import date, datetime, timedelta
+from enum import Enum, unique
+from typing import Optional
+
+
+@unique
+class Period(Enum):
+    ALL = 0
+    WEEK = 1
+    MONTH = 2
+
+    def __str__(self):
+        return self.name.capitalize()
+
+    @classmethod
+    def _missing_(cls, value: object) -> Optional["Period"]:
+        # Periods are also found by name (ex. `::thank leaderboard 10 week`),
+        # prefix commands convert their arguments with `Period(argument)`
+        if isinstance(value, str):
+            return cls.__members__.get(value.strip().upper())
+        return None
+
+    def start(self, time: datetime) -> Optional[date]:
+        """Returns the first day of the period containing the given time.
+
+        Weeks start on Monday. The whole history (`ALL`) has no start.
+
+        :param time: The time in the period.
+        :type time: datetime
+
+        :return: The first day of the period or None.
+        :rtype: Optional[date]
+        """
+        day = time.date()
+
+        if self is Period.WEEK:
+            return day - timedelta(days=day.weekday())
+        if self is Period.MONTH:
+            return day.replace(day=1)
+        return None
+
+    def previous_start(self, start: date) -> Optional[date]:
+        """Returns the first day of the period before the given one.
+
+        :param start: The first day of a period.
+        :type start: date
+
+        :return: The first day of the previous period or None.
+        :rtype: Optional[date]
+        """
+        if self is Period.WEEK:
+            return start - timedelta(weeks=1)
+        if self is Period.MONTH:
+            return (start - timedelta(days=1)).replace(day=1)
+        return None
@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+
+from bot.models.bot import BotSettings
+from bot.models.extensions.language.pun import Pun
+
+
+def _as_utc(time: datetime) -> datetime:
+    """Returns the given time as an aware UTC datetime.
+
+    Naive datetimes are considered to already be in UTC.
+    """
+    if time.tzinfo is None:
+        return time.replace(tzinfo=timezone.utc)
+    return time.astimezone(timezone.utc)
+
+
+class PunCooldowns:
+    """An in-memory table of the puns cooldowns.
+
+    Cooldown checks are answered from memory, the last invocation of each pun
+    is written back to the database in batch by `flush`, and restored from
+    it by `load`.
+
+    :param cooldown_minutes: The number of minutes before a pun can be invoked
+    again, default to 60 minutes.
+    :type cooldown_minutes: int
+    """
+
+    def __init__(self, cooldown_minutes: int = 60):
+        self.cooldown_minutes: int = cooldown_minutes
+        self.__last_invoked: Dict[int, datetime] = {}
+        self.__unsaved: Dict[int, datetime] = {}
+
+    @property
+    def cooldown_minutes(self) -> int:
+        """Returns the cooldown of the puns in minutes.
+
+        :return: The cooldown in minutes
+        :rtype: int
+        """
+        return int(self.__cooldown.total_seconds() // 60)
+
+    @cooldown_minutes.setter
+    def cooldown_minutes(self, cooldown_minutes: int):
+        self.__cooldown = timedelta(minutes=cooldown_minutes)
+
+    @property
+    def unsaved_count(self) -> int:
+        """Returns the number of invocations not yet written to the database.
+
+        :return: The number of unsaved invocations
+        :rtype: int
+        """
+        return len(self.__unsaved)
+
+    def load(self):
+        """Loads the cooldown setting and the last invocation of each pun."""
+        if settings := BotSettings.settings():
+            self.cooldown_minutes = settings.puns_cooldown
+
+        self.__last_invoked = {
+            pun.id: _as_utc(pun.last_invoked)
+            for pun in Pun.where(Pun.last_invoked.isnot(None)).all()
+        }
+
+    def can_invoke(self, pun_id: int, time: datetime) -> bool:
+        """Returns true if the pun is not on cooldown at the given time.
+
+        :param pun_id: The id of the pun
+        :type pun_id: int
+        :param time: The time of the invocation
+        :type time: datetime
+
+        :return: True if the pun can be invoked or False
+        :rtype: bool
+        """
+        last_invoked = self.__last_invoked.get(pun_id)
+
+        if last_invoked is None:
+            return True
+        return _as_utc(time) - last_invoked > self.__cooldown
+
+    def invoke(self, pun_id: int, time: datetime):
+        """Records the invocation of a pun at the given time.
+
+        :param pun_id: The id of the pun
+        :type pun_id: int
+        :param time: The time of the invocation
+        :type time: datetime
+        """
+        time = _as_utc(time)
+
+        self.__last_invoked[pun_id] = time
+        self.__unsaved[pun_id] = time
+
+    def forget(self, pun_id: int):
+        """Removes a pun from the table, generally because it was deleted.
+
+        :param pun_id: The id of the pun
+        :type pun_id: int
+        """
+        self.__last_invoked.pop(pun_id, None)
+        self.__unsaved.pop(pun_id, None)
+
+    def flush(self):
+        """Writes the unsaved invocations to the database in a single batch."""
+        if not self.__unsaved:
+            return
+
+        unsaved, self.__unsaved = self.__unsaved, {}
+
+        try:
+            Pun.save_last_invoked(unsaved)
+        except Exception:
+            # Keeps the invocations for the next flush
+            self.__unsaved = unsaved | self.__unsaved
+            raise
@@ -0,0 +1,97 @@
+from typing import Dict, Iterable, List, Tuple
+
+from bot.models.extensions.language.pun import Pun
+from bot.models.extensions.language.pun_word import PunWord
+
+
+class PunIndex:
+    """An in-memory index of the pun words used to match messages.
+
+    The index is loaded once from the database and is then kept in sync by
+    the pun commands, which means matching a message never queries the
+    database.
+    """
+
+    def __init__(self):
+        self.__puns: Dict[int, Pun] = {}
+        self.__pun_words: Dict[str, List[PunWord]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__puns)
+
+    def load(self):
+        """(Re)loads every pun and pun word from the database."""
+        self.__puns.clear()
+        self.__pun_words.clear()
+
+        for pun in Pun.all():
+            self.add_pun(pun)
+
+            for pun_word in pun.pun_words:
+                self.add_pun_word(pun_word)
+
+    def add_pun(self, pun: Pun):
+        """Adds a pun to the index.
+
+        :param pun: The pun to add
+        :type pun: Pun
+        """
+        self.__puns[pun.id] = pun
+
+    def remove_pun(self, pun_id: int):
+        """Removes a pun and all of its words from the index.
+
+        :param pun_id: The id of the pun to remove
+        :type pun_id: int
+        """
+        self.__puns.pop(pun_id, None)
+
+        for word in list(self.__pun_words):
+            self.__remove_pun_word(word, pun_id)
+
+    def add_pun_word(self, pun_word: PunWord):
+        """Adds a pun word to the index.
+
+        :param pun_word: The pun word to add
+        :type pun_word: PunWord
+        """
+        self.__pun_words.setdefault(pun_word.word.lower(), []).append(pun_word)
+
+    def remove_pun_word(self, pun_id: int, word: str):
+        """Removes a word of a pun from the index.
+
+        :param pun_id: The id of the pun the word belongs to
+        :type pun_id: int
+        :param word: The word to remove
+        :type word: str
+        """
+        self.__remove_pun_word(word.lower(), pun_id)
+
+    def __remove_pun_word(self, word: str, pun_id: int):
+        pun_words = [pw for pw in self.__pun_words.get(word, []) if pw.pun_id != pun_id]
+
+        if pun_words:
+            self.__pun_words[word] = pun_words
+        else:
+            self.__pun_words.pop(word, None)
+
+    def match(self, tokens: Iterable[str]) -> Tuple[List[PunWord], List[Pun]]:
+        """Returns the pun words and the puns matching the given tokens.
+
+        :param tokens: The lowercased tokens of a message
+        :type tokens: Iterable[str]
+
+        :return: The matched pun words and their (distinct) puns
+        :rtype: Tuple[List[PunWord], List[Pun]]
+        """
+        pun_words: List[PunWord] = []
+        puns: Dict[int, Pun] = {}
+
+        for token in tokens:
+            for pun_word in self.__pun_words.get(token, ()):
+                pun_words.append(pun_word)
+
+                if pun := self.__puns.get(pun_word.pun_id):
+                    puns[pun.id] = pun
+
+        return pun_words, list(puns.values())
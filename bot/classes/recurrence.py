@@ -1,4 +1,5 @@
 from enum import Enum, unique
+from typing import Optional
 
 
 @unique
@@ -10,3 +11,16 @@ class Recurrence(Enum):
 
     def __str__(self):
         return self.name.capitalize()
+
+    @property
+    def schedule(self) -> Optional[str]:
+        """Returns the crontab expression of the recurrence, at 12:30.
+
+        :return: The crontab expression or None if the recurrence is none.
+        :rtype: Optional[str]
+        """
+        return {
+            Recurrence.DAILY: "30 12 * * *",
+            Recurrence.WEEKLY: "30 12 * * mon",
+            Recurrence.MONTHLY: "30 12 1 * *",
+        }.get(self)
@@ -0,0 +1,90 @@
+import asyncio
+from logging import exception
+from typing import Awaitable, Callable, Dict, List, Set
+
+from bot.models.extensions.reminder import Reminder
+
+# Discord accepts at most 10 embeds per message
+MAX_EMBEDS = 10
+
+
+class ReminderDelivery:
+    """Groups the due reminders per channel so they are sent together.
+
+    The reminders of a channel due within `delay` seconds of each other are
+    sent in as few messages as possible, at most `max_batch` per message.
+    The messages of a channel are sent one after the other, which keeps each
+    channel within its rate limit, while the channels are sent to
+    concurrently.
+
+    :param send: The coroutine sending a batch of reminders to a channel.
+    :type send: Callable[[int, List[Reminder]], Awaitable[None]]
+    :param delay: The number of seconds reminders are grouped for.
+    :type delay: float
+    :param max_batch: The maximum number of reminders per message.
+    :type max_batch: int
+    """
+
+    def __init__(
+        self,
+        send: Callable[[int, List[Reminder]], Awaitable[None]],
+        delay: float = 1.0,
+        max_batch: int = MAX_EMBEDS,
+    ):
+        self.send = send
+        self.delay: float = delay
+        self.max_batch: int = max_batch
+
+        self.__pending: Dict[int, List[Reminder]] = {}
+        self.__senders: Dict[int, asyncio.Task] = {}
+
+    async def deliver(self, reminders: List[Reminder]) -> List[Reminder]:
+        """Queues reminders and waits until they are sent.
+
+        :param reminders: The due reminders.
+        :type reminders: List[Reminder]
+
+        :return: The reminders that were sent, those of a failed batch are not.
+        :rtype: List[Reminder]
+        """
+        senders = []
+
+        for reminder in reminders:
+            self.__pending.setdefault(reminder.channel_id, []).append(reminder)
+
+            if reminder.channel_id not in self.__senders:
+                self.__senders[reminder.channel_id] = asyncio.create_task(
+                    self.__send_channel(reminder.channel_id)
+                )
+            senders.append(self.__senders[reminder.channel_id])
+
+        # Shielded so a cancelled caller does not cancel the other reminders
+        sent = await asyncio.gather(
+            *(asyncio.shield(sender) for sender in set(senders))
+        )
+        sent_ids = set().union(*sent)
+
+        return [reminder for reminder in reminders if id(reminder) in sent_ids]
+
+    async def __send_channel(self, channel_id: int) -> Set[int]:
+        # The reminders are told apart by identity, they may not have an id
+        sent_ids = set()
+
+        try:
+            await asyncio.sleep(self.delay)
+
+            while pending := self.__pending.get(channel_id):
+                batch = pending[: self.max_batch]
+                del pending[: self.max_batch]
+
+                try:
+                    await self.send(channel_id, batch)
+                except Exception:
+                    exception(f"Unable to send reminders to channel {channel_id}")
+                else:
+                    sent_ids.update(id(reminder) for reminder in batch)
+
+            return sent_ids
+        finally:
+            self.__pending.pop(channel_id, None)
+            self.__senders.pop(channel_id, None)
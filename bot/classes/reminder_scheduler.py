@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta, timezone
+from logging import error
+from typing import Awaitable, Callable, Hashable, List, Optional
+
+from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from bot.models.extensions.reminder import Reminder
+from lib.heap_scheduler import HeapScheduler
+
+# The key of the job loading the next window of reminders
+WINDOW_JOB = "reminders_window"
+
+
+class ReminderScheduler:
+    """Sends the reminders stored in the database when they are due.
+
+    Only the reminders of the next window (ex. the next 10 minutes) are kept
+    in memory, in the heap of a single `HeapScheduler`, which also loads the
+    following window before the current one ends. The memory doesn't grow
+    with the number of pending reminders, and restarting only reads the
+    reminders of the first window, the overdue ones being sent right away.
+
+    Only the reminders that were sent are deleted, the others stay stored
+    and are sent again with the overdue reminders on the next start.
+
+    :param deliver: The coroutine sending due reminders, returning those
+    that were sent.
+    :type deliver: Callable[[List[Reminder]], Awaitable[List[Reminder]]]
+    :param window: The duration of a window of reminders, default to 10
+    minutes.
+    :type window: timedelta
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[List[Reminder]], Awaitable[List[Reminder]]],
+        window: timedelta = timedelta(minutes=10),
+    ):
+        self.deliver = deliver
+        self.window: timedelta = window
+
+        self.__scheduler = HeapScheduler(self.__fire)
+        self.__window_end: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        """Returns the number of reminders in memory (the current window)."""
+        window_jobs = self.__scheduler.next_fire_time(WINDOW_JOB) is not None
+        return len(self.__scheduler) - window_jobs
+
+    def start(self, now: Optional[datetime] = None):
+        """Loads the first window, including the overdue reminders, and
+        starts sending the reminders."""
+        now = now or datetime.now(timezone.utc)
+
+        self.load_window(now)
+        self.__scheduler.schedule(
+            WINDOW_JOB, IntervalTrigger(seconds=self.window.total_seconds()), now
+        )
+        self.__scheduler.start()
+
+    def stop(self):
+        """Stops sending the reminders."""
+        self.__scheduler.stop()
+
+    def load_window(self, now: Optional[datetime] = None):
+        """Schedules the reminders due before the end of the next window.
+
+        The window ends two windows from now so the reminders are loaded
+        before they are due, even if the dispatcher is late.
+
+        :param now: The current time, default to now.
+        :type now: Optional[datetime]
+        """
+        now = now or datetime.now(timezone.utc)
+        window_end = now + 2 * self.window
+
+        for reminder_id, remind_at in Reminder.due_before(
+            window_end, self.__window_end
+        ):
+            self.__scheduler.schedule(reminder_id, DateTrigger(remind_at), now)
+
+        self.__window_end = window_end
+
+    def add(self, reminder: Reminder):
+        """Schedules a new reminder if it is due in the loaded window, the
+        later reminders are loaded with their window.
+
+        :param reminder: The created reminder.
+        :type reminder: Reminder
+        """
+        if self.__window_end and reminder.remind_at_utc < self.__window_end:
+            self.__scheduler.schedule(reminder.id, DateTrigger(reminder.remind_at_utc))
+
+    def remove(self, reminder: Reminder):
+        """Unschedules a cancelled reminder.
+
+        :param reminder: The cancelled reminder.
+        :type reminder: Reminder
+        """
+        self.__scheduler.unschedule(reminder.id)
+
+    async def __fire(self, keys: List[Hashable]):
+        if WINDOW_JOB in keys:
+            self.load_window()
+
+        reminder_ids = [key for key in keys if key != WINDOW_JOB]
+
+        if not reminder_ids:
+            return
+
+        # Cancelled reminders are not found
+        reminders = Reminder.where(Reminder.id.in_(reminder_ids)).all()
+
+        sent_ids = {reminder.id for reminder in await self.deliver(reminders)}
+        Reminder.delete_all(sent_ids)
+
+        # The unsent reminders stay stored, they are overdue on the next start
+        unsent_ids = [
+            reminder.id for reminder in reminders if reminder.id not in sent_ids
+        ]
+        if unsent_ids:
+            error(f"Unable to send the reminders {unsent_ids}")
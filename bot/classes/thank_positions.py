@@ -0,0 +1,63 @@
+from typing import Dict, Mapping, Optional
+
+from bot.models.extensions.thank import Thank
+from lib.fenwick_tree import FenwickTree
+
+
+class ThankPositions:
+    """An in-memory index of the position of each thanked member.
+
+    The number of members with each thank count is kept in a Fenwick tree,
+    the position of a member is one more than the number of members with a
+    higher count, found in O(log n) without sorting the thanks.
+
+    The index is loaded once from the database and is then kept in sync with
+    the counts returned by `Thank.increment`.
+    """
+
+    def __init__(self):
+        self.__counts: Dict[int, int] = {}
+        self.__tree: FenwickTree = FenwickTree()
+
+    def __len__(self) -> int:
+        return self.__tree.total
+
+    def load(self):
+        """(Re)loads the thank count of every member from the database."""
+        self.__counts = {
+            thank.member_id: thank.count for thank in Thank.all() if thank.count
+        }
+        self.__tree = FenwickTree.from_indexes(self.__counts.values())
+
+    def update(self, counts: Mapping[int, int]):
+        """Updates the thank count of members.
+
+        :param counts: The new thank count of each member.
+        :type counts: Mapping[int, int]
+        """
+        for member_id, count in counts.items():
+            if previous_count := self.__counts.get(member_id):
+                self.__tree.add(previous_count, -1)
+
+            if count:
+                self.__counts[member_id] = count
+                self.__tree.add(count)
+            else:
+                self.__counts.pop(member_id, None)
+
+    def get(self, member_id: int) -> Optional[int]:
+        """Returns the position of a member, members with the same thank count
+        share the same position.
+
+        :param member_id: The id of the member
+        :type member_id: int
+
+        :return: The position of the member, from 1, or None if the member was
+        never thanked.
+        :rtype: Optional[int]
+        """
+        count = self.__counts.get(member_id)
+
+        if not count:
+            return None
+        return self.__tree.total - self.__tree.prefix_sum(count) + 1
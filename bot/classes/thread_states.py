@@ -0,0 +1,99 @@
+import asyncio
+from typing import Dict, Iterable, Optional
+
+from discord import HTTPException
+from discord import Thread as DiscordThread
+
+
+class ThreadStates:
+    """Tells if Discord threads are still open (neither archived nor locked)
+    without fetching each of them from the API.
+
+    The state of a thread is read from the gateway cache of the bot, and
+    kept here when it is received from a thread update event, which includes
+    the archived threads that discord.py drops from its cache. The unknown
+    threads are fetched from the API concurrently, at most `max_concurrency`
+    at once.
+
+    :param bot: The bot used to fetch the threads.
+    :type bot: Grace
+    :param max_concurrency: The maximum number of concurrent fetches.
+    :type max_concurrency: int
+    """
+
+    def __init__(self, bot, max_concurrency: int = 5):
+        self.bot = bot
+        self.__states: Dict[int, bool] = {}
+        self.__semaphore = asyncio.Semaphore(max_concurrency)
+
+    def set(self, thread: DiscordThread):
+        """Keeps the state of a thread.
+
+        :param thread: The thread, as received from the gateway or the API.
+        :type thread: discord.Thread
+        """
+        self.__keep(thread.id, thread)
+
+    def remove(self, thread_id: int):
+        """Forgets the state of a thread (ex. when it is deleted).
+
+        :param thread_id: The id of the thread.
+        :type thread_id: int
+        """
+        self.__states.pop(thread_id, None)
+
+    def get_cached(self, thread_id: int) -> Optional[bool]:
+        """Returns the state of a thread without calling the API.
+
+        :param thread_id: The id of the thread.
+        :type thread_id: int
+
+        :return: True if the thread is open, False if it is archived or
+        locked and None if its state is unknown.
+        :rtype: Optional[bool]
+        """
+        if (state := self.__states.get(thread_id)) is not None:
+            return state
+
+        if isinstance(thread := self.bot.get_channel(thread_id), DiscordThread):
+            return self.__keep(thread_id, thread)
+
+        return None
+
+    async def resolve(self, thread_ids: Iterable[int]) -> Dict[int, bool]:
+        """Returns the state of each thread, fetching the unknown ones
+        concurrently.
+
+        Threads that can't be fetched (ex. deleted threads) are considered
+        closed.
+
+        :param thread_ids: The ids of the threads.
+        :type thread_ids: Iterable[int]
+
+        :return: True for each open thread, False for the others.
+        :rtype: Dict[int, bool]
+        """
+        states = {thread_id: self.get_cached(thread_id) for thread_id in thread_ids}
+        missing = [thread_id for thread_id, state in states.items() if state is None]
+
+        fetched = await asyncio.gather(
+            *(self.__fetch(thread_id) for thread_id in missing)
+        )
+        states.update(zip(missing, fetched))
+
+        return states
+
+    async def __fetch(self, thread_id: int) -> bool:
+        async with self.__semaphore:
+            try:
+                thread = await self.bot.fetch_channel(thread_id)
+            except HTTPException:
+                return False
+
+        return self.__keep(thread_id, thread)
+
+    def __keep(self, thread_id: int, thread: DiscordThread) -> bool:
+        state = not (thread.archived or thread.locked)
+        self.__states[thread_id] = state
+
+        return state
@@ -0,0 +1,120 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from bot.models.extensions.language.trigger import Trigger
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledTrigger:
+    """A trigger compiled for matching.
+
+    :param name: The name of the trigger
+    :type name: str
+    :param positive_emoji: The emoji used to react to positive messages
+    :type positive_emoji: str
+    :param negative_emoji: The emoji used to react to negative messages
+    :type negative_emoji: str
+    :param exclusions: The excluded phrases indexed by their first token
+    :type exclusions: Dict[str, Tuple[Tuple[str, ...], ...]]
+    """
+
+    name: str
+    positive_emoji: str
+    negative_emoji: str
+    exclusions: Dict[str, Tuple[Tuple[str, ...], ...]]
+
+    @classmethod
+    def compile(cls, trigger: Trigger) -> "CompiledTrigger":
+        exclusions: Dict[str, List[Tuple[str, ...]]] = {}
+
+        for phrase in trigger.exclusions:
+            if tokens := tuple(phrase.lower().split()):
+                exclusions.setdefault(tokens[0], []).append(tokens)
+
+        return cls(
+            name=trigger.name,
+            positive_emoji=trigger.positive_emoji,
+            negative_emoji=trigger.negative_emoji,
+            exclusions={token: tuple(phrases) for token, phrases in exclusions.items()},
+        )
+
+    def is_excluded_at(self, tokens: Sequence[str], index: int) -> bool:
+        """Returns true if the trigger word at the given index is followed by
+        an excluded phrase.
+
+        :param tokens: The lowercased tokens of a message
+        :type tokens: Sequence[str]
+        :param index: The index of the trigger word in the tokens
+        :type index: int
+
+        :return: True if the trigger word is excluded or False
+        :rtype: bool
+        """
+        start = index + 1
+
+        if start >= len(tokens):
+            return False
+
+        return any(
+            tuple(tokens[start : start + len(phrase)]) == phrase
+            for phrase in self.exclusions.get(tokens[start], ())
+        )
+
+
+class TriggerMatcher:
+    """Matches the words of every trigger in a single pass over a message.
+
+    The triggers are loaded and compiled once and need to be reloaded with
+    `load` after a trigger, a trigger word or an exclusion is changed.
+    """
+
+    def __init__(self):
+        self.__triggers: Dict[str, CompiledTrigger] = {}
+        self.__triggers_by_word: Dict[str, List[CompiledTrigger]] = {}
+
+    def load(self):
+        """(Re)loads and compiles every trigger from the database."""
+        triggers: Dict[str, CompiledTrigger] = {}
+        triggers_by_word: Dict[str, List[CompiledTrigger]] = {}
+
+        for trigger in Trigger.all():
+            compiled_trigger = CompiledTrigger.compile(trigger)
+            triggers[trigger.name] = compiled_trigger
+
+            for word in trigger.words:
+                triggers_by_word.setdefault(word.lower(), []).append(compiled_trigger)
+
+        self.__triggers = triggers
+        self.__triggers_by_word = triggers_by_word
+
+    def get(self, name: str) -> Optional[CompiledTrigger]:
+        """Returns the compiled trigger with the given name.
+
+        :param name: The name of the trigger
+        :type name: str
+
+        :return: The compiled trigger or None
+        :rtype: Optional[CompiledTrigger]
+        """
+        return self.__triggers.get(name)
+
+    def match(self, tokens: Sequence[str]) -> List[CompiledTrigger]:
+        """Returns the triggers with a word in the given tokens that is not
+        followed by one of their excluded phrases.
+
+        :param tokens: The lowercased tokens of a message
+        :type tokens: Sequence[str]
+
+        :return: The matched triggers
+        :rtype: List[CompiledTrigger]
+        """
+        matched: Dict[str, CompiledTrigger] = {}
+
+        for index, token in enumerate(tokens):
+            for trigger in self.__triggers_by_word.get(token, ()):
+                if trigger.name in matched or trigger.is_excluded_at(tokens, index):
+                    continue
+
+                matched[trigger.name] = trigger
+
+        return list(matched.values())
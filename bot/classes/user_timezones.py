@@ -0,0 +1,59 @@
+import sys
+from typing import Dict, Optional
+
+from bot.models.extensions.user_timezone import UserTimezone
+
+
+class UserTimezones:
+    """An in-memory map of the timezone of each member.
+
+    The map is loaded once from the database and is then kept in sync by the
+    timezone commands, which means looking up the timezone of the author of a
+    message never queries the database.
+
+    There are only a few hundred zone names, they are interned so each one is
+    stored once no matter how many members use it, an entry costs about the
+    size of its key.
+    """
+
+    def __init__(self):
+        self.__timezones: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.__timezones)
+
+    def load(self):
+        """(Re)loads the timezone of every member from the database."""
+        self.__timezones = {
+            user_timezone.member_id: sys.intern(user_timezone.timezone)
+            for user_timezone in UserTimezone.all()
+        }
+
+    def get(self, member_id: int) -> Optional[str]:
+        """Returns the timezone of a member.
+
+        :param member_id: The id of the member
+        :type member_id: int
+
+        :return: The IANA name of the timezone or None
+        :rtype: Optional[str]
+        """
+        return self.__timezones.get(member_id)
+
+    def set(self, member_id: int, timezone: str):
+        """Sets the timezone of a member.
+
+        :param member_id: The id of the member
+        :type member_id: int
+        :param timezone: The IANA name of the timezone
+        :type timezone: str
+        """
+        self.__timezones[member_id] = sys.intern(timezone)
+
+    def remove(self, member_id: int):
+        """Removes the timezone of a member.
+
+        :param member_id: The id of the member
+        :type member_id: int
+        """
+        self.__timezones.pop(member_id, None)
@@ -1,10 +1,10 @@
-from json import loads
+import asyncio
 from random import choice as random_choice
 
+from aiohttp import ClientError
 from discord import Embed
 from discord.ext.commands import Cog, Context, cooldown, hybrid_group
 from discord.ext.commands.cooldowns import BucketType
-from requests import get
 
 from bot.extensions.command_error_handler import send_command_help
 from bot.models.extensions.fun.answer import Answer
@@ -80,12 +80,16 @@ class FunCog(Cog, name="Fun", description="Collection of fun commands"):
         :param ctx: The context in which the command was called.
         :type ctx: Context
         """
-        response = get(
-            "https://api.forismatic.com/api/1.0/?method=getQuote&format=json&lang=en"
-        )
+        try:
+            response = await self.bot.http_service.get(
+                "https://api.forismatic.com/api/1.0/",
+                params={"method": "getQuote", "format": "json", "lang": "en"},
+            )
+        except (ClientError, asyncio.TimeoutError):
+            response = None
 
-        if response.ok:
-            quote = "{quoteText} \n-- {quoteAuthor}".format(**loads(response.text))
+        if response and response.ok:
+            quote = "{quoteText} \n-- {quoteAuthor}".format(**response.json())
 
             embed = Embed(
                 color=self.bot.default_color,
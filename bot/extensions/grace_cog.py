@@ -1,3 +1,5 @@
+import asyncio
+
 from discord import Embed, Interaction
 from discord.app_commands import Choice, autocomplete
 from discord.ext.commands import Cog, Context, hybrid_command, has_permissions
@@ -5,11 +7,7 @@ from discord.ui import Button
 from emoji import emojize
 
 from bot.helpers import send_error
-from bot.helpers.github_helper import (
-    available_project_names,
-    create_contributors_embeds,
-    create_repository_button,
-)
+from bot.helpers.github_helper import available_project_names, fetch_contributors
 from bot.services.github_service import GithubService
 from lib.config_required import command_config_required
 from lib.paged_embeds import PagedEmbedView
@@ -27,7 +25,7 @@ async def project_autocomplete(_: Interaction, current: str) -> list[Choice[str]
     """
     return [
         Choice(name=project, value=project)
-        for project in available_project_names()
+        for project in await asyncio.to_thread(available_project_names)
         if current.lower() in project.lower()
     ]
 
@@ -90,10 +88,12 @@ class GraceCog(Cog, name="Grace", description="Default grace commands"):
         view.add_item(self.__CODE_SOCIETY_WEBSITE_BUTTON)
 
         if GithubService.can_connect():
-            repository = GithubService().get_code_society_lab_repo("grace")
-            view.add_item(create_repository_button(repository))
+            embeds, repository_button = await asyncio.to_thread(
+                fetch_contributors, "grace"
+            )
+            view.add_item(repository_button)
 
-            for embed in create_contributors_embeds(repository):
+            for embed in embeds:
                 view.add_embed(embed)
 
         await view.send(ctx, ephemeral=ephemeral)
@@ -145,16 +145,15 @@ class GraceCog(Cog, name="Grace", description="Default grace commands"):
         """
         await ctx.defer()
 
-        if project not in available_project_names():
+        if project not in await asyncio.to_thread(available_project_names):
             await send_error(ctx, f"Project '_{project}_' not found.")
             return
 
-        repository = GithubService().get_code_society_lab_repo(project)
-        embeds = create_contributors_embeds(repository)
+        embeds, repository_button = await asyncio.to_thread(fetch_contributors, project)
         view = PagedEmbedView(embeds)
 
         view.add_item(self.__CODE_SOCIETY_WEBSITE_BUTTON)
-        view.add_item(create_repository_button(repository))
+        view.add_item(repository_button)
 
         await view.send(ctx)
 
@@ -1,10 +1,17 @@
 from logging import warning
+from typing import Optional
 
 from discord import Embed, Message
-from discord.ext.commands import Cog, Context, has_permissions, hybrid_group
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
-from nltk.tokenize import TweetTokenizer
-
+from discord.ext.commands import (
+    Cog,
+    Context,
+    has_permissions,
+    hybrid_command,
+    hybrid_group,
+)
+
+from bot.classes.message_analysis import MessageAnalysis
+from bot.classes.trigger_matcher import TriggerMatcher
 from bot.models.extensions.language.trigger import Trigger
 
 
@@ -18,16 +25,21 @@ class LanguageCog(Cog, name="Language", description="Analyze and reacts to messa
         usually it's words, but words like "it's" or "ain't" will be split
         into "it is" and "are not".
 
-        We're using the casual tokenizer for now,
-        but it can be changed down the line so long as you're aware
+        Messages are tokenized once by `MessageAnalysis` with the casual
+        tokenizer, it can be changed down the line so long as you're aware
         of any new behaviors. https://www.nltk.org/api/nltk.tokenize.html
+
+        The sentiment of a message is computed by the NLP service of the bot,
+        in a pool of worker processes, to not block the event loop.
         """
         self.bot = bot
 
-        self.tokenizer = TweetTokenizer()
-        self.sid = SentimentIntensityAnalyzer()
+        self.trigger_matcher = TriggerMatcher()
 
-    def get_message_sentiment_polarity(self, message: Message) -> int:
+    def cog_load(self):
+        self.trigger_matcher.load()
+
+    async def get_message_sentiment_polarity(self, message: Message) -> int:
         """
         Checks sentiment of a given message
         :param message: A discord message to anlyze the sentiment of
@@ -39,98 +51,102 @@ class LanguageCog(Cog, name="Language", description="Analyze and reacts to messa
         """
         # Here we're using the VADER algorithm
         # The purpose is to determine if the message sentiment is speaking
-        # negatively about something. We run the while message through vader
-        # and if the aggregated score is ultimately negative, neutral, or positive
-        sv = self.sid.polarity_scores(message.content)
-        if sv["neu"] + sv["pos"] < sv["neg"] or sv["pos"] == 0.0:
-            if sv["neg"] > sv["pos"]:
-                return -1
-            return 0
-        return 1
-
-    async def name_react(self, message: Message) -> None:
+        # negatively about something. The whole message is run through vader
+        # by the NLP workers, at most once per message.
+        result = await self.bot.nlp_service.analyze_message(message)
+        return result.polarity
+
+    async def name_react(self, analysis: MessageAnalysis) -> None:
         """
         Checks message sentiment and if the sentiment is neutral or positive,
         react with a positive_emoji, otherwise react with negative_emoji
         """
-        grace_trigger = Trigger.find_by(name="Grace")
+        message = analysis.message
+
+        if not self.bot.user.mentioned_in(message) or message.content.startswith("<@!"):
+            return
+
+        grace_trigger = self.trigger_matcher.get("Grace")
         if grace_trigger is None:
             warning('Missing trigger entry for "Grace"')
             return
 
-        if self.bot.user.mentioned_in(message) and not message.content.startswith(
-            "<@!"
-        ):
-            # Note: the trigger needs to have a None-condition now that it's generic
-            if self.get_message_sentiment_polarity(message) >= 0:
-                await message.add_reaction(grace_trigger.positive_emoji)
-                return
-            await message.add_reaction(grace_trigger.negative_emoji)
-
-    async def penguin_react(self, message: Message) -> None:
-        """Checks to see if a message contains a reference to Linus (torvalds only),
-        will be made more complicated as needed.
-        If a linus reference is positively identified, Grace will react
-        with a penguin emoji.
-        I know using NLTK is kinda like bringing a tomahawk missile to a knife fight,
-        but it may come in handy for
-        future tasks, so the tokenizer object will be shared across all methods.
-
-        :param message: A discord message to check for references
-        to our lord and savior.
-        :type message: discord.Message
+        if await self.get_message_sentiment_polarity(message) >= 0:
+            await message.add_reaction(grace_trigger.positive_emoji)
+            return
+        await message.add_reaction(grace_trigger.negative_emoji)
+
+    async def trigger_react(self, analysis: MessageAnalysis) -> None:
+        """Checks to see if a message contains the words of any trigger
+        (ex. references to Linus, torvalds only).
+
+        A trigger word followed by one of the trigger's excluded phrases
+        (ex. "Linus tech tips") is ignored. If a trigger is positively
+        identified, Grace will react with the trigger's positive emoji when the
+        message is positive, or with its negative emoji when it's negative.
+
+        :param analysis: The analysis of a message to check for triggers.
+        :type analysis: MessageAnalysis
         """
-        linus_trigger = Trigger.find_by(name="Linus")
-        if linus_trigger is None:
-            warning('Missing trigger entry for "Linus"')
+        triggers = self.trigger_matcher.match(analysis.tokens)
+        if not triggers:
+            return
+
+        determined_sentiment_polarity = await self.get_message_sentiment_polarity(
+            analysis.message
+        )
+        if determined_sentiment_polarity == 0:
             return
 
-        message_tokens = self.tokenizer.tokenize(message.content)
-        tokenlist = list(map(lambda s: s.lower(), message_tokens))
-        linustarget = [i for i, x in enumerate(tokenlist) if x in linus_trigger.words]
-        # Get the indices of all linuses in the message
-
-        if linustarget:
-            fail = False
-            for linusindex in linustarget:
-                try:
-                    if (
-                        tokenlist[linusindex + 1] == "tech"
-                        and tokenlist[linusindex + 2] == "tips"
-                    ):
-                        fail = True
-                    elif (
-                        tokenlist[linusindex + 1] == "and"
-                        and tokenlist[linusindex + 2] == "lucy"
-                    ):
-                        fail = True
-                except IndexError:
-                    pass
-
-                determined_sentiment_polarity = self.get_message_sentiment_polarity(
-                    message
-                )
-
-                if not fail and determined_sentiment_polarity < 0:
-                    await message.add_reaction(linus_trigger.negative_emoji)
-                    return
-
-                fail = determined_sentiment_polarity < 1
-
-            if not fail:
-                await message.add_reaction(linus_trigger.positive_emoji)
+        for trigger in triggers:
+            if determined_sentiment_polarity > 0:
+                await analysis.message.add_reaction(trigger.positive_emoji)
+            else:
+                await analysis.message.add_reaction(trigger.negative_emoji)
 
     @Cog.listener()
-    async def on_message(self, message: Message) -> None:
-        """A listener function that calls the `penguin_react`, `name_react`,
-        and `pun_react` functions when a message
-        is received.
+    async def on_message_analysis(self, analysis: MessageAnalysis) -> None:
+        """A listener function that calls the `trigger_react` and `name_react`
+        functions when a message is received.
+
+         :param analysis: The analysis of the message that was received.
+         :type analysis: MessageAnalysis
+        """
+        await self.trigger_react(analysis)
+        await self.name_react(analysis)
+
+    @hybrid_command(name="nlp", help="Shows the state of the NLP workers")
+    @has_permissions(administrator=True)
+    async def nlp_status(self, ctx: Context) -> None:
+        """Shows the number of messages waiting to be analyzed by the NLP
+        workers.
+
+        :param ctx: The context in which the command was called.
+        :type ctx: discord.ext.commands.Context
+        """
+        nlp_service = self.bot.nlp_service
+        embed = Embed(color=self.bot.default_color, title="NLP workers")
+
+        embed.add_field(name="Workers", value=nlp_service.workers or "Auto")
+        embed.add_field(name="Queue depth", value=nlp_service.queue_depth)
+        embed.add_field(name="Cached results", value=nlp_service.cached_count)
+
+        await ctx.send(embed=embed)
 
-         :param message: The message that was received.
-         :type message: discord.Message
+    async def find_trigger(self, ctx: Context, name: str) -> Optional[Trigger]:
+        """Returns the trigger with the given name or tells the user that it
+        does not exist.
+
+        :param ctx: The context in which the command was called.
+        :type ctx: discord.ext.commands.Context
+        :param name: The name of the trigger.
+        :type name: str
         """
-        await self.penguin_react(message)
-        await self.name_react(message)
+        trigger = Trigger.find_by(name=name)
+
+        if trigger is None:
+            await ctx.send(f"Trigger **{name}** does not exist")
+        return trigger
 
     @hybrid_group(name="triggers", help="Commands to manage triggers")
     @has_permissions(administrator=True)
@@ -141,64 +157,118 @@ class LanguageCog(Cog, name="Language", description="Analyze and reacts to messa
         :type ctx: discord.ext.commands.Context
         """
         if ctx.invoked_subcommand is None:
-            trigger = Trigger.find_by(name="Linus")
-            if trigger is None:
-                warning('Missing trigger entry for "Linus"')
-                return
+            embed = Embed(color=self.bot.default_color, title="Triggers")
+
+            for trigger in Trigger.all():
+                description = "\n".join(trigger.words) or "No words"
 
-            embed = Embed(
-                color=self.bot.default_color,
-                title="Triggers",
-                description="\n".join(trigger.words),
-            )
+                if exclusions := list(trigger.exclusions):
+                    description += "\n\n**Except when followed by**\n"
+                    description += "\n".join(exclusions)
+
+                embed.add_field(name=trigger.name, value=description, inline=False)
 
             await ctx.send(embed=embed)
 
-    @triggers_group.command(name="add", help="Add a trigger word", usage="{new_word}")
+    @triggers_group.command(
+        name="add", help="Add a trigger word", usage="{new_word} {trigger_name}"
+    )
     @has_permissions(administrator=True)
-    async def add_trigger_word(self, ctx: Context, new_word: str) -> None:
+    async def add_trigger_word(
+        self, ctx: Context, new_word: str, trigger_name: str = "Linus"
+    ) -> None:
         """Add a new trigger word.
 
         :param ctx: The context in which the command was called.
         :type ctx: discord.ext.commands.Context
         :param new_word: The new trigger word to be added.
         :type new_word: str
+        :param trigger_name: The name of the trigger, default to Linus.
+        :type trigger_name: str
         """
-        trigger = Trigger.find_by(name="Linus")
-
-        if trigger:
+        if trigger := await self.find_trigger(ctx, trigger_name):
             if new_word in trigger.words:
                 await ctx.send(f"**{new_word}** is already a trigger")
             else:
                 trigger.add_trigger_word(new_word)
+                self.trigger_matcher.load()
 
                 await ctx.send(f"Trigger **{new_word}** added successfully")
-        else:
-            await ctx.send(f"Unable to add **{new_word}**")
 
     @triggers_group.command(
-        name="remove", help="Remove a trigger word", usage="{old_word}"
+        name="remove", help="Remove a trigger word", usage="{old_word} {trigger_name}"
     )
     @has_permissions(administrator=True)
-    async def remove_trigger_word(self, ctx: Context, old_word: str) -> None:
+    async def remove_trigger_word(
+        self, ctx: Context, old_word: str, trigger_name: str = "Linus"
+    ) -> None:
         """Remove an existing trigger word.
 
         :param ctx: The context in which the command was called.
         :type ctx: discord.ext.commands.Context
         :param old_word: The trigger word to be removed.
         :type old_word: str
+        :param trigger_name: The name of the trigger, default to Linus.
+        :type trigger_name: str
         """
-        trigger = Trigger.find_by(name="Linus")
-
-        if trigger:
+        if trigger := await self.find_trigger(ctx, trigger_name):
             if old_word not in trigger.words:
                 await ctx.send(f"**{old_word}** is not a trigger")
             else:
                 trigger.remove_trigger_word(old_word)
+                self.trigger_matcher.load()
 
                 await ctx.send(f"Trigger **{old_word}** removed successfully")
-        else:
-            await ctx.send(f"Unable to remove **{old_word}**")
+
+    @triggers_group.command(
+        name="add-exclusion",
+        help="Ignore a trigger word when followed by a phrase",
+        usage="{trigger_name} {phrase}",
+    )
+    @has_permissions(administrator=True)
+    async def add_exclusion(self, ctx: Context, trigger_name: str, *, phrase: str):
+        """Add a phrase that prevents a trigger when it follows a trigger word.
+
+        :param ctx: The context in which the command was called.
+        :type ctx: discord.ext.commands.Context
+        :param trigger_name: The name of the trigger.
+        :type trigger_name: str
+        :param phrase: The excluded phrase (ex. "tech tips").
+        :type phrase: str
+        """
+        if trigger := await self.find_trigger(ctx, trigger_name):
+            if phrase.lower() in trigger.exclusions:
+                await ctx.send(f"**{phrase}** is already excluded")
+            else:
+                trigger.add_exclusion(phrase.lower())
+                self.trigger_matcher.load()
+
+                await ctx.send(f"Exclusion **{phrase}** added successfully")
+
+    @triggers_group.command(
+        name="remove-exclusion",
+        help="Remove an excluded phrase from a trigger",
+        usage="{trigger_name} {phrase}",
+    )
+    @has_permissions(administrator=True)
+    async def remove_exclusion(self, ctx: Context, trigger_name: str, *, phrase: str):
+        """Remove a phrase that prevents a trigger.
+
+        :param ctx: The context in which the command was called.
+        :type ctx: discord.ext.commands.Context
+        :param trigger_name: The name of the trigger.
+        :type trigger_name: str
+        :param phrase: The excluded phrase to be removed.
+        :type phrase: str
+        """
+        if trigger := await self.find_trigger(ctx, trigger_name):
+            if phrase.lower() not in trigger.exclusions:
+                await ctx.send(f"**{phrase}** is not excluded")
+            else:
+                trigger.remove_exclusion(phrase.lower())
+                self.trigger_matcher.load()
+
+                await ctx.send(f"Exclusion **{phrase}** removed successfully")
 
 
 async def setup(bot):
@@ -1,20 +1,41 @@
+import asyncio
 import re
-from typing import Optional
+from typing import Dict, Optional
 
 from discord import Embed, Message
 from discord.ext.commands import Cog, Context, command
 
+from bot.classes.message_analysis import MessageAnalysis
 from bot.extensions.command_error_handler import send_command_help
-from bot.services.mermaid_service import generate_mermaid_diagram
+from bot.services.mermaid_service import MERMAID_API, MermaidService
+
+# Every message with a mermaid block contains its fence, which is much cheaper
+# to look for than parsing the message.
+MERMAID_FENCE = "```mermaid\n"
+
+MERMAID_CODEBLOCK_PATTERN = re.compile(r"```mermaid\n(.*?)```", re.DOTALL)
+CODEBLOCK_PATTERN = re.compile(r"```(?:\w+)?\n(.*?)```", re.DOTALL)
 
 
 class MermaidCog(Cog, name="Mermaid", description="Generates mermaid diagrams"):
-    def __init__(self, bot):
+    def __init__(self, bot, edit_delay: float = 2):
         self.bot = bot
-        self.mermaid_codeblock_pattern = r"```mermaid\n(.*?)```"
-        self.codeblock_pattern = r"```(?:\w+)?\n(.*?)```"
-
-    def generate_diagram_embed(self, diagram: str) -> Embed:
+        self.mermaid_codeblock_pattern = MERMAID_CODEBLOCK_PATTERN
+        self.codeblock_pattern = CODEBLOCK_PATTERN
+        self.mermaid_service = MermaidService(
+            bot.http_service, bot.app.config.get("mermaid", "url", MERMAID_API)
+        )
+
+        # The diagrams of edited messages are regenerated once the message
+        # was not edited for `edit_delay` seconds.
+        self.edit_delay: float = edit_delay
+        self.pending_edits: Dict[int, asyncio.Task] = {}
+
+    async def cog_unload(self):
+        for task in self.pending_edits.values():
+            task.cancel()
+
+    async def generate_diagram_embed(self, diagram: str) -> Embed:
         """
         Generate a Discord embed containing a Mermaid diagram image or error
         message.
@@ -26,7 +47,7 @@ class MermaidCog(Cog, name="Mermaid", description="Generates mermaid diagrams"):
         :rtype: Embed
         """
         embed = Embed()
-        diagram_url = generate_mermaid_diagram(diagram)
+        diagram_url = await self.mermaid_service.generate(diagram)
 
         if diagram_url:
             embed.title = "Diagram"
@@ -69,11 +90,12 @@ class MermaidCog(Cog, name="Mermaid", description="Generates mermaid diagrams"):
         :rtype: str
         """
         if require_mermaid_tag:
-            if codeblock_match := re.search(
-                self.mermaid_codeblock_pattern, content, re.DOTALL
-            ):
+            if MERMAID_FENCE not in content:
+                return ""
+
+            if codeblock_match := self.mermaid_codeblock_pattern.search(content):
                 return codeblock_match.group(1).strip()
-        elif codeblock_match := re.search(self.codeblock_pattern, content, re.DOTALL):
+        elif codeblock_match := self.codeblock_pattern.search(content):
             return codeblock_match.group(1).strip()
 
         return ""
@@ -105,31 +127,35 @@ class MermaidCog(Cog, name="Mermaid", description="Generates mermaid diagrams"):
         if not diagram:
             return await send_command_help(ctx)
 
-        await ctx.reply(embed=self.generate_diagram_embed(diagram))
+        await ctx.reply(embed=await self.generate_diagram_embed(diagram))
 
     @Cog.listener()
-    async def on_message(self, message: Message):
+    async def on_message_analysis(self, analysis: MessageAnalysis):
         """
         If mermaid code block is found in the message, the diagram image will
         be generated automatically.
 
-        :param message: User message
-        :type message: Message
+        :param analysis: The analysis of the user message
+        :type analysis: MessageAnalysis
         """
-        if message.author.id == self.bot.user.id:
+        message = analysis.message
+
+        # Most messages have no mermaid block, they are skipped before being
+        # analyzed or parsed as a command
+        if MERMAID_FENCE not in analysis.content or message.reference:
             return
 
-        ctx = await self.bot.get_context(message)
+        codeblock = analysis.code_block("mermaid")
+        if not codeblock or not (diagram := codeblock.code.strip()):
+            return
 
-        # Making sure there're no messages referenced, and no mermaid command
-        # being executed so that it doesn't overlap with the function that
-        # executes the command
-        if message.reference or ctx.command:
+        # Making sure there's no mermaid command being executed so that it
+        # doesn't overlap with the function that executes the command
+        ctx = await self.bot.get_context(message)
+        if ctx.command:
             return
 
-        diagram = self.extract_code_block(message.content, require_mermaid_tag=True)
-        if diagram:
-            await ctx.reply(embed=self.generate_diagram_embed(diagram))
+        await ctx.reply(embed=await self.generate_diagram_embed(diagram))
 
     @Cog.listener()
     async def on_message_edit(self, before: Message, after: Message):
@@ -137,15 +163,45 @@ class MermaidCog(Cog, name="Mermaid", description="Generates mermaid diagrams"):
         If the message being modified contains mermaid code block, the diagram
         image will be regenerated automatically.
 
+        The diagram is only regenerated when the code block changed, once the
+        message was not edited for a moment.
+
         :param before: Old message
         :type before: Message
         :param after: Edited message
         :type after: Message
         """
         diagram = self.extract_code_block(after.content, require_mermaid_tag=True)
-        if diagram:
-            ctx = await self.bot.get_context(after)
-            await ctx.reply(embed=self.generate_diagram_embed(diagram))
+        previous_diagram = self.extract_code_block(
+            before.content, require_mermaid_tag=True
+        )
+
+        if not diagram or diagram == previous_diagram:
+            return
+
+        if pending_edit := self.pending_edits.get(after.id):
+            pending_edit.cancel()
+
+        self.pending_edits[after.id] = asyncio.create_task(
+            self.reply_edited_diagram(after, diagram)
+        )
+
+    async def reply_edited_diagram(self, message: Message, diagram: str):
+        """Replies the diagram of an edited message after the edit delay.
+
+        :param message: Edited message
+        :type message: Message
+        :param diagram: Mermaid script of the edited message
+        :type diagram: str
+        """
+        try:
+            await asyncio.sleep(self.edit_delay)
+
+            ctx = await self.bot.get_context(message)
+            await ctx.reply(embed=await self.generate_diagram_embed(diagram))
+        finally:
+            if self.pending_edits.get(message.id) is asyncio.current_task():
+                del self.pending_edits[message.id]
 
 
 async def setup(bot):
@@ -1,4 +1,4 @@
-from discord import Embed, Message
+from discord import Embed
 from discord.ext.commands import (
     Cog,
     Context,
@@ -7,11 +7,12 @@ from discord.ext.commands import (
     hybrid_group,
 )
 from emoji import demojize
-from nltk.tokenize import TweetTokenizer
 
+from bot.classes.message_analysis import MessageAnalysis
+from bot.classes.pun_cooldowns import PunCooldowns
+from bot.classes.pun_index import PunIndex
 from bot.models.bot import BotSettings
 from bot.models.extensions.language.pun import Pun
-from bot.models.extensions.language.pun_word import PunWord
 
 
 class PunCog(
@@ -19,54 +20,68 @@ class PunCog(
 ):
     def __init__(self, bot):
         self.bot = bot
+        self.jobs = []
+        self.pun_index = PunIndex()
+        self.pun_cooldowns = PunCooldowns()
 
-        self.tokenizer = TweetTokenizer()
+    def cog_load(self):
+        self.pun_index.load()
+        self.pun_cooldowns.load()
+
+        # Writes the puns cooldowns to the database every minute
+        self.jobs.append(
+            self.bot.scheduler.add_job(self.save_cooldowns, "interval", minutes=1)
+        )
+
+    def cog_unload(self):
+        for job in self.jobs:
+            self.bot.scheduler.remove_job(job.id)
+
+        self.pun_cooldowns.flush()
+
+    async def save_cooldowns(self):
+        self.pun_cooldowns.flush()
 
     @Cog.listener()
-    async def on_message(self, message: Message) -> None:
+    async def on_message_analysis(self, analysis: MessageAnalysis) -> None:
         """A listener function that calls the `pun_react` functions when a message is received.
 
-        :param message: The message that was received.
-        :type message: discord.Message
+        :param analysis: The analysis of the message that was received.
+        :type analysis: MessageAnalysis
         """
-        await self.pun_react(message)
+        await self.pun_react(analysis)
 
-    async def pun_react(self, message: Message) -> None:
+    async def pun_react(self, analysis: MessageAnalysis) -> None:
         """Add reactions and send a message in the channel
         if the message content contains any pun words.
 
-        :param message: The message to be checked for pun words.
-        :type message: discord.Message
+        Pun words and cooldowns are checked in memory (`PunIndex` and
+        `PunCooldowns`) so no query is made while handling a message.
+
+        :param analysis: The analysis of the message to be checked for pun words.
+        :type analysis: MessageAnalysis
         """
-        if message.author == self.bot.user:
-            return
+        pun_words, puns = self.pun_index.match(analysis.token_set)
 
-        message_tokens = self.tokenizer.tokenize(message.content)
-        tokenlist = set(map(str.lower, message_tokens))
+        if not pun_words:
+            return
 
-        pun_words = PunWord.distinct().all()
-        word_set = set(map(lambda pun_word: pun_word.word, pun_words))
+        message = analysis.message
+        invoked_at = message.created_at
+        puns = [
+            pun for pun in puns if self.pun_cooldowns.can_invoke(pun.id, invoked_at)
+        ]
 
-        matches = tokenlist.intersection(word_set)
-        invoked_at = message.created_at.replace(tzinfo=None)
+        for emoji in dict.fromkeys(pun_word.emoji() for pun_word in pun_words):
+            await message.add_reaction(emoji)
 
-        if matches:
-            matched_pun_words = filter(
-                lambda pun_word: pun_word.word in matches, pun_words
+        for pun in puns:
+            embed = Embed(
+                color=self.bot.default_color, title="Gotcha", description=pun.text
             )
-            puns = map(lambda pun_word: Pun.find(pun_word.pun_id), matched_pun_words)
-            puns = list(filter(lambda pun: pun.can_invoke_at_time(invoked_at), puns))
-
-            for pun_word in matched_pun_words:
-                await message.add_reaction(pun_word.emoji())
 
-            for pun in puns:
-                embed = Embed(
-                    color=self.bot.default_color, title="Gotcha", description=pun.text
-                )
-
-                await message.channel.send(embed=embed)
-                pun.save_last_invoked(invoked_at)
+            self.pun_cooldowns.invoke(pun.id, invoked_at)
+            await message.channel.send(embed=embed)
 
     @hybrid_group(name="puns", help="Commands to manage puns")
     @has_permissions(administrator=True)
@@ -103,7 +118,8 @@ class PunCog(
         :param pun_text: The new pun word to be added.
         :type pun_text: str
         """
-        Pun.create(text=pun_text)
+        pun = Pun.create(text=pun_text)
+        self.pun_index.add_pun(pun)
 
         await ctx.send("Pun added.")
 
@@ -120,9 +136,13 @@ class PunCog(
         pun = Pun.find(pun_id)
 
         if pun:
+            pun.delete()
+            self.pun_index.remove_pun(pun.id)
+            self.pun_cooldowns.forget(pun.id)
+
             await ctx.send("Pun removed.")
         else:
-            await ctx.send(f"Pun with id **{pun.id}** does not exist.")
+            await ctx.send(f"Pun with id **{pun_id}** does not exist.")
 
     @puns_group.command(name="add-word", help="Add a pun word to a pun")
     @has_permissions(administrator=True)
@@ -146,10 +166,12 @@ class PunCog(
             if pun.has_word(pun_word):
                 await ctx.send(f"Pun word **{pun_word}** already exists.")
             else:
-                pun.add_pun_word(pun_word, demojize(emoji))
+                new_pun_word = pun.add_pun_word(pun_word, demojize(emoji))
+                self.pun_index.add_pun_word(new_pun_word)
+
                 await ctx.send("Pun word added.")
         else:
-            await ctx.send(f"Pun with id {pun.id} does not exist.")
+            await ctx.send(f"Pun with id {pun_id} does not exist.")
 
     @puns_group.command(name="remove-word", help="Remove a pun from a pun word")
     @has_permissions(administrator=True)
@@ -170,9 +192,11 @@ class PunCog(
                 await ctx.send(f"Pun word **{pun_word}** does not exist.")
             else:
                 pun.remove_pun_word(pun_word)
+                self.pun_index.remove_pun_word(pun.id, pun_word)
+
                 await ctx.send("Pun word removed.")
         else:
-            await ctx.send(f"Pun with id **{pun.id}** does not exist.")
+            await ctx.send(f"Pun with id **{id}** does not exist.")
 
     @hybrid_command(name="cooldown", help="Set cooldown for puns feature in minutes.")
     async def set_puns_cooldown_command(
@@ -182,6 +206,8 @@ class PunCog(
         settings.puns_cooldown = cooldown_minutes
         settings.save()
 
+        self.pun_cooldowns.cooldown_minutes = cooldown_minutes
+
         await ctx.send(f"Updated cooldown to {cooldown_minutes} minutes.")
 
 
@@ -1,10 +1,10 @@
-import re
 from typing import List
 
 from discord import Embed, Message
 from discord.ext.commands import Cog
 
 from bot import app
+from bot.classes.message_analysis import MessageAnalysis
 from bot.helpers.log_helper import danger
 
 
@@ -35,23 +35,19 @@ class RedditCog(Cog, name="Reddit", description="Reddit utilities"):
             )
             await log.send(self.moderation_channel)
 
-    async def extract_subreddits(self, message: Message) -> List[List]:
-        """Extracts and filters all mentioned subreddits from a message
+    def filter_subreddits(self, analysis: MessageAnalysis) -> List[List]:
+        """Filters all mentioned subreddits from a message
 
-        :param message: Message from which to extract subreddits
-        :type message: Message
+        :param analysis: The analysis of the message containing the subreddits
+        :type analysis: MessageAnalysis
 
         :returns: List containing both valid and blacklisted subreddits
         :rtype: List[List]
         """
-        subreddit_matches = re.findall(
-            r"(?<![/.])\br/([A-Za-z0-9_]{3,21})", message.content
-        )
-
         subreddits = []
         blacklisted = []
 
-        for subreddit in set(subreddit_matches):
+        for subreddit in analysis.subreddits:
             if subreddit in self.blacklisted_subreddits:
                 blacklisted.append(subreddit)
             else:
@@ -60,33 +56,33 @@ class RedditCog(Cog, name="Reddit", description="Reddit utilities"):
         return [subreddits, blacklisted]
 
     @Cog.listener()
-    async def on_message(self, message: Message):
+    async def on_message_analysis(self, analysis: MessageAnalysis):
         """Listens for messages and replies with links to subreddits if any were mentioned
 
-        :param message: Message a user has sent
-        :type message: Message
+        :param analysis: The analysis of the message a user has sent
+        :type analysis: MessageAnalysis
         """
+        if not analysis.subreddits:
+            return
 
-        # Make sure that the message recieved is not sent by Grace
-        if message.author.id != self.bot.user.id:
-            subreddits, blacklisted = await self.extract_subreddits(message)
+        message = analysis.message
+        subreddits, blacklisted = self.filter_subreddits(analysis)
 
-            if blacklisted:
-                await self.notify_moderation(message, blacklisted)
+        if blacklisted:
+            await self.notify_moderation(message, blacklisted)
 
-            if subreddits:
-                ctx = await self.bot.get_context(message)
-                subreddit_links = [
-                    f"https://www.reddit.com/r/{subreddit}" for subreddit in subreddits
-                ]
+        if subreddits:
+            subreddit_links = [
+                f"https://www.reddit.com/r/{subreddit}" for subreddit in subreddits
+            ]
 
-                answer_embed = Embed(
-                    title="Here're the subreddits you mentioned",
-                    color=self.bot.default_color,
-                    description="\n".join(subreddit_links),
-                )
+            answer_embed = Embed(
+                title="Here're the subreddits you mentioned",
+                color=self.bot.default_color,
+                description="\n".join(subreddit_links),
+            )
 
-                await ctx.reply(embed=answer_embed)
+            await message.reply(embed=answer_embed)
 
 
 async def setup(bot):
@@ -1,11 +1,14 @@
 import re
-from datetime import datetime, timedelta, tzinfo
-from discord import Embed, File
-from discord.ext.commands import Cog, hybrid_command, Context
-from pytz import timezone
-from typing import Match
+from datetime import datetime, timedelta, timezone
+from logging import error
+from discord import Embed, File, HTTPException
+from discord.ext.commands import Cog, hybrid_group, Context
+from typing import List, Match, Optional
 from io import BytesIO
+from bot.classes.reminder_delivery import ReminderDelivery
+from bot.classes.reminder_scheduler import ReminderScheduler
 from bot.grace import Grace
+from bot.models.extensions.reminder import Reminder
 
 
 class ReminderCog(
@@ -17,17 +20,20 @@ class ReminderCog(
 
     def __init__(self, bot: Grace):
         self.bot: Grace = bot
-        self.jobs: list = []
-        self.timezone: tzinfo = timezone("US/Eastern")
+        self.reminder_delivery = ReminderDelivery(self.send_reminder_batch)
+        self.reminder_scheduler = ReminderScheduler(self.reminder_delivery.deliver)
         with open("assets/stopwatch.png", "rb") as f:
             # Load the image bytes once during init is
             # faster than reading from disk each time.
             self.image_bytes: bytes = f.read()
 
+    def cog_load(self):
+        """Start sending the stored reminders, the overdue ones first."""
+        self.reminder_scheduler.start()
+
     def cog_unload(self):
-        """Clean up any jobs this cog created."""
-        for job in self.jobs:
-            self.bot.scheduler.remove_job(job.id)
+        """Stop sending the reminders, they stay stored."""
+        self.reminder_scheduler.stop()
 
     def __get_embed_image__(self) -> File:
         """Returns the stopwatch image as a Discord File for embeds.
@@ -38,12 +44,14 @@ class ReminderCog(
         """
         return File(BytesIO(self.image_bytes), filename="stopwatch.png")
 
-    def _build_embed(self, title: str, message: str, author: str) -> Embed:
+    def _build_embed(
+        self, title: str, message: str, author: Optional[str] = None
+    ) -> Embed:
         """Builds a Discord embed with the given description.
 
         :param title: The title of the embed.
         :param message: The description/message of the embed.
-        :param author: The author of the embed.
+        :param author: The author of the embed, none if unknown.
 
         :return: The constructed Embed object.
         """
@@ -54,7 +62,9 @@ class ReminderCog(
             timestamp=datetime.now(),
         )
 
-        embed.set_author(name=author)
+        # Discord rejects an author without a name
+        if author:
+            embed.set_author(name=author)
         embed.set_thumbnail(url="attachment://stopwatch.png")
 
         return embed
@@ -80,8 +90,12 @@ class ReminderCog(
             case "d":
                 return timedelta(days=amount)
 
-    @hybrid_command(
-        name="reminder", help="Set a reminder with a message", usage="{timer} {message}"
+    @hybrid_group(
+        name="reminder",
+        help="Set a reminder with a message",
+        usage="{timer} {message}",
+        fallback="set",
+        invoke_without_command=True,
     )
     async def reminder(self, ctx: Context, timer: str, *, message: str) -> None:
         """
@@ -100,45 +114,100 @@ class ReminderCog(
             return
 
         reminder_delta = self._convert_to_timedelta(match)
-        reminder_time = datetime.now(self.timezone) + reminder_delta
-
-        self.jobs.append(
-            self.bot.scheduler.add_job(
-                self.send_reminder,
-                "date",
-                run_date=reminder_time,
-                args=[ctx, message],
-                id=f"reminder_{ctx.author.id}_{datetime.now().timestamp()}",
-            )
+        reminder = Reminder.create(
+            member_id=ctx.author.id,
+            member_name=ctx.author.display_name,
+            channel_id=ctx.channel.id,
+            message=message,
+            remind_at=datetime.now(timezone.utc) + reminder_delta,
         )
+        self.reminder_scheduler.add(reminder)
 
-        reminder_time = (
-            ctx.message.created_at + reminder_delta  # convert to the user timezone
-        )
-        timestamp = int(reminder_time.timestamp())
+        timestamp = int(reminder.remind_at_utc.timestamp())
         embed = self._build_embed(
             "Reminder Set",
             f"Reminder set for {timer} from now!\n"
             f"You will be reminded on **<t:{timestamp}:F>**.",
             ctx.author.display_name,
         )
-        embed.add_field(
-            name="",
-            value="_⚠️ Reminders are not saved and will be cleared on restart [read more](https://github.com/Code-Society-Lab/grace/issues/151)._",
-            inline=False,
-        )
+        embed.set_footer(text=f"Reminder {reminder.id}")
 
         await ctx.send(embed=embed, ephemeral=True, file=self.__get_embed_image__())
 
-    async def send_reminder(self, ctx: Context, message: str) -> None:
-        """Sends the reminder to the user when the scheduler triggers it.
+    @reminder.command(name="list", help="List your pending reminders")
+    async def list_reminders(self, ctx: Context) -> None:
+        """
+        List the pending reminders of the user.
 
         :param ctx: Command context.
-        :param message: The reminder message.
         """
-        embed = self._build_embed("Your Reminder", message, ctx.author.display_name)
-        await ctx.send(
-            f"<@{ctx.author.id}>", embed=embed, file=self.__get_embed_image__()
+        embed = self._build_embed("Your Reminders", "", ctx.author.display_name)
+
+        for reminder in Reminder.pending(ctx.author.id):
+            timestamp = int(reminder.remind_at_utc.timestamp())
+            embed.add_field(
+                name=f"[{reminder.id}] <t:{timestamp}:R>",
+                value=reminder.message[:1024],
+                inline=False,
+            )
+
+        if not embed.fields:
+            embed.description = "You have no pending reminders."
+
+        await ctx.send(embed=embed, ephemeral=True, file=self.__get_embed_image__())
+
+    @reminder.command(name="cancel", help="Cancel one of your reminders")
+    async def cancel_reminder(self, ctx: Context, reminder_id: int) -> None:
+        """
+        Cancel a pending reminder of the user.
+
+        :param ctx: Command context.
+        :param reminder_id: The id of the reminder, as shown by `reminder list`.
+        """
+        reminder = Reminder.find(reminder_id)
+
+        if not reminder or reminder.member_id != ctx.author.id:
+            await ctx.send("Reminder not found!", ephemeral=True)
+            return
+
+        self.reminder_scheduler.remove(reminder)
+        reminder.delete()
+
+        await ctx.send(f"Reminder {reminder_id} cancelled!", ephemeral=True)
+
+    async def send_reminder_batch(self, channel_id: int, reminders: List[Reminder]):
+        """Sends due reminders of a channel in a single message.
+
+        The embeds share the same stopwatch attachment.
+
+        :param channel_id: The id of the channel of the reminders.
+        :param reminders: The due reminders, at most 10.
+        """
+        try:
+            channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(
+                channel_id
+            )
+        except HTTPException as e:
+            error(f"Unable to find the channel {channel_id} of reminders: {e}")
+            return
+
+        embeds = []
+        mentions = []
+
+        for reminder in reminders:
+            author = reminder.member_name
+
+            # The reminders created before the name was stored
+            if not author and (user := self.bot.get_user(reminder.member_id)):
+                author = user.display_name
+
+            embeds.append(self._build_embed("Your Reminder", reminder.message, author))
+
+            if (mention := f"<@{reminder.member_id}>") not in mentions:
+                mentions.append(mention)
+
+        await channel.send(
+            " ".join(mentions), embeds=embeds, file=self.__get_embed_image__()
         )
 
 
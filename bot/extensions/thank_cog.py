@@ -1,11 +1,27 @@
-from typing import List, Optional
+from datetime import date, datetime, timezone
+from typing import List, Optional, Tuple
 
 from discord import Embed, Member
-from discord.ext.commands import BucketType, Cog, Context, cooldown, hybrid_group
-
+from discord.ext.commands import (
+    BucketType,
+    Cog,
+    Context,
+    Greedy,
+    cooldown,
+    hybrid_group,
+)
+
+from bot.classes.display_names import DisplayNames
+from bot.classes.period import Period
+from bot.classes.thank_positions import ThankPositions
 from bot.extensions.command_error_handler import send_command_help
 from bot.grace import Grace
 from bot.models.extensions.thank import Thank
+from bot.models.extensions.thank_rollup import ThankRollup
+from lib.cache import AsyncCache
+
+# The largest leaderboard, its lines fit in the description of an embed
+MAX_LEADERBOARD_SIZE = 25
 
 
 class ThankCog(Cog):
@@ -13,6 +29,19 @@ class ThankCog(Cog):
 
     def __init__(self, bot: Grace):
         self.bot: Grace = bot
+        self.display_names: DisplayNames = DisplayNames(bot)
+        self.positions: ThankPositions = ThankPositions()
+
+        # The rendered leaderboards by guild, top, period and start of the
+        # period, until the thanks change, the least recently used ones are
+        # evicted first
+        self.leaderboards: AsyncCache[
+            Tuple[Optional[int], int, Period, Optional[date]], Embed
+        ] = AsyncCache(ttl=3600, max_size=256)
+        self.leaderboards_version: int = Thank.version
+
+    def cog_load(self):
+        self.positions.load()
 
     @hybrid_group(name="thank", help="Thank commands")
     async def thank_group(self, ctx: Context) -> None:
@@ -25,50 +54,65 @@ class ThankCog(Cog):
         if ctx.invoked_subcommand is None:
             await send_command_help(ctx)
 
-    @thank_group.command(name="send", description="Send a thank you to a person")
+    @thank_group.command(name="send", description="Send a thank you to people")
     @cooldown(1, 3600, BucketType.user)
-    async def thank(self, ctx: Context, *, member: Member) -> None:
-        """Send a "thank you" message to a member and increase their thank count by 1.
+    async def thank(self, ctx: Context, members: Greedy[Member]) -> None:
+        """Send a "thank you" message to one or many members and increase their
+        thank count by 1.
 
         :param ctx: The context of the command invocation.
         :type ctx: Context
-        :param member: The member to thank.
-        :type member: Member
+        :param members: The members to thank.
+        :type members: List[Member]
         :return: Message | None
         """
-        if ctx.author.id == member.id:
-            await ctx.send("You cannot thank yourself.", ephemeral=True)
+        if not members:
+            await send_command_help(ctx)
             return
 
-        thank: Thank = Thank.find_by(member_id=member.id)
+        members = [member for member in members if member.id != ctx.author.id]
+        members = list({member.id: member for member in members}.values())
 
-        if not thank:
-            thank = Thank.create(member_id=member.id)
-
-        thank.count += 1
-        thank.save()
+        if not members:
+            await ctx.send("You cannot thank yourself.", ephemeral=True)
+            return
 
-        thank_embed: Embed = Embed(
-            title="INFO",
-            color=self.bot.default_color,
-            description=f"{member.display_name}, you were thanked by **{ctx.author.display_name}**\n"
-            f"Now, your thank count is: **{thank.count}**",
+        counts = Thank.increment(
+            *(member.id for member in members), author_id=ctx.author.id
         )
+        self.positions.update(counts)
+
+        for member in members:
+            thank_embed: Embed = Embed(
+                title="INFO",
+                color=self.bot.default_color,
+                description=f"{member.display_name}, you were thanked by **{ctx.author.display_name}**\n"
+                f"Now, your thank count is: **{counts[member.id]}**",
+            )
 
-        if member.id != self.bot.user.id:
-            await member.send(embed=thank_embed)
-        await ctx.send(
-            f"Successfully thanked **@{member.display_name}**", ephemeral=True
-        )
+            if member.id != self.bot.user.id:
+                await member.send(embed=thank_embed)
+
+        names = ", ".join(f"**@{member.display_name}**" for member in members)
+        await ctx.send(f"Successfully thanked {names}", ephemeral=True)
 
     @thank_group.command(name="leaderboard", description="Shows top n helpers.")
-    async def thank_leaderboard(self, ctx: Context, *, top: int = 10) -> None:
+    async def thank_leaderboard(
+        self, ctx: Context, top: int = 10, period: Period = Period.ALL
+    ) -> None:
         """Display the top n helpers, sorted by their thank count.
 
+        The weekly and monthly leaderboards show the change of position of
+        each helper since the previous week or month.
+
         :param ctx: The context of the command invocation.
         :type ctx: Context
-        :param top: The number of top helpers to display. Default is 10.
+        :param top: The number of top helpers to display, at most 25. Default
+        is 10.
         :type top: int (optional)
+        :param period: The period of the thanks (all, week or month). Default
+        is all.
+        :type period: Period (optional)
         """
         if top <= 0:
             await ctx.reply(
@@ -76,27 +120,93 @@ class ThankCog(Cog):
             )
             return
 
-        helpers: List[Thank] = Thank.order_by(count="desc").limit(top).all()
+        top = min(top, MAX_LEADERBOARD_SIZE)
+
+        if self.leaderboards_version != Thank.version:
+            self.leaderboards.clear()
+            self.leaderboards_version = Thank.version
+
+        # A new week or month starts with an empty leaderboard, even if no
+        # one was thanked since the previous one was rendered
+        start = period.start(datetime.now(timezone.utc))
+        key = (ctx.guild and ctx.guild.id, top, period, start)
+
+        leaderboard_embed = await self.leaderboards.get_or_load(
+            key, lambda: self.build_leaderboard_embed(ctx, top, period, start)
+        )
 
-        if not helpers:
+        if not leaderboard_embed:
             await ctx.reply("No helpers found.", ephemeral=True)
             return
 
+        await ctx.reply(embed=leaderboard_embed, ephemeral=True)
+
+    async def build_leaderboard_embed(
+        self,
+        ctx: Context,
+        top: int,
+        period: Period = Period.ALL,
+        start: Optional[date] = None,
+    ) -> Optional[Embed]:
+        """Build the leaderboard of the top n helpers.
+
+        The names of the helpers are resolved from the cache, the missing
+        ones are fetched concurrently.
+
+        :param ctx: The context of the command invocation.
+        :type ctx: Context
+        :param top: The number of top helpers to display.
+        :type top: int
+        :param period: The period of the thanks.
+        :type period: Period
+        :param start: The first day of the period, default to the current one.
+        :type start: Optional[date]
+        :return: The leaderboard or None if there are no helpers.
+        :rtype: Optional[Embed]
+        """
+        if period is Period.ALL:
+            helpers: List[Thank] = Thank.order_by(count="desc").limit(top).all()
+            member_ids = [helper.member_id for helper in helpers]
+            title = f"Helpers Leaderboard Top {top}"
+        else:
+            start = start or period.start(datetime.now(timezone.utc))
+            counts = ThankRollup.top(period, start, top)
+            member_ids = [member_id for member_id, _ in counts]
+            positions = ThankRollup.positions(
+                period, period.previous_start(start), member_ids
+            )
+            title = f"Helpers Leaderboard Top {top} ({period})"
+
+        if not member_ids:
+            return None
+
+        names = await self.display_names.resolve(member_ids, ctx.guild)
+
         leaderboard_embed: Embed = Embed(
-            title=f"Helpers Leaderboard Top {top}",
+            title=title,
             description="",
             color=self.bot.default_color,
         )
 
-        for position, helper in enumerate(helpers):
-            member = await self.bot.fetch_user(helper.member_id)
-            leaderboard_embed.description += (
-                "{}. **{}**: **{}** with {} thank(s).\n".format(
-                    position + 1, member.display_name, helper.rank, helper.count
+        if period is Period.ALL:
+            for position, helper in enumerate(helpers):
+                leaderboard_embed.description += (
+                    "{}. **{}**: **{}** with {} thank(s).\n".format(
+                        position + 1, names[helper.member_id], helper.rank, helper.count
+                    )
+                )
+        else:
+            for position, (member_id, count) in enumerate(counts):
+                leaderboard_embed.description += (
+                    "{}. **{}** with {} thank(s) ({}).\n".format(
+                        position + 1,
+                        names[member_id],
+                        count,
+                        format_position_change(position + 1, positions.get(member_id)),
+                    )
                 )
-            )
 
-        await ctx.reply(embed=leaderboard_embed, ephemeral=True)
+        return leaderboard_embed
 
     @thank_group.command(name="rank", description="Shows your current thank rank.")
     async def thank_rank(
@@ -128,7 +238,9 @@ class ThankCog(Cog):
             rank_embed.description = "You haven't been thanked yet."
         else:
             rank_embed.description = (
-                f"Your rank is: **{thank.rank}**\nYour thank count is: {thank.count}"
+                f"Your rank is: **{thank.rank}**\n"
+                f"Your position is: {self.format_position(thank.member_id)}\n"
+                f"Your thank count is: {thank.count}"
             )
 
         await ctx.reply(embed=rank_embed, ephemeral=True)
@@ -152,11 +264,46 @@ class ThankCog(Cog):
             )
         else:
             rank_embed.description = (
-                f"User **@{member.display_name}** has rank: **{thank.rank}**"
+                f"User **@{member.display_name}** has rank: **{thank.rank}**\n"
+                f"Position: {self.format_position(thank.member_id)}"
             )
 
         await ctx.reply(embed=rank_embed, ephemeral=True)
 
+    def format_position(self, member_id: int) -> str:
+        """Returns the position of a member among the thanked members.
+
+        :param member_id: The id of the member.
+        :type member_id: int
+        :return: The position (ex. "**#37** of 4,112") or "-" if the member was
+        never thanked.
+        :rtype: str
+        """
+        position = self.positions.get(member_id)
+
+        if position is None:
+            return "-"
+        return f"**#{position:,}** of {len(self.positions):,}"
+
+
+def format_position_change(position: int, previous: Optional[int]) -> str:
+    """Returns the change of a position since the previous period.
+
+    :param position: The current position.
+    :type position: int
+    :param previous: The position during the previous period, if any.
+    :type previous: Optional[int]
+    :return: The change (ex. "▲2", "▼1", "=" or "new").
+    :rtype: str
+    """
+    if previous is None:
+        return "new"
+    if previous > position:
+        return f"▲{previous - position}"
+    if previous < position:
+        return f"▼{position - previous}"
+    return "="
+
 
 async def setup(bot: Grace):
     await bot.add_cog(ThankCog(bot))
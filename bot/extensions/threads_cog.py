@@ -1,18 +1,24 @@
+import asyncio
 import traceback
-from logging import info
+from logging import error, info
 from pytz import timezone
 from datetime import datetime
+from typing import Callable, List, Optional
 
-from discord import Embed, Interaction, TextStyle
+from discord import Embed, Interaction, RawThreadDeleteEvent, TextStyle
+from discord import Thread as DiscordThread
 from discord.app_commands import Choice, autocomplete
 
 from discord.ui import Modal, TextInput
 from discord.ext.commands import Cog, has_permissions, hybrid_group, Context
 
-from bot.models.extensions.thread import Thread
+from bot.models.extensions.thread import DEFAULT_TIMEZONE, Thread, make_trigger
 from bot.classes.recurrence import Recurrence
+from bot.classes.thread_states import ThreadStates
 from bot.extensions.command_error_handler import send_command_help
+from bot.helpers.timezone_helper import timezone_autocomplete
 from lib.config_required import cog_config_required
+from lib.heap_scheduler import HeapScheduler
 
 
 class ThreadModal(Modal, title="Thread"):
@@ -35,6 +41,9 @@ class ThreadModal(Modal, title="Thread"):
         recurrence: Recurrence,
         reminder: bool = None,
         thread: Thread = None,
+        schedule: Optional[str] = None,
+        timezone: Optional[str] = None,
+        on_save: Optional[Callable[[Thread], None]] = None,
     ):
         super().__init__()
 
@@ -45,6 +54,9 @@ class ThreadModal(Modal, title="Thread"):
         self.thread = thread
         self.thread_reminder = reminder
         self.thread_recurrence = recurrence
+        self.thread_schedule = schedule
+        self.thread_timezone = timezone
+        self.on_save = on_save
 
     async def on_submit(self, interaction: Interaction):
         if self.thread:
@@ -58,8 +70,13 @@ class ThreadModal(Modal, title="Thread"):
             content=self.thread_content.value,
             recurrence=self.thread_recurrence,
             daily_reminder=self.thread_reminder,
+            schedule=self.thread_schedule,
+            timezone=self.thread_timezone,
         )
 
+        if self.on_save:
+            self.on_save(thread)
+
         await interaction.response.send_message(
             f"Thread __**{thread.id}**__ created!", ephemeral=True
         )
@@ -70,8 +87,13 @@ class ThreadModal(Modal, title="Thread"):
             content=self.thread_content.value,
             recurrence=self.thread_recurrence,
             daily_reminder=self.thread_reminder,
+            schedule=self.thread_schedule,
+            timezone=self.thread_timezone,
         )
 
+        if self.on_save:
+            self.on_save(self.thread)
+
         await interaction.response.send_message(
             f"Thread __**{self.thread.id}**__ updated!", ephemeral=True
         )
@@ -101,38 +123,20 @@ class ThreadsCog(Cog, name="Threads"):
         self.jobs = []
         self.threads_channel_id = self.required_config
         self.timezone = timezone("US/Eastern")
+        self.thread_states = ThreadStates(bot)
 
-    def cog_load(self):
-        # Runs every day at 12:30
-        self.jobs.append(
-            self.bot.scheduler.add_job(
-                self.daily_post, "cron", hour=12, minute=30, timezone=self.timezone
-            )
-        )
+        # Discord.py waits on the rate limits, this only bounds the number of
+        # threads posted at once.
+        self.post_semaphore = asyncio.Semaphore(5)
 
-        # Runs every monday at 12:30
-        self.jobs.append(
-            self.bot.scheduler.add_job(
-                self.weekly_post,
-                "cron",
-                day_of_week="mon",
-                hour=12,
-                minute=30,
-                timezone=self.timezone,
-            )
-        )
+        # Posts every scheduled thread from a single task
+        self.thread_scheduler = HeapScheduler(self.post_scheduled_threads)
 
-        # Runs on the 1st of every month at 12:30
-        self.jobs.append(
-            self.bot.scheduler.add_job(
-                self.monthly_post,
-                "cron",
-                day=1,
-                hour=12,
-                minute=30,
-                timezone=self.timezone,
-            )
-        )
+    def cog_load(self):
+        for thread in Thread.all():
+            self.schedule_thread(thread)
+
+        self.thread_scheduler.start()
 
         # Runs reminders everyday at 18:30
         self.jobs.append(
@@ -141,6 +145,19 @@ class ThreadsCog(Cog, name="Threads"):
             )
         )
 
+    def schedule_thread(self, thread: Thread):
+        """Schedules the posts of a thread, or unschedules them if the thread
+        has neither a schedule nor a recurrence."""
+        if trigger := thread.trigger:
+            self.thread_scheduler.schedule(thread.id, trigger)
+        else:
+            self.thread_scheduler.unschedule(thread.id)
+
+    async def post_scheduled_threads(self, thread_ids: List[int]):
+        info(f"Posting scheduled threads {thread_ids}")
+
+        await self.post_threads(Thread.where(Thread.id.in_(thread_ids)).all())
+
     async def daily_reminder(self):
         """Send a daily reminder for active threads."""
         info("Posting daily threads's reminder")
@@ -151,19 +168,20 @@ class ThreadsCog(Cog, name="Threads"):
             description="Join the discussion in the latest active threads:",
         )
 
-        if threads := Thread.where(
+        threads = Thread.where(
             Thread.latest_thread_id.isnot(None), daily_reminder=True
-        ).all():
-            for thread in threads:
-                discord_thread = await self.bot.fetch_channel(
-                    int(thread.latest_thread_id)
-                )
-                if discord_thread.archived or discord_thread.locked:
-                    continue  # Skip archieved and locked threads
+        ).all()
+        states = await self.thread_states.resolve(
+            int(thread.latest_thread_id) for thread in threads
+        )
 
-                embed.add_field(
-                    name="", value=f"- <#{thread.latest_thread_id}>", inline=False
-                )
+        for thread in threads:
+            if not states[int(thread.latest_thread_id)]:
+                continue  # Skip archived and locked threads
+
+            embed.add_field(
+                name="", value=f"- <#{thread.latest_thread_id}>", inline=False
+            )
 
         if embed.fields:
             channel = self.bot.get_channel(self.threads_channel_id)
@@ -171,25 +189,33 @@ class ThreadsCog(Cog, name="Threads"):
                 await channel.send(embed=embed)
 
     def cog_unload(self):
+        self.thread_scheduler.stop()
+
         for job in self.jobs:
             self.bot.scheduler.remove_job(job.id)
 
-    async def daily_post(self):
-        info("Posting daily threads")
-
-        for thread in Thread.find_by_recurrence(Recurrence.DAILY):
-            await self.post_thread(thread)
+    @Cog.listener()
+    async def on_thread_update(self, _: DiscordThread, after: DiscordThread):
+        self.thread_states.set(after)
 
-    async def weekly_post(self):
-        info("Posting weekly threads")
+    @Cog.listener()
+    async def on_raw_thread_delete(self, payload: RawThreadDeleteEvent):
+        self.thread_states.remove(payload.thread_id)
 
-        for thread in Thread.find_by_recurrence(Recurrence.WEEKLY):
-            await self.post_thread(thread)
+    async def post_threads(self, threads: List[Thread]):
+        """Posts threads concurrently, a thread that fails to be posted does
+        not prevent the others from being posted."""
+        results = await asyncio.gather(
+            *(self.post_thread_bounded(thread) for thread in threads),
+            return_exceptions=True,
+        )
 
-    async def monthly_post(self):
-        info("Posting monthly threads")
+        for thread, result in zip(threads, results):
+            if isinstance(result, Exception):
+                error(f"Unable to post thread {thread.id}: {result}")
 
-        for thread in Thread.find_by_recurrence(Recurrence.MONTHLY):
+    async def post_thread_bounded(self, thread: Thread):
+        async with self.post_semaphore:
             await self.post_thread(thread)
 
     async def post_thread(self, thread: Thread):
@@ -233,6 +259,7 @@ class ThreadsCog(Cog, name="Threads"):
                     name=f"[{thread.id}] {thread.title}",
                     value=(
                         f"**Recurrence**: {thread.recurrence}\n"
+                        f"**Schedule**: {self.format_schedule(thread)}\n"
                         f"**Reminder**: {thread.daily_reminder}"
                     ),
                     inline=False,
@@ -242,15 +269,57 @@ class ThreadsCog(Cog, name="Threads"):
 
         await ctx.send(embed=embed, ephemeral=True)
 
+    def format_schedule(self, thread: Thread) -> str:
+        schedule = thread.schedule or (thread.recurrence or Recurrence.NONE).schedule
+
+        if not schedule:
+            return "-"
+
+        schedule = f"`{schedule}` ({thread.timezone or DEFAULT_TIMEZONE})"
+
+        if next_fire_time := self.thread_scheduler.next_fire_time(thread.id):
+            schedule += f", next <t:{int(next_fire_time.timestamp())}:R>"
+        return schedule
+
+    async def validate_schedule(
+        self,
+        ctx: Context,
+        recurrence: Recurrence,
+        schedule: Optional[str],
+        timezone: Optional[str],
+    ) -> bool:
+        """Tells the user if the given schedule or timezone is invalid."""
+        if not schedule and not timezone:
+            return True
+
+        try:
+            make_trigger(recurrence, schedule, timezone)
+        except ValueError as e:
+            await ctx.send(f"Invalid schedule: {e}", ephemeral=True)
+            return False
+        return True
+
     @threads_group.command(help="Creates a new thread")
     @has_permissions(administrator=True)
+    @autocomplete(timezone=timezone_autocomplete)
     async def create(
         self,
         ctx: Context,
         recurrence: Recurrence,
         reminder: bool,
+        schedule: Optional[str] = None,
+        timezone: Optional[str] = None,
     ):
-        modal = ThreadModal(recurrence, reminder=reminder)
+        if not await self.validate_schedule(ctx, recurrence, schedule, timezone):
+            return
+
+        modal = ThreadModal(
+            recurrence,
+            reminder=reminder,
+            schedule=schedule,
+            timezone=timezone,
+            on_save=self.schedule_thread,
+        )
         await ctx.interaction.response.send_modal(modal)
 
     @threads_group.command(help="Deletes a given thread")
@@ -258,6 +327,7 @@ class ThreadsCog(Cog, name="Threads"):
     @autocomplete(thread=thread_autocomplete)
     async def delete(self, ctx: Context, thread: int):
         if thread := Thread.find(thread):
+            self.thread_scheduler.unschedule(thread.id)
             thread.delete()
             await ctx.send("Thread successfully deleted!", ephemeral=True)
         else:
@@ -265,19 +335,38 @@ class ThreadsCog(Cog, name="Threads"):
 
     @threads_group.command(help="Update a thread")
     @has_permissions(administrator=True)
-    @autocomplete(thread=thread_autocomplete)
+    @autocomplete(thread=thread_autocomplete, timezone=timezone_autocomplete)
     async def update(
         self,
         ctx: Context,
         thread: int,
         recurrence: Recurrence,
         reminder: bool,
+        schedule: Optional[str] = None,
+        timezone: Optional[str] = None,
     ):
-        if thread := Thread.find(thread):
-            modal = ThreadModal(recurrence, reminder=reminder, thread=thread)
-            await ctx.interaction.response.send_modal(modal)
-        else:
+        if not (thread := Thread.find(thread)):
             await ctx.send("Thread not found!", ephemeral=True)
+            return
+
+        # The options that are left out keep the values of the thread
+        if schedule is None:
+            schedule = thread.schedule
+        if timezone is None:
+            timezone = thread.timezone
+
+        if not await self.validate_schedule(ctx, recurrence, schedule, timezone):
+            return
+
+        modal = ThreadModal(
+            recurrence,
+            reminder=reminder,
+            thread=thread,
+            schedule=schedule,
+            timezone=timezone,
+            on_save=self.schedule_thread,
+        )
+        await ctx.interaction.response.send_modal(modal)
 
     @threads_group.command(help="Post a given thread")
     @has_permissions(administrator=True)
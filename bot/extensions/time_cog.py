@@ -1,37 +1,89 @@
+import asyncio
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 import pytz
 from dateutil import parser
-from discord import Message
-from discord.ext.commands import Cog
-
-# Mapping for common timezone abbreviations to their UTC offsets
-timezone_abbreviations = {
-    # North American
-    "pst": "America/Los_Angeles",  # Pacific Standard Time
-    "pdt": "America/Los_Angeles",  # Pacific Daylight Time
-    "mst": "America/Denver",  # Mountain Standard Time
-    "mdt": "America/Denver",  # Mountain Daylight Time
-    "cst": "America/Chicago",  # Central Standard Time
-    "cdt": "America/Chicago",  # Central Daylight Time
-    "est": "America/New_York",  # Eastern Standard Time
-    "edt": "America/New_York",  # Eastern Daylight Time
-    # International standards
-    "gmt": "Etc/GMT",  # Greenwich Mean Time
-    "utc": "UTC",  # Coordinated Universal Time
-    # European
-    "bst": "Europe/London",  # British Summer Time
-    "cet": "Europe/Paris",  # Central European Time
-    "cest": "Europe/Paris",  # Central European Summer Time
-    # Asia-Pacific
-    "hkt": "Asia/Hong_Kong",  # Hong Kong Time
-    "ist": "Asia/Kolkata",  # India Standard Time
-    "jst": "Asia/Tokyo",  # Japan Standard Time
-    "aest": "Australia/Sydney",  # Australian Eastern Standard Time
-    "aedt": "Australia/Sydney",  # Australian Eastern Daylight Time
-    # TODO: find a way to fetch all timezones dynamically
-}
+from discord.app_commands import autocomplete
+from discord.ext.commands import Cog, Context, hybrid_group
+
+from bot.classes.message_analysis import MessageAnalysis
+from bot.classes.user_timezones import UserTimezones
+from bot.helpers.timezone_helper import timezone_autocomplete
+from bot.models.extensions.user_timezone import UserTimezone
+from lib.timezones import find_timezones
+
+# A time of the day (ex. "5pm", "5 PM", "10:30am", "17:44")
+TIME_PATTERN = re.compile(
+    r"\b(?:\d{1,2}(?::\d{2})?\s?(?:am|pm)|\d{1,2}:\d{2})\b", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=1024)
+def parse_time(time_str: str, tz_name: str, default: datetime) -> Optional[datetime]:
+    """
+    Parse a time expression in the given timezone.
+
+    The results are cached, the same expression is often repeated while a
+    meeting is being scheduled.
+
+    :param time_str: The normalized time expression (ex. "at 5pm est").
+    :type time_str: str
+    :param tz_name: The name of the timezone of the expression.
+    :type tz_name: str
+    :param default: The date used when the expression has none.
+    :type default: datetime
+
+    :return: The aware datetime or None if no time could be parsed.
+    :rtype: Optional[datetime]
+    """
+    try:
+        parsed_time = parser.parse(time_str, fuzzy=True, default=default)
+    except (ValueError, OverflowError):
+        return None
+
+    if parsed_time.tzinfo is None:
+        return pytz.timezone(tz_name).localize(parsed_time)
+    return parsed_time
+
+
+def split_time_expressions(
+    time_str: str, default_zone: Optional[str] = None
+) -> List[Tuple[str, str]]:
+    """
+    Split a message into one time expression per timezone abbreviation.
+
+    Each expression goes from the end of the previous abbreviation up to the
+    end of its own abbreviation (ex. "at 5pm EST", "or 11pm CET").
+
+    When the message has no abbreviation and a default zone is given, the
+    expressions end at each time of the day instead (ex. "meet at 5pm").
+
+    :param time_str: The message.
+    :type time_str: str
+    :param default_zone: The zone of the times without an abbreviation.
+    :type default_zone: Optional[str]
+
+    :return: The lowercased expressions with the name of their timezone.
+    :rtype: List[Tuple[str, str]]
+    """
+    ends = [(timezone.end, timezone.zone) for timezone in find_timezones(time_str)]
+
+    if not ends and default_zone:
+        ends = [
+            (match.end(), default_zone) for match in TIME_PATTERN.finditer(time_str)
+        ]
+
+    expressions = []
+    start = 0
+
+    for end, zone in ends:
+        expressions.append((time_str[start:end].strip().lower(), zone))
+        start = end
+
+    return expressions
 
 
 class TimeCog(
@@ -46,41 +98,50 @@ class TimeCog(
 
     This allows users to share time references that automatically display
     correctly in each user's local timezone within Discord.
+
+    Members can also set their timezone, their messages with a time but
+    without an abbreviation ('meet at 5pm') are then converted as well.
     """
 
     def __init__(self, bot):
         self.bot = bot
+        self.user_timezones = UserTimezones()
+
+    def cog_load(self):
+        self.user_timezones.load()
 
-    def _build_timestamp(self, utc, time_str: str) -> int:
+    def _build_timestamps(
+        self, time_str: str, now_utc: datetime, default_zone: Optional[str] = None
+    ) -> List[int]:
         """
-        Build the timespamt based on timezone.
+        Build the timestamp of every time expression of a message.
+
+        Relative dates are replaced in each expression, then an expression
+        without a date uses the date of the previous one, or the current UTC
+        date for the first one.
 
-        :param utc: UTC timezone object
-        :type utc: _UTCclass
-        :param time_str: The time expression provided by the user.
+        :param time_str: The normalized message.
         :type time_str: str
+        :param now_utc: The current UTC datetime.
+        :type now_utc: datetime
+        :param default_zone: The zone of the author, if they set one.
+        :type default_zone: Optional[str]
 
-        :return: The corresponding UTC timestamp as a Unix integer.
-        :rtype: int
+        :return: The distinct UTC timestamps as Unix integers.
+        :rtype: List[int]
         """
-        parsed_time = parser.parse(time_str, fuzzy=True)
+        default = datetime.combine(now_utc.date(), time())
+        timestamps = {}
 
-        # Detect abbreviation in the message
-        tz_found = False
-        for abbr, tz_name in timezone_abbreviations.items():
-            if abbr in time_str:
-                tz = pytz.timezone(tz_name)
-                if parsed_time.tzinfo is None:
-                    parsed_time = tz.localize(parsed_time)
-                else:
-                    parsed_time = parsed_time.astimezone(tz)
-                tz_found = True
-                break
+        for expression, tz_name in split_time_expressions(time_str, default_zone):
+            expression = self._build_relative_date(expression, now_utc)
+            parsed_time = parse_time(expression, tz_name, default)
 
-        if not tz_found:
-            parsed_time = utc.localize(parsed_time.replace(tzinfo=None))
+            if parsed_time is not None:
+                timestamps[int(parsed_time.timestamp())] = None
+                default = datetime.combine(parsed_time.date(), time())
 
-        return int(parsed_time.timestamp())
+        return list(timestamps)
 
     def _build_relative_date(self, time_str: str, now_utc: datetime) -> str:
         """
@@ -104,51 +165,102 @@ class TimeCog(
 
         return time_str
 
-    def _build_regex(self) -> str:
+    @Cog.listener()
+    async def on_message_analysis(self, analysis: MessageAnalysis) -> None:
         """
-        Construct a regex pattern to detect known timezone abbreviations.
+        Event listener triggered when a new message is sent.
 
-        :return: A regex pattern that matches any known timezone abbreviation.
-        :rtype: str
+        If the message contains recognized timezone abbreviations,
+        the function will try to parse the time expression before each
+        of them, convert it into a UTC timestamp, and reply once with
+        a Discord-formatted timestamp (<t:timestamp:F>) per expression.
+
+        Messages without abbreviation are converted with the timezone of
+        their author, if they set one and the message contains a time.
+
+        Parsing is done in a thread to not block the event loop.
+
+        :param analysis: The analysis of the message received from Discord.
+        :type analysis: MessageAnalysis
         """
-        keys = timezone_abbreviations.keys()
-        escaped_keys = [re.escape(key) for key in keys]
-        joined = "|".join(escaped_keys)
+        if analysis.from_bot:
+            return
 
-        return rf"\b({joined})\b"
+        message = analysis.message
+        member_zone = None
 
-    @Cog.listener()
-    async def on_message(self, message: Message) -> None:
+        if not analysis.timezones:
+            member_zone = self.user_timezones.get(message.author.id)
+
+            if member_zone is None or not TIME_PATTERN.search(analysis.content):
+                return  # process only when timezone in message or known
+
+        time_str = " ".join(analysis.content.split())
+        now_utc = datetime.now(pytz.UTC)
+
+        timestamps = await asyncio.to_thread(
+            self._build_timestamps, time_str, now_utc, member_zone
+        )
+
+        if timestamps:
+            await message.reply(
+                "\n".join(f"<t:{timestamp}:F>" for timestamp in timestamps)
+            )
+
+    @hybrid_group(name="timezone", help="Commands to manage your timezone")
+    async def timezone_group(self, ctx: Context) -> None:
+        """Shows the timezone of the member if called without a subcommand.
+
+        :param ctx: The context in which the command was called.
+        :type ctx: discord.ext.commands.Context
         """
-        Event listener triggered when a new message is sent.
+        if ctx.invoked_subcommand is None:
+            if zone := self.user_timezones.get(ctx.author.id):
+                await ctx.send(f"Your timezone is **{zone}**", ephemeral=True)
+            else:
+                await ctx.send(
+                    "You have no timezone, set one with `timezone set`",
+                    ephemeral=True,
+                )
 
-        If the message contains a recognized timezone abbreviation,
-        the function will try to parse the message text for a valid
-        time expression, convert it into a UTC timestamp, and reply
-        with a Discord-formatted timestamp (<t:timestamp:F>).
+    @timezone_group.command(
+        name="set",
+        help="Set your timezone (ex. America/Toronto)",
+        usage="{timezone}",
+    )
+    @autocomplete(timezone=timezone_autocomplete)
+    async def set_timezone(self, ctx: Context, timezone: str) -> None:
+        """Set the timezone used to convert the times of the member's messages.
 
-        :param message: The message object received from Discord.
-        :type message: discord.Message
+        :param ctx: The context in which the command was called.
+        :type ctx: discord.ext.commands.Context
+        :param timezone: The IANA name of the timezone (ex. America/Toronto).
+        :type timezone: str
         """
-        if message.author.bot:
+        if timezone not in pytz.all_timezones_set:
+            await ctx.send(
+                f"**{timezone}** is not a valid timezone (ex. America/Toronto)",
+                ephemeral=True,
+            )
             return
 
-        time_str = message.content.lower()
-        tz_pattern = self._build_regex()
-        if not re.search(tz_pattern, time_str):
-            return  # process only when timezone in message
+        UserTimezone.set_timezone(ctx.author.id, timezone)
+        self.user_timezones.set(ctx.author.id, timezone)
 
-        utc = pytz.UTC
-        now_utc = datetime.now(utc)
+        await ctx.send(f"Your timezone is now **{timezone}**", ephemeral=True)
 
-        time_str = " ".join(time_str.split())
-        time_str = self._build_relative_date(time_str, now_utc)
+    @timezone_group.command(name="remove", help="Remove your timezone")
+    async def remove_timezone(self, ctx: Context) -> None:
+        """Remove the timezone of the member.
+
+        :param ctx: The context in which the command was called.
+        :type ctx: discord.ext.commands.Context
+        """
+        if user_timezone := UserTimezone.find(ctx.author.id):
+            user_timezone.delete()
 
-        try:
-            timestamp = self._build_timestamp(utc, time_str)
-            await message.reply(f"<t:{timestamp}:F>")
-        except Exception:
-            pass
+        self.user_timezones.remove(ctx.author.id)
+        await ctx.send("Your timezone was removed", ephemeral=True)
 
 
 async def setup(bot):
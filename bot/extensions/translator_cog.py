@@ -1,3 +1,5 @@
+import asyncio
+
 from discord import Embed, Interaction
 from discord.app_commands import Choice, autocomplete
 from discord.ext.commands import Cog, CommandError, Context, hybrid_command
@@ -49,8 +51,10 @@ class TranslatorCog(
         """
         await ctx.defer()
 
-        text_translator = Translator()
-        translated_text = text_translator.translate(sentence, dest=translate_into)
+        # googletrans only has a blocking client, it runs in a thread
+        translated_text = await asyncio.to_thread(
+            self.translator.translate, sentence, dest=translate_into
+        )
 
         embed = Embed(color=self.bot.default_color)
 
@@ -69,6 +73,7 @@ class TranslatorCog(
 
     def __init__(self, bot):
         self.bot = bot
+        self.translator = Translator(timeout=10)
 
     @translator.error
     async def translator_error(self, ctx: Context, error: CommandError):
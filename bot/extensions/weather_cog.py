@@ -1,22 +1,42 @@
+import asyncio
 from datetime import datetime
+from functools import partial
+from logging import warning
 from string import capwords
+from typing import Optional
 
+from aiohttp import ClientError
 from discord import Embed
 from discord.ext.commands import Cog, hybrid_command
 from pytz import timezone
-from requests import get
 from timezonefinder import TimezoneFinder
 
+from lib.cache import AsyncCache
 from lib.config_required import cog_config_required
 
 
+def normalize_city(city: str) -> str:
+    """Returns the cache key of a city name, ignoring its case and spacing.
+
+    :param city: The name of the city.
+    :type city: str
+    :return: The normalized name of the city.
+    :rtype: str
+    """
+    return " ".join(city.split()).casefold()
+
+
 @cog_config_required(
     "openweather", "api_key", "Generate yours [here](https://openweathermap.org/api)"
 )
 class WeatherCog(
     Cog, name="Weather", description="get current weather information from a city"
 ):
-    """A cog that retrieves current weather information for a given city."""
+    """A cog that retrieves current weather information for a given city.
+
+    The weather of a city is cached for a few minutes and the lookups of the
+    same city made at the same time share a single request to OpenWeather.
+    """
 
     OPENWEATHER_BASE_URL = "https://api.openweathermap.org/data/2.5/"
 
@@ -24,6 +44,11 @@ class WeatherCog(
         self.bot = bot
         self.api_key = self.required_config
 
+        # OpenWeather updates the current weather about every 10 minutes
+        self.weather_cache: AsyncCache[str, dict] = AsyncCache(
+            ttl=300, max_size=512, negative_ttl=60
+        )
+
     @staticmethod
     def get_timezone(data: any) -> datetime:
         """Get the timezone for the given city.
@@ -62,24 +87,42 @@ class WeatherCog(
         """
         return kelvin * 1.8 - 459.67
 
-    async def get_weather(self, city: str):
-        """Retrieve weather information for the specified city.
+    async def fetch_weather(self, city: str) -> Optional[dict]:
+        """Request the weather information of the specified city to OpenWeather.
 
         :param city: The name of the city to retrieve weather information for
         :type city: str
         :return: A dictionary containing the weather information,
         or None if the city was not found
-        :rtype: dict
+        :rtype: Optional[dict]
+        :raises aiohttp.ClientError: If OpenWeather can't answer
         """
-        # complete_url to retreive weather info
-        response = get(
-            f"{self.OPENWEATHER_BASE_URL}/weather?appid={self.api_key}&q={city}"
+        response = await self.bot.http_service.get(
+            f"{self.OPENWEATHER_BASE_URL}weather",
+            params={"appid": self.api_key, "q": city},
         )
 
-        # code 200 means the city is found otherwise, city is not found
-        if response.status_code == 200:
+        # code 200 means the city is found and 404 that it is not found
+        if response.status == 200:
             return response.json()
-        return None
+        if response.status == 404:
+            return None
+        raise ClientError(f"OpenWeather answered with status {response.status}")
+
+    async def get_weather(self, city: str) -> Optional[dict]:
+        """Retrieve weather information for the specified city.
+
+        :param city: The name of the city to retrieve weather information for
+        :type city: str
+        :return: A dictionary containing the weather information,
+        or None if the city was not found
+        :rtype: Optional[dict]
+        :raises aiohttp.ClientError: If OpenWeather can't answer
+        :raises asyncio.TimeoutError: If OpenWeather takes too long to answer
+        """
+        return await self.weather_cache.get_or_load(
+            normalize_city(city), partial(self.fetch_weather, city)
+        )
 
     @hybrid_command(
         name="weather", help="Show weather information in your city", usage="{city}"
@@ -97,12 +140,18 @@ class WeatherCog(
             await ctx.interaction.response.defer()
 
         city = capwords(city_input)
-        data_weather = await self.get_weather(city)
-        timezone_city = self.get_timezone(data_weather)
+
+        try:
+            data_weather = await self.get_weather(city)
+        except (ClientError, asyncio.TimeoutError) as e:
+            warning(f"Unable to get the weather of {city}: {e}")
+            await ctx.send("Weather is unavailable, try again later.")
+            return
 
         # Now data_weather contains lists of data
         # from the city inputer by the user
         if data_weather:
+            timezone_city = self.get_timezone(data_weather)
             icon_id = data_weather["weather"][0]["icon"]
             main = data_weather["main"]
             visibility = data_weather["visibility"]
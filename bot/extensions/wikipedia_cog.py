@@ -1,27 +1,53 @@
-from json import loads
-from typing import Any, List
-from urllib.parse import quote_plus
-from urllib.request import urlopen
+import asyncio
+from json import JSONDecodeError
+from logging import warning
+from typing import Any, List, Optional
 
+from aiohttp import ClientError
 from discord import Button, ButtonStyle, Embed, Interaction, ui
 from discord.ext.commands import Cog, Context, hybrid_command
 from discord.ui import View
 
+from bot.services.http_service import HTTPService
 
-def search_results(search: str) -> List[Any]:
+WIKIPEDIA_API = "https://en.wikipedia.org/w/api.php"
+
+
+async def search_results(http_service: HTTPService, search: str) -> Optional[List[Any]]:
     """Return search results from Wikipedia for the given search query.
 
+    :param http_service: The HTTP client used to search Wikipedia.
+    :type http_service: HTTPService
     :param search: The search query to be used to search Wikipedia.
     :type search: str
 
-    :return: A list of search results.
-    :rtype: list
+    :return: A list of search results, or None if Wikipedia is unavailable.
+    :rtype: Optional[list]
     """
-    url_encode: str = quote_plus(search)
-    base_url: str = f"https://en.wikipedia.org/w/api.php?action=opensearch&format=json&limit=3&namespace=0&search={url_encode}"
-
-    with urlopen(base_url) as url:
-        return loads(url.read())
+    try:
+        response = await http_service.get(
+            WIKIPEDIA_API,
+            params={
+                "action": "opensearch",
+                "format": "json",
+                "limit": 3,
+                "namespace": 0,
+                "search": search,
+            },
+        )
+    except (ClientError, asyncio.TimeoutError) as e:
+        warning(f"Unable to search Wikipedia: {e}")
+        return None
+
+    if not response.ok:
+        warning(f"Wikipedia answered with status {response.status}")
+        return None
+
+    try:
+        return response.json()
+    except JSONDecodeError as e:
+        warning(f"Wikipedia answered with invalid JSON: {e}")
+        return None
 
 
 class Buttons(View):
@@ -83,14 +109,17 @@ class Wikipedia(Cog, name="Wikipedia", description="Search on Wikipedia."):
         :param search: The search query to be used to search Wikipedia.
         :type search: str
         """
-        result: List[Any] = search_results(search)
-        view: Buttons = Buttons(search, result)
-
-        if len(result[1]) == 0:
-            await ctx.interaction.response.send_message(
-                "No result found.", ephemeral=True
-            )
+        result: Optional[List[Any]] = await search_results(
+            self.bot.http_service, search
+        )
+
+        if result is None:
+            await ctx.send("Wikipedia is unavailable, try again later.", ephemeral=True)
+        elif len(result[1]) == 0:
+            await ctx.send("No result found.", ephemeral=True)
         else:
+            view: Buttons = Buttons(search, result)
+
             result_view = ""
             search_count = 1
             for result in result[1]:
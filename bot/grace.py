@@ -1,15 +1,24 @@
 from logging import info, warning
+from typing import Optional
 
-from discord import Activity, ActivityType, Colour, Intents
+from discord import Activity, ActivityType, Colour, Intents, Message
+from discord.ext.commands import Command
 from pretty_help import PrettyHelp
 
+from bot.classes.cooldown_store import CooldownStore
+from bot.classes.message_analysis import MessageAnalysis
 from bot.models.channel import Channel
 from bot.models.extension import Extension
+from bot.services.http_service import HTTPService
+from bot.services.nlp_service import NLPService
 from grace.bot import Bot
 
 
 class Grace(Bot):
     def __init__(self, app):
+        # Before the bot is initialized, which adds the help command
+        self.cooldowns = CooldownStore()
+
         super().__init__(
             app,
             intents=Intents.all(),
@@ -17,6 +26,8 @@ class Grace(Bot):
         )
 
         self.help_command = PrettyHelp(color=self.default_color)
+        self.nlp_service = NLPService(workers=app.config.get("nlp", "workers"))
+        self.http_service = HTTPService()
 
     @property
     def default_color(self):
@@ -29,6 +40,28 @@ class Grace(Bot):
             return self.get_channel(channel.channel_id)
         return None
 
+    def add_command(self, command: Command, /):
+        """Adds a command and restores its cooldown, see `CooldownStore`."""
+        super().add_command(command)
+        self.cooldowns.attach(command)
+
+    def remove_command(self, name: str, /) -> Optional[Command]:
+        """Removes a command and saves its cooldown, see `CooldownStore`."""
+        command = super().remove_command(name)
+
+        # Removing an alias keeps the command
+        if command and name not in command.aliases:
+            self.cooldowns.detach(command)
+        return command
+
+    async def setup_hook(self):
+        # Writes the commands cooldowns to the database every minute
+        self.scheduler.add_job(self.save_cooldowns, "interval", minutes=1)
+        await super().setup_hook()
+
+    async def save_cooldowns(self):
+        self.cooldowns.flush()
+
     async def load_extensions(self):
         for module in self.app.extension_modules:
             extension = Extension.where(module_name=module).first()
@@ -48,3 +81,21 @@ class Grace(Bot):
 
     async def on_ready(self):
         info(f"{self.user.name}#{self.user.id} is online and ready to use!")
+
+    async def on_message(self, message: Message):
+        """Processes the commands and dispatches a single `message_analysis`
+        event shared by every cog listening to messages.
+
+        Cogs should listen to `on_message_analysis` instead of `on_message`
+        so the message is only analyzed once.
+        """
+        await self.process_commands(message)
+
+        if message.author != self.user:
+            self.dispatch("message_analysis", MessageAnalysis(message))
+
+    async def close(self):
+        self.nlp_service.shutdown()
+        self.cooldowns.flush()
+        await super().close()
+        await self.http_service.close()
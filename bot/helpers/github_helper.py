@@ -1,5 +1,5 @@
 from math import ceil
-from typing import Iterable, List
+from typing import List, Tuple
 
 from discord import Color, Embed
 from discord.ui import Button
@@ -9,9 +9,9 @@ from github import Organization, Repository
 from bot.services.github_service import GithubService
 
 
-def available_project_names() -> Iterable[str]:
+def available_project_names() -> List[str]:
     organization: Organization = GithubService().get_code_society_lab()
-    return map(lambda r: r.name, organization.get_repos())
+    return [repository.name for repository in organization.get_repos()]
 
 
 def create_contributors_embeds(repository: Repository) -> List[Embed]:
@@ -47,3 +47,20 @@ def create_repository_button(repository: Repository) -> Button:
     return Button(
         emoji=emojize(":file_folder:"), label="Repository", url=repository.html_url
     )
+
+
+def fetch_contributors(project: str) -> Tuple[List[Embed], Button]:
+    """Get the contributors embeds and the button of a Code Society Lab
+    repository.
+
+    PyGithub is blocking, this function should be run in a thread (ex. with
+    `asyncio.to_thread`).
+
+    :param project: The name of the repository.
+    :type project: str
+
+    :return: The contributors embeds and the repository button.
+    :rtype: Tuple[List[Embed], Button]
+    """
+    repository = GithubService().get_code_society_lab_repo(project)
+    return create_contributors_embeds(repository), create_repository_button(repository)
@@ -0,0 +1,21 @@
+from typing import List
+
+import pytz
+from discord import Interaction
+from discord.app_commands import Choice
+
+
+async def timezone_autocomplete(_: Interaction, current: str) -> List[Choice[str]]:
+    """Provide autocomplete suggestions for IANA timezone names.
+
+    :param _: The interaction object.
+    :type _: Interaction
+    :param current: The current value of the input field.
+    :type current: str
+    :return: A list of at most 25 `Choice` objects containing timezone names.
+    :rtype: List[Choice[str]]
+    """
+    current = current.lower().replace(" ", "_")
+    zones = (zone for zone in pytz.common_timezones if current in zone.lower())
+
+    return [Choice(name=zone, value=zone) for zone, _ in zip(zones, range(25))]
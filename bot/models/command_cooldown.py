@@ -0,0 +1,113 @@
+import json
+from typing import Iterable, List
+
+from sqlalchemy import delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session
+
+from grace.model import Field, Model
+from lib.cooldowns import CooldownState
+
+
+class CommandCooldown(Model):
+    """The state of a cooldown bucket of a command, saved so the cooldowns
+    survive a restart.
+
+    The key of the bucket (ex. a member id) is stored as JSON.
+    """
+
+    __tablename__ = "command_cooldowns"
+
+    command: str = Field(primary_key=True, max_length=255)
+    bucket_key: str = Field(primary_key=True, max_length=255)
+    window: float
+    tokens: int
+    last: float
+    expires_at: float = Field(index=True)
+
+    @classmethod
+    def load(cls, command: str) -> List[CooldownState]:
+        """Returns the saved buckets of a command.
+
+        :param command: The qualified name of the command
+        :type command: str
+
+        :return: The key, window, tokens and last use of each bucket
+        :rtype: List[CooldownState]
+        """
+        states = []
+
+        for cooldown in cls.where(command=command).all():
+            key = json.loads(cooldown.bucket_key)
+
+            if isinstance(key, list):
+                key = tuple(key)
+
+            states.append((key, cooldown.window, cooldown.tokens, cooldown.last))
+        return states
+
+    @classmethod
+    def save(cls, command: str, per: float, states: Iterable[CooldownState]):
+        """Creates or updates the saved buckets of a command in a single
+        statement.
+
+        Buckets whose key can't be stored as JSON are skipped.
+
+        :param command: The qualified name of the command
+        :type command: str
+        :param per: The length of the cooldown of the command, in seconds
+        :type per: float
+        :param states: The key, window, tokens and last use of each bucket
+        :type states: Iterable[CooldownState]
+        """
+        rows = []
+
+        for key, window, tokens, last in states:
+            try:
+                bucket_key = json.dumps(key)
+            except TypeError:
+                continue
+
+            rows.append(
+                {
+                    "command": command,
+                    "bucket_key": bucket_key,
+                    "window": window,
+                    "tokens": tokens,
+                    "last": last,
+                    "expires_at": last + per,
+                }
+            )
+
+        if not rows:
+            return
+
+        engine = cls.get_engine()
+        dialect = postgresql if engine.dialect.name == "postgresql" else sqlite
+
+        table = cls.__table__
+        statement = dialect.insert(table).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.command, table.c.bucket_key],
+            set_={
+                column: statement.excluded[column]
+                for column in ("window", "tokens", "last", "expires_at")
+            },
+        )
+
+        with Session(engine) as session:
+            session.execute(statement)
+            session.commit()
+
+    @classmethod
+    def delete_expired(cls, current: float):
+        """Deletes the buckets expired at the given time.
+
+        :param current: The current time, in seconds since the epoch
+        :type current: float
+        """
+        table = cls.__table__
+
+        with Session(cls.get_engine()) as session:
+            session.execute(delete(table).where(table.c.expires_at < current))
+            session.commit()
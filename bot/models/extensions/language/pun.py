@@ -1,7 +1,9 @@
-from datetime import datetime, timedelta
-from typing import List
+from datetime import datetime
+from typing import Dict, List
+
+from sqlalchemy import update
+from sqlmodel import Session
 
-from bot.models.bot import BotSettings
 from bot.models.extensions.language.pun_word import PunWord
 from grace.model import Field, Model, Relationship
 
@@ -22,23 +24,30 @@ class Pun(Model):
             yield pun_word.word
 
     def has_word(self, word):
-        return self.pun_words.where(word=word).count() > 0
+        return PunWord.where(pun_id=self.id, word=word).count() > 0
 
     def add_pun_word(self, pun_word, emoji_code):
-        PunWord(pun_id=self.id, word=pun_word, emoji_code=emoji_code).save()
+        return PunWord(pun_id=self.id, word=pun_word, emoji_code=emoji_code).save()
 
     def remove_pun_word(self, pun_word):
         PunWord.where(pun_id=self.id, word=pun_word).first().delete()
 
-    def can_invoke_at_time(self, time):
-        cooldown_minutes = BotSettings.settings().puns_cooldown
-        cooldown = timedelta(minutes=cooldown_minutes)
-
-        if self.last_invoked is None:
-            return True
-        else:
-            return time - self.last_invoked > cooldown
-
-    def save_last_invoked(self, time):
-        self.last_invoked = time
-        self.save()
+    def delete(self):
+        for pun_word in PunWord.where(pun_id=self.id).all():
+            pun_word.delete()
+
+        super().delete()
+
+    @classmethod
+    def save_last_invoked(cls, last_invoked: Dict[int, datetime]):
+        """Saves the last invocation time of many puns in a single batch.
+
+        :param last_invoked: The last invocation time by pun id
+        :type last_invoked: Dict[int, datetime]
+        """
+        with Session(cls.get_engine()) as session:
+            session.execute(
+                update(cls),
+                [{"id": id, "last_invoked": time} for id, time in last_invoked.items()],
+            )
+            session.commit()
@@ -2,6 +2,7 @@ from typing import List
 
 from emoji import emojize
 
+from bot.models.extensions.language.trigger_exclusion import TriggerExclusion
 from bot.models.extensions.language.trigger_word import TriggerWord
 from grace.model import Field, Model, Relationship
 
@@ -17,12 +18,20 @@ class Trigger(Model):
     trigger_words: List[TriggerWord] = Relationship(
         back_populates="trigger", sa_relationship_kwargs={"lazy": "selectin"}
     )
+    trigger_exclusions: List[TriggerExclusion] = Relationship(
+        back_populates="trigger", sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
     @property
     def words(self):
         for trigger_word in self.trigger_words:
             yield trigger_word.word
 
+    @property
+    def exclusions(self):
+        for trigger_exclusion in self.trigger_exclusions:
+            yield trigger_exclusion.phrase
+
     @property
     def positive_emoji(self):
         return emojize(self.positive_emoji_code, language="alias")
@@ -36,3 +45,9 @@ class Trigger(Model):
 
     def remove_trigger_word(self, trigger_word):
         TriggerWord.where(trigger_id=self.id, word=trigger_word).first().delete()
+
+    def add_exclusion(self, phrase):
+        TriggerExclusion(trigger_id=self.id, phrase=phrase).save()
+
+    def remove_exclusion(self, phrase):
+        TriggerExclusion.where(trigger_id=self.id, phrase=phrase).first().delete()
@@ -0,0 +1,22 @@
+from typing import TYPE_CHECKING, Optional
+
+from grace.model import Field, Model, Relationship
+
+if TYPE_CHECKING:
+    from .trigger import Trigger
+
+
+class TriggerExclusion(Model):
+    """A phrase that, when following a trigger word, prevents the trigger.
+
+    Ex. "tech tips" prevents "Linus" from being triggered by "Linus tech tips".
+    """
+
+    __tablename__ = "trigger_exclusions"
+
+    trigger_id: int = Field(foreign_key="triggers.id", primary_key=True)
+    phrase: str = Field(max_length=255, primary_key=True)
+
+    trigger: Optional["Trigger"] = Relationship(
+        back_populates="trigger_exclusions", sa_relationship_kwargs={"lazy": "selectin"}
+    )
@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Self, Tuple
+
+from sqlalchemy import Index, Text, delete, select
+from sqlmodel import Session
+
+from grace.model import Field, Model
+
+
+def _as_utc(time: datetime) -> datetime:
+    # SQLite doesn't keep the timezone, the times are stored in UTC
+    if time.tzinfo is None:
+        return time.replace(tzinfo=timezone.utc)
+    return time
+
+
+class Reminder(Model):
+    """A reminder waiting to be sent to a member in a channel."""
+
+    __tablename__ = "reminders"
+    __table_args__ = (
+        Index("ix_reminders_member_id_remind_at", "member_id", "remind_at"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    member_id: int
+    member_name: str | None = Field(default=None, max_length=100)
+    channel_id: int
+    message: str = Field(sa_type=Text)
+    remind_at: datetime = Field(index=True)
+
+    @property
+    def remind_at_utc(self) -> datetime:
+        """Returns the time of the reminder as an aware UTC datetime.
+
+        :return: The time of the reminder
+        :rtype: datetime
+        """
+        return _as_utc(self.remind_at)
+
+    @classmethod
+    def due_before(
+        cls, end: datetime, start: Optional[datetime] = None
+    ) -> List[Tuple[int, datetime]]:
+        """Returns the id and the time of the reminders due before a time.
+
+        Only those two columns are read, from the index on the time.
+
+        :param end: The end of the window, excluded
+        :type end: datetime
+        :param start: The start of the window, included, if any
+        :type start: Optional[datetime]
+
+        :return: The id and the time of each reminder of the window
+        :rtype: List[Tuple[int, datetime]]
+        """
+        table = cls.__table__
+        statement = select(table.c.id, table.c.remind_at).where(table.c.remind_at < end)
+
+        if start is not None:
+            statement = statement.where(table.c.remind_at >= start)
+
+        with Session(cls.get_engine()) as session:
+            return [
+                (reminder_id, _as_utc(remind_at))
+                for reminder_id, remind_at in session.execute(statement).all()
+            ]
+
+    @classmethod
+    def pending(cls, member_id: int, limit: int = 25) -> List[Self]:
+        """Returns the reminders of a member, the soonest first.
+
+        :param member_id: The id of the member
+        :type member_id: int
+        :param limit: The maximum number of reminders
+        :type limit: int
+
+        :return: The reminders of the member
+        :rtype: List[Reminder]
+        """
+        return (
+            cls.where(member_id=member_id).order_by(remind_at="asc").limit(limit).all()
+        )
+
+    @classmethod
+    def delete_all(cls, reminder_ids: Iterable[int]):
+        """Deletes reminders in a single statement.
+
+        :param reminder_ids: The ids of the reminders
+        :type reminder_ids: Iterable[int]
+        """
+        table = cls.__table__
+
+        with Session(cls.get_engine()) as session:
+            session.execute(delete(table).where(table.c.id.in_(list(reminder_ids))))
+            session.commit()
@@ -1,5 +1,13 @@
-from typing import Optional
+from datetime import datetime, timezone
+from typing import ClassVar, Dict, Optional
 
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session
+
+from bot.classes.period import Period
+from bot.models.extensions.thank_event import ThankEvent
+from bot.models.extensions.thank_rollup import ThankRollup
 from grace.model import Field, Model
 
 
@@ -10,7 +18,11 @@ class Thank(Model):
 
     id: int | None = Field(default=None, primary_key=True)
     member_id: int = Field(unique=True)
-    count: int | None = Field(default=0)
+    count: int | None = Field(default=0, index=True)
+
+    # Increased every time the thanks are changed, used to invalidate what is
+    # computed from them (ex. the leaderboard).
+    version: ClassVar[int] = 0
 
     @property
     def rank(self) -> Optional[str]:
@@ -30,3 +42,89 @@ class Thank(Model):
             return "Expert"
         else:
             return None
+
+    @classmethod
+    def increment(
+        cls,
+        *member_ids: int,
+        author_id: Optional[int] = None,
+        time: Optional[datetime] = None,
+    ) -> Dict[int, int]:
+        """Atomically increases by 1 the thank count of the given members,
+        creating the missing records, in a single statement.
+
+        The thanks are also logged as events and added to the weekly and
+        monthly rollups, in the same transaction.
+
+        A member given more than once is only thanked once.
+
+        :param member_ids: The ids of the thanked members.
+        :type member_ids: int
+        :param author_id: The id of the member who sent the thanks.
+        :type author_id: Optional[int]
+        :param time: The time of the thanks, default to now.
+        :type time: Optional[datetime]
+
+        :return: The new thank count of each member.
+        :rtype: Dict[int, int]
+        """
+        member_ids = list(dict.fromkeys(member_ids))
+
+        if not member_ids:
+            return {}
+
+        time = time or datetime.now(timezone.utc)
+        engine = cls.get_engine()
+        dialect = postgresql if engine.dialect.name == "postgresql" else sqlite
+
+        thanks = cls.__table__
+        thanks_statement = (
+            dialect.insert(thanks)
+            .values([{"member_id": member_id, "count": 1} for member_id in member_ids])
+            .on_conflict_do_update(
+                index_elements=[thanks.c.member_id],
+                set_={"count": func.coalesce(thanks.c.count, 0) + 1},
+            )
+            .returning(thanks.c.member_id, thanks.c.count)
+        )
+
+        events_statement = dialect.insert(ThankEvent.__table__).values(
+            [
+                {"member_id": member_id, "author_id": author_id, "created_at": time}
+                for member_id in member_ids
+            ]
+        )
+
+        rollups = ThankRollup.__table__
+        rollups_statement = (
+            dialect.insert(rollups)
+            .values(
+                [
+                    {
+                        "period": period,
+                        "period_start": period.start(time),
+                        "member_id": member_id,
+                        "count": 1,
+                    }
+                    for period in (Period.WEEK, Period.MONTH)
+                    for member_id in member_ids
+                ]
+            )
+            .on_conflict_do_update(
+                index_elements=[
+                    rollups.c.period,
+                    rollups.c.period_start,
+                    rollups.c.member_id,
+                ],
+                set_={"count": rollups.c.count + 1},
+            )
+        )
+
+        with Session(engine) as session:
+            counts = dict(session.execute(thanks_statement).all())
+            session.execute(events_statement)
+            session.execute(rollups_statement)
+            session.commit()
+
+        cls.version += 1
+        return counts
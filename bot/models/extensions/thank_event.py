@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlalchemy import Index
+
+from grace.model import Field, Model
+
+
+class ThankEvent(Model):
+    """A thank sent to a member, the log of the thanks."""
+
+    __tablename__ = "thank_events"
+    __table_args__ = (
+        Index("ix_thank_events_member_id_created_at", "member_id", "created_at"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    member_id: int
+    author_id: int | None = Field(default=None)
+    created_at: datetime
@@ -0,0 +1,104 @@
+from datetime import date
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy import Index, func, select
+from sqlmodel import Session
+
+from bot.classes.period import Period
+from grace.model import Field, Model
+from lib.fields import EnumField
+
+
+class ThankRollup(Model):
+    """The number of thanks of a member during a week or a month.
+
+    The rollups are maintained by `Thank.increment`, so a leaderboard of a
+    period only reads the rows of that period from the covering index on
+    (period, period_start, count, member_id).
+    """
+
+    __tablename__ = "thank_rollups"
+    __table_args__ = (
+        Index(
+            "ix_thank_rollups_period_count",
+            "period",
+            "period_start",
+            "count",
+            "member_id",
+        ),
+    )
+
+    period: Period = EnumField(Period, primary_key=True)
+    period_start: date = Field(primary_key=True)
+    member_id: int = Field(primary_key=True)
+    count: int = Field(default=0)
+
+    @classmethod
+    def top(
+        cls, period: Period, period_start: date, limit: int
+    ) -> List[Tuple[int, int]]:
+        """Returns the members with the most thanks during a period.
+
+        :param period: The period of the rollups (week or month).
+        :type period: Period
+        :param period_start: The first day of the period.
+        :type period_start: date
+        :param limit: The maximum number of members.
+        :type limit: int
+
+        :return: The id and the count of the members, most thanked first.
+        :rtype: List[Tuple[int, int]]
+        """
+        rollups = (
+            cls.where(period=period, period_start=period_start)
+            .order_by(count="desc")
+            .limit(limit)
+            .all()
+        )
+        return [(rollup.member_id, rollup.count) for rollup in rollups]
+
+    @classmethod
+    def positions(
+        cls, period: Period, period_start: date, member_ids: Iterable[int]
+    ) -> Dict[int, int]:
+        """Returns the position of the given members during a period.
+
+        The position of a member is one more than the number of members with
+        more thanks, so members with the same count share the same position.
+        Each position is counted on the index, from the top of the period
+        down to the member, the other members of the period are not read.
+
+        :param period: The period of the rollups (week or month).
+        :type period: Period
+        :param period_start: The first day of the period.
+        :type period_start: date
+        :param member_ids: The ids of the members.
+        :type member_ids: Iterable[int]
+
+        :return: The position of each member id thanked during the period.
+        :rtype: Dict[int, int]
+        """
+        member_ids = list(member_ids)
+        if not member_ids:
+            return {}
+
+        rollups = cls.__table__.alias("rollups")
+        higher = cls.__table__.alias("higher")
+
+        position = (
+            select(func.count())
+            .where(
+                higher.c.period == rollups.c.period,
+                higher.c.period_start == rollups.c.period_start,
+                higher.c.count > rollups.c.count,
+            )
+            .scalar_subquery()
+        )
+        statement = select(rollups.c.member_id, position + 1).where(
+            rollups.c.period == period.value,
+            rollups.c.period_start == period_start,
+            rollups.c.member_id.in_(member_ids),
+        )
+
+        with Session(cls.get_engine()) as session:
+            return dict(session.execute(statement).all())
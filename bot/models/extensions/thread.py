@@ -1,10 +1,46 @@
 from sqlalchemy import Text
 
-from typing import List, Self
+from typing import List, Optional, Self
+from apscheduler.triggers.cron import CronTrigger
 from bot.classes.recurrence import Recurrence
 from grace.model import Field, Model
 from lib.fields import EnumField
 
+DEFAULT_TIMEZONE = "US/Eastern"
+
+
+def make_trigger(
+    recurrence: Optional[Recurrence],
+    schedule: Optional[str] = None,
+    timezone: Optional[str] = None,
+) -> Optional[CronTrigger]:
+    """Returns the trigger of a thread schedule.
+
+    The schedule is a crontab expression (ex. "0 9 * * mon-fri"), when it is
+    missing the schedule of the recurrence is used.
+
+    :param recurrence: The recurrence of the thread
+    :type recurrence: Optional[Recurrence]
+    :param schedule: The crontab expression of the thread
+    :type schedule: Optional[str]
+    :param timezone: The IANA timezone of the schedule, default to US/Eastern
+    :type timezone: Optional[str]
+
+    :return: The trigger or None if the thread is not scheduled
+    :rtype: Optional[CronTrigger]
+
+    :raises ValueError: If the schedule or the timezone is invalid
+    """
+    schedule = schedule or (recurrence or Recurrence.NONE).schedule
+
+    if not schedule:
+        return None
+
+    try:
+        return CronTrigger.from_crontab(schedule, timezone=timezone or DEFAULT_TIMEZONE)
+    except LookupError:
+        raise ValueError(f"Unknown timezone: {timezone}") from None
+
 
 class Thread(Model):
     __tablename__ = "threads"
@@ -17,6 +53,17 @@ class Thread(Model):
     )
     latest_thread_id: int
     daily_reminder: bool
+    schedule: str | None = Field(default=None, max_length=100)
+    timezone: str | None = Field(default=None, max_length=64)
+
+    @property
+    def trigger(self) -> Optional[CronTrigger]:
+        """Returns the trigger of the posts of the thread.
+
+        :return: The trigger or None if the thread is not scheduled
+        :rtype: Optional[CronTrigger]
+        """
+        return make_trigger(self.recurrence, self.schedule, self.timezone)
 
     @classmethod
     def find_by_recurrence(cls, recurrence: Recurrence) -> List[Self]:
@@ -0,0 +1,28 @@
+from typing import Self
+
+from grace.model import Field, Model
+
+
+class UserTimezone(Model):
+    """The IANA timezone (ex. America/Toronto) chosen by a member."""
+
+    __tablename__ = "user_timezones"
+
+    member_id: int = Field(primary_key=True)
+    timezone: str = Field(max_length=64)
+
+    @classmethod
+    def set_timezone(cls, member_id: int, timezone: str) -> Self:
+        """Creates or updates the timezone of a member.
+
+        :param member_id: The id of the member
+        :type member_id: int
+        :param timezone: The IANA name of the timezone
+        :type timezone: str
+
+        :return: The timezone of the member
+        :rtype: UserTimezone
+        """
+        if user_timezone := cls.find(member_id):
+            return user_timezone.update(timezone=timezone)
+        return cls.create(member_id=member_id, timezone=timezone)
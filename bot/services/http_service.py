@@ -0,0 +1,256 @@
+import asyncio
+import json
+import random
+from dataclasses import dataclass
+from logging import warning
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector
+from multidict import CIMultiDictProxy
+
+from lib.circuit_breaker import CircuitBreaker
+
+# Methods that can be sent again without changing their result
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Statuses worth retrying, the upstream is overloaded or temporarily down
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(ClientError):
+    """Raised when a request is refused because its upstream keeps failing.
+
+    :param host: The host of the upstream.
+    :type host: str
+    :param retry_after: The number of seconds before the upstream is tried again.
+    :type retry_after: float
+    """
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(f"{host} is unavailable, retry in {retry_after:.0f}s")
+
+        self.host: str = host
+        self.retry_after: float = retry_after
+
+
+@dataclass(frozen=True)
+class HTTPResponse:
+    """The response of a request, read entirely.
+
+    :param status: The HTTP status of the response.
+    :type status: int
+    :param headers: The headers of the response.
+    :type headers: CIMultiDictProxy[str]
+    :param body: The body of the response.
+    :type body: bytes
+    """
+
+    status: int
+    headers: CIMultiDictProxy
+    body: bytes
+
+    @property
+    def ok(self) -> bool:
+        """Returns true if the status is lower than 400."""
+        return self.status < 400
+
+    @property
+    def text(self) -> str:
+        """Returns the body decoded as UTF-8."""
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Returns the body decoded as JSON."""
+        return json.loads(self.body)
+
+
+class HTTPService:
+    """The HTTP client shared by every outbound integration.
+
+    Connections are pooled and kept alive, with a limit of connections per
+    host so a slow upstream can't use every connection of the pool. Each
+    request has a timeout, the idempotent ones are retried with an
+    exponential backoff and every upstream has its own circuit breaker, so
+    requests to an upstream that keeps failing are refused right away
+    instead of waiting for their timeout.
+
+    :param timeout: The number of seconds before a request is abandoned.
+    :type timeout: float
+    :param connect_timeout: The number of seconds before a connection attempt
+    is abandoned.
+    :type connect_timeout: float
+    :param limit: The maximum number of open connections.
+    :type limit: int
+    :param limit_per_host: The maximum number of open connections per host.
+    :type limit_per_host: int
+    :param retries: The number of times a failed idempotent request is retried.
+    :type retries: int
+    :param backoff: The delay in seconds before the first retry, doubled on
+    every retry.
+    :type backoff: float
+    :param failure_threshold: The number of consecutive failed requests that
+    opens the circuit of an upstream.
+    :type failure_threshold: int
+    :param reset_timeout: The number of seconds the circuit of an upstream
+    stays open.
+    :type reset_timeout: float
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10,
+        connect_timeout: float = 3,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        retries: int = 2,
+        backoff: float = 0.5,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+    ):
+        self.timeout: float = timeout
+        self.connect_timeout: float = connect_timeout
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.retries: int = retries
+        self.backoff: float = backoff
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+
+        self.__session: Optional[ClientSession] = None
+        self.__circuits: Dict[str, CircuitBreaker] = {}
+
+    @property
+    def session(self) -> ClientSession:
+        """Returns the HTTP session, creating it on first use."""
+        if self.__session is None or self.__session.closed:
+            self.__session = ClientSession(
+                connector=TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=300,
+                ),
+                timeout=ClientTimeout(
+                    total=self.timeout, sock_connect=self.connect_timeout
+                ),
+            )
+        return self.__session
+
+    def circuit(self, host: str) -> CircuitBreaker:
+        """Returns the circuit breaker of an upstream.
+
+        :param host: The host of the upstream
+        :type host: str
+
+        :return: The circuit breaker of the upstream
+        :rtype: CircuitBreaker
+        """
+        if (circuit := self.__circuits.get(host)) is None:
+            circuit = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            self.__circuits[host] = circuit
+        return circuit
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        **kwargs,
+    ) -> HTTPResponse:
+        """Sends a request and reads its response.
+
+        A response with an error status is returned like any other, only
+        the connection errors and the timeouts are raised.
+
+        :param method: The HTTP method (ex. ``GET``)
+        :type method: str
+        :param url: The URL of the request
+        :type url: str
+        :param timeout: The timeout of this request, default to the timeout of
+        the service.
+        :type timeout: Optional[float]
+        :param retries: The retries of this request, default to the retries of
+        the service for idempotent methods and to 0 for the others.
+        :type retries: Optional[int]
+        :param kwargs: The other arguments of `aiohttp.ClientSession.request`
+        (ex. ``params``, ``json``, ``headers``)
+
+        :return: The response of the request
+        :rtype: HTTPResponse
+
+        :raises CircuitOpenError: If the upstream keeps failing
+        :raises aiohttp.ClientError: If the upstream can't be reached
+        :raises asyncio.TimeoutError: If the upstream takes too long to answer
+        """
+        method = method.upper()
+        host = urlsplit(url).netloc
+        circuit = self.circuit(host)
+
+        if retries is None:
+            retries = self.retries if method in IDEMPOTENT_METHODS else 0
+        if timeout is not None:
+            kwargs["timeout"] = ClientTimeout(
+                total=timeout, sock_connect=min(timeout, self.connect_timeout)
+            )
+
+        for attempt in range(retries + 1):
+            response: Optional[HTTPResponse] = None
+
+            if not circuit.allow():
+                raise CircuitOpenError(host, circuit.retry_after)
+
+            try:
+                response = await self.__send(method, url, **kwargs)
+            except (ClientError, asyncio.TimeoutError) as e:
+                circuit.record_failure()
+
+                if attempt == retries:
+                    raise
+                warning(f"{method} {url} failed ({e!r}), retrying")
+            else:
+                if response.status < 500:
+                    circuit.record_success()
+                else:
+                    circuit.record_failure()
+
+                if response.status not in RETRY_STATUSES or attempt == retries:
+                    return response
+                warning(f"{method} {url} returned {response.status}, retrying")
+
+            await asyncio.sleep(self.__delay(attempt, response))
+
+    async def get(self, url: str, **kwargs) -> HTTPResponse:
+        """Sends a GET request, see `request`.
+
+        :param url: The URL of the request
+        :type url: str
+
+        :return: The response of the request
+        :rtype: HTTPResponse
+        """
+        return await self.request("GET", url, **kwargs)
+
+    async def close(self):
+        """Closes the HTTP session and its connections."""
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    async def __send(self, method: str, url: str, **kwargs) -> HTTPResponse:
+        async with self.session.request(method, url, **kwargs) as response:
+            return HTTPResponse(
+                response.status, response.headers, await response.read()
+            )
+
+    def __delay(self, attempt: int, response: Optional[HTTPResponse]) -> float:
+        # An upstream asking to slow down is honored, up to the request timeout
+        if response is not None and (
+            retry_after := response.headers.get("Retry-After")
+        ):
+            if retry_after.isdigit():
+                return min(float(retry_after), self.timeout)
+
+        # Full jitter, the retries of concurrent requests are spread out
+        return random.uniform(0, self.backoff * 2**attempt)
@@ -1,9 +1,15 @@
+import asyncio
 import base64
+import hashlib
 import json
 import zlib
+from collections import OrderedDict
 from logging import critical, info
+from typing import Dict, Optional
 
-import requests
+from aiohttp import ClientError
+
+from bot.services.http_service import HTTPService
 
 MERMAID_API = "https://mermaid.ink"
 
@@ -26,52 +32,103 @@ def _encode_diagram(diagram: str) -> str:
     return b64_encoded.replace("+", "-").replace("/", "_").strip("=")
 
 
-def _build_url(diagram: str, type: str = "img") -> str:
+def _build_url(diagram: str, type: str = "img", api_url: str = MERMAID_API) -> str:
     """Build the Mermaid.ink API URL for a given diagram.
 
     :param diagram: Mermaid diagram definition.
     :type diagram: str
+    :param api_url: The base URL of the Mermaid.ink API.
+    :type api_url: str
 
     :returns: Fully constructed Mermaid.ink API URL.
     :rtype: str
     """
     encoded_diagram = _encode_diagram(diagram)
-    return f"{MERMAID_API}/{type}/pako:{encoded_diagram}"
-
-
-def _is_valid_diagram(url: str) -> bool:
-    """Check whether a Mermaid.ink API URL returns a valid response.
-
-    :param url: API URL to validate.
-    :type url: str
-
-    :returns: True if the URL is valid (HTTP 200), otherwise False.
-    :rtype: bool
-    """
-    try:
-        response = requests.get(url, timeout=5)
-        info(f"url: {url} - code: {response.status_code}")
-        return response.status_code == 200
-    except requests.RequestException as e:
-        critical(e)
-        return False
-
-
-def generate_mermaid_diagram(diagram: str) -> str | None:
-    """Generate a valid Mermaid.ink API URL for a given diagram.
-
-    This function encodes the diagram, constructs the API URL,
-    and validates it before returning.
-
-    :param diagram: Mermaid diagram definition.
-    :type diagram: str
-
-    :returns: Valid API URL if available, otherwise ``None``.
-    :rtype: str | None
+    return f"{api_url.rstrip('/')}/{type}/pako:{encoded_diagram}"
+
+
+class MermaidService:
+    """Generates the Mermaid.ink URL of diagrams, validated asynchronously.
+
+    A diagram is validated by requesting its image with the shared
+    `HTTPService`, without blocking the event loop. The result is cached by
+    the hash of the diagram, so a diagram is validated once, and identical
+    diagrams requested at the same time share the same request.
+
+    :param http_service: The HTTP client used to request the diagrams.
+    :type http_service: HTTPService
+    :param api_url: The base URL of the Mermaid.ink API, default to
+    https://mermaid.ink.
+    :type api_url: str
+    :param timeout: The number of seconds before a validation is abandoned.
+    :type timeout: float
+    :param cache_size: The number of diagram results kept in memory.
+    :type cache_size: int
     """
-    diagram_url = _build_url(diagram)
-
-    if _is_valid_diagram(diagram_url):
-        return diagram_url
 
-    return None
+    def __init__(
+        self,
+        http_service: HTTPService,
+        api_url: str = MERMAID_API,
+        timeout: float = 5,
+        cache_size: int = 256,
+    ):
+        self.http_service: HTTPService = http_service
+        self.api_url: str = api_url
+        self.timeout: float = timeout
+        self.cache_size: int = cache_size
+
+        self.__results: OrderedDict[str, Optional[str]] = OrderedDict()
+        self.__in_flight: Dict[str, asyncio.Future] = {}
+
+    async def generate(self, diagram: str) -> Optional[str]:
+        """Generate a valid Mermaid.ink API URL for a given diagram.
+
+        :param diagram: Mermaid diagram definition.
+        :type diagram: str
+
+        :returns: Valid API URL if available, otherwise ``None``.
+        :rtype: Optional[str]
+        """
+        key = hashlib.sha256(diagram.encode()).hexdigest()
+
+        if key in self.__results:
+            self.__results.move_to_end(key)
+            return self.__results[key]
+
+        if (result := self.__in_flight.get(key)) is None:
+            result = asyncio.ensure_future(self.__generate(key, diagram))
+            self.__in_flight[key] = result
+            result.add_done_callback(lambda _: self.__in_flight.pop(key, None))
+
+        # Shielded so a cancelled caller does not cancel the others
+        return await asyncio.shield(result)
+
+    async def __generate(self, key: str, diagram: str) -> Optional[str]:
+        diagram_url = _build_url(diagram, api_url=self.api_url)
+
+        try:
+            # Not retried, the reply waits for the validation and a failed
+            # one is not cached, the next message tries again
+            response = await self.http_service.get(
+                diagram_url, timeout=self.timeout, retries=0
+            )
+            info(f"url: {diagram_url} - code: {response.status}")
+            status = response.status
+        except (ClientError, asyncio.TimeoutError) as e:
+            critical(e)
+            return None
+
+        # Not cached, the diagram may be valid once Mermaid.ink is available
+        if status >= 500:
+            return None
+
+        is_valid = status == 200
+
+        result = diagram_url if is_valid else None
+
+        self.__results[key] = result
+        if len(self.__results) > self.cache_size:
+            self.__results.popitem(last=False)
+
+        return result
@@ -0,0 +1,192 @@
+import asyncio
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import List, Optional, Tuple
+
+from discord import Message
+
+from lib.nlp import NLPResult, analyze_texts, initialize
+
+Batch = List[Tuple[str, asyncio.Future]]
+
+
+class NLPService:
+    """Runs the tokenization and the sentiment analysis of messages in a pool
+    of worker processes, away from the event loop.
+
+    The texts requested during the same iteration of the event loop are sent
+    to the workers together, in batches of at most `batch_size` texts. The
+    result of each message is memoized, so a message is analyzed at most once
+    no matter how many listeners ask for it.
+
+    A worker that dies (ex. killed when out of memory) breaks the whole pool,
+    the batches it was running fail and the pool is replaced by a new one.
+
+    :param workers: The number of worker processes, default to the number of
+    CPUs.
+    :type workers: Optional[int]
+    :param batch_size: The maximum number of texts sent to a worker at once.
+    :type batch_size: int
+    :param cache_size: The number of message results kept in memory.
+    :type cache_size: int
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        batch_size: int = 32,
+        cache_size: int = 1024,
+    ):
+        self.workers: Optional[int] = workers
+        self.batch_size: int = batch_size
+        self.cache_size: int = cache_size
+
+        self.__executor: Optional[ProcessPoolExecutor] = None
+        self.__pending: Batch = []
+        self.__submit_handle: Optional[asyncio.Handle] = None
+        self.__in_flight: int = 0
+        self.__results: OrderedDict[int, asyncio.Future] = OrderedDict()
+
+    @property
+    def queue_depth(self) -> int:
+        """Returns the number of texts waiting for or being analyzed.
+
+        :return: The number of queued texts
+        :rtype: int
+        """
+        return len(self.__pending) + self.__in_flight
+
+    @property
+    def cached_count(self) -> int:
+        """Returns the number of message results kept in memory.
+
+        :return: The number of memoized results
+        :rtype: int
+        """
+        return len(self.__results)
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Returns the pool of worker processes, creating it on first use.
+
+        The workers are spawned rather than forked to not inherit the state
+        (threads, sockets) of the bot.
+        """
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=initialize,
+            )
+        return self.__executor
+
+    async def analyze(self, text: str) -> NLPResult:
+        """Tokenizes and scores a text in the worker pool.
+
+        :param text: The text to analyze
+        :type text: str
+
+        :return: The tokens and the scores of the text
+        :rtype: NLPResult
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+
+        self.__pending.append((text, waiter))
+
+        if len(self.__pending) >= self.batch_size:
+            self.__submit()
+        elif self.__submit_handle is None:
+            self.__submit_handle = loop.call_soon(self.__submit)
+
+        return await waiter
+
+    async def analyze_message(self, message: Message) -> NLPResult:
+        """Returns the analysis of a message, computing it only if the message
+        was not already analyzed.
+
+        :param message: The message to analyze
+        :type message: discord.Message
+
+        :return: The tokens and the scores of the message
+        :rtype: NLPResult
+        """
+        result = self.__results.get(message.id)
+
+        if result is None:
+            result = asyncio.ensure_future(self.analyze(message.content))
+            result.add_done_callback(partial(self.__forget_failure, message.id))
+
+            self.__results[message.id] = result
+
+            if len(self.__results) > self.cache_size:
+                self.__results.popitem(last=False)
+        else:
+            self.__results.move_to_end(message.id)
+
+        # Shielded so a cancelled listener does not cancel the others
+        return await asyncio.shield(result)
+
+    def shutdown(self):
+        """Stops the worker processes."""
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+    def __submit(self):
+        if self.__submit_handle is not None:
+            self.__submit_handle.cancel()
+            self.__submit_handle = None
+
+        batch, self.__pending = self.__pending, []
+        if not batch:
+            return
+
+        self.__in_flight += len(batch)
+
+        loop = asyncio.get_running_loop()
+        texts = [text for text, _ in batch]
+
+        try:
+            executor = self.executor
+            future = loop.run_in_executor(executor, analyze_texts, texts)
+        except BrokenProcessPool:
+            # A worker died since the previous batch
+            self.__reset(executor)
+
+            executor = self.executor
+            future = loop.run_in_executor(executor, analyze_texts, texts)
+
+        future.add_done_callback(partial(self.__resolve, batch, executor))
+
+    def __reset(self, executor: ProcessPoolExecutor):
+        # Only the broken pool is dropped, not one created since
+        if self.__executor is executor:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+    def __resolve(
+        self, batch: Batch, executor: ProcessPoolExecutor, future: asyncio.Future
+    ):
+        self.__in_flight -= len(batch)
+
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            self.__reset(executor)
+
+        for index, (_, waiter) in enumerate(batch):
+            if waiter.done():
+                continue
+
+            if future.cancelled():
+                waiter.cancel()
+            elif exception := future.exception():
+                waiter.set_exception(exception)
+            else:
+                waiter.set_result(future.result()[index])
+
+    def __forget_failure(self, message_id: int, result: asyncio.Future):
+        if result.cancelled() or result.exception():
+            self.__results.pop(message_id, None)
@@ -0,0 +1,24 @@
+"""Add member name to reminders
+
+Revision ID: 3e9b7d2c5a18
+Revises: a8d1e6f4c392
+Create Date: 2026-10-18 21:42:09.318442
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3e9b7d2c5a18"
+down_revision = "a8d1e6f4c392"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("reminders", sa.Column("member_name", sa.String(100), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("reminders", "member_name")
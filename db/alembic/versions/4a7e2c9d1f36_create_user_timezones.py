@@ -0,0 +1,28 @@
+"""Create user timezones
+
+Revision ID: 4a7e2c9d1f36
+Revises: c1d4d61835d9
+Create Date: 2026-10-18 14:03:27.518342
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4a7e2c9d1f36"
+down_revision = "c1d4d61835d9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_timezones",
+        sa.Column("member_id", sa.BigInteger(), primary_key=True, nullable=False),
+        sa.Column("timezone", sa.String(64), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_timezones")
@@ -0,0 +1,53 @@
+"""Create thank events and rollups
+
+Revision ID: 9b3f5e21c7a4
+Revises: 4a7e2c9d1f36
+Create Date: 2026-10-18 15:21:09.347115
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b3f5e21c7a4"
+down_revision = "4a7e2c9d1f36"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "thank_events",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("member_id", sa.BigInteger(), nullable=False),
+        sa.Column("author_id", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_thank_events_member_id_created_at",
+        "thank_events",
+        ["member_id", "created_at"],
+    )
+
+    op.create_table(
+        "thank_rollups",
+        sa.Column("period", sa.Integer(), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("member_id", sa.BigInteger(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("period", "period_start", "member_id"),
+    )
+    op.create_index(
+        "ix_thank_rollups_period_count",
+        "thank_rollups",
+        ["period", "period_start", "count", "member_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_thank_rollups_period_count", table_name="thank_rollups")
+    op.drop_table("thank_rollups")
+    op.drop_index("ix_thank_events_member_id_created_at", table_name="thank_events")
+    op.drop_table("thank_events")
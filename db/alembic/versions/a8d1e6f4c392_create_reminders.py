@@ -0,0 +1,38 @@
+"""Create reminders
+
+Revision ID: a8d1e6f4c392
+Revises: f3c6a9d2e815
+Create Date: 2026-10-18 17:58:26.640119
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a8d1e6f4c392"
+down_revision = "f3c6a9d2e815"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reminders",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("member_id", sa.BigInteger(), nullable=False),
+        sa.Column("channel_id", sa.BigInteger(), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("remind_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_reminders_remind_at", "reminders", ["remind_at"])
+    op.create_index(
+        "ix_reminders_member_id_remind_at", "reminders", ["member_id", "remind_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reminders_member_id_remind_at", table_name="reminders")
+    op.drop_index("ix_reminders_remind_at", table_name="reminders")
+    op.drop_table("reminders")
@@ -0,0 +1,50 @@
+"""Create trigger exclusions
+
+Revision ID: c1d4d61835d9
+Revises: b7c695397ab2
+Create Date: 2026-10-18 10:12:41.221894
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c1d4d61835d9"
+down_revision = "b7c695397ab2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "trigger_exclusions",
+        sa.Column(
+            "trigger_id",
+            sa.Integer(),
+            sa.ForeignKey("triggers.id"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("phrase", sa.String(255), primary_key=True, nullable=False),
+    )
+
+    # Moves the exclusions that used to be hardcoded in the language cog
+    conn = op.get_bind()
+    linus_trigger = conn.execute(
+        sa.text("SELECT id FROM triggers WHERE name = 'Linus'")
+    ).fetchone()
+
+    if linus_trigger:
+        for phrase in ("tech tips", "and lucy"):
+            conn.execute(
+                sa.text(
+                    "INSERT INTO trigger_exclusions (trigger_id, phrase) "
+                    "VALUES (:trigger_id, :phrase)"
+                ),
+                {"trigger_id": linus_trigger.id, "phrase": phrase},
+            )
+
+
+def downgrade() -> None:
+    op.drop_table("trigger_exclusions")
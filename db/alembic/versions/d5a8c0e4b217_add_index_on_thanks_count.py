@@ -0,0 +1,23 @@
+"""Add index on thanks count
+
+Revision ID: d5a8c0e4b217
+Revises: 9b3f5e21c7a4
+Create Date: 2026-10-18 16:02:37.518204
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d5a8c0e4b217"
+down_revision = "9b3f5e21c7a4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_thanks_count", "thanks", ["count"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_thanks_count", table_name="thanks")
@@ -0,0 +1,37 @@
+"""Create command cooldowns
+
+Revision ID: e2b4f7a91c53
+Revises: d5a8c0e4b217
+Create Date: 2026-10-18 16:41:12.904733
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e2b4f7a91c53"
+down_revision = "d5a8c0e4b217"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "command_cooldowns",
+        sa.Column("command", sa.String(length=255), nullable=False),
+        sa.Column("bucket_key", sa.String(length=255), nullable=False),
+        sa.Column("window", sa.Float(), nullable=False),
+        sa.Column("tokens", sa.Integer(), nullable=False),
+        sa.Column("last", sa.Float(), nullable=False),
+        sa.Column("expires_at", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("command", "bucket_key"),
+    )
+    op.create_index(
+        "ix_command_cooldowns_expires_at", "command_cooldowns", ["expires_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_command_cooldowns_expires_at", table_name="command_cooldowns")
+    op.drop_table("command_cooldowns")
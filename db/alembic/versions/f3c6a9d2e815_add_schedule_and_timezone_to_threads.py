@@ -0,0 +1,26 @@
+"""Add schedule and timezone to threads
+
+Revision ID: f3c6a9d2e815
+Revises: e2b4f7a91c53
+Create Date: 2026-10-18 17:20:48.135062
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f3c6a9d2e815"
+down_revision = "e2b4f7a91c53"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("threads", sa.Column("schedule", sa.String(100), nullable=True))
+    op.add_column("threads", sa.Column("timezone", sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("threads", "timezone")
+    op.drop_column("threads", "schedule")
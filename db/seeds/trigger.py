@@ -12,6 +12,9 @@ def seed_database():
     for trigger_word in trigger_words:
         linus_trigger.add_trigger_word(trigger_word)
 
+    for phrase in ["tech tips", "and lucy"]:
+        linus_trigger.add_exclusion(phrase)
+
     Trigger.create(
         name="Grace",
         positive_emoji_code=":blush:",
@@ -0,0 +1,271 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from logging import exception
+from time import monotonic
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+Loader = Callable[[], Awaitable[Optional[V]]]
+
+
+@dataclass
+class CacheStats:
+    """The counters of a cache.
+
+    :param hits: The number of lookups answered with a fresh value.
+    :type hits: int
+    :param stale_hits: The number of lookups answered with a stale value.
+    :type stale_hits: int
+    :param misses: The number of lookups that had to wait for a load.
+    :type misses: int
+    :param loads: The number of calls to a loader.
+    :type loads: int
+    :param load_errors: The number of loads that raised an exception.
+    :type load_errors: int
+    :param evictions: The number of values evicted to make room for others.
+    :type evictions: int
+    """
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    load_errors: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Returns the ratio of lookups answered without waiting for a load."""
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+
+class _Entry(NamedTuple):
+    value: object
+    weight: int
+    fresh_until: float
+    stale_until: float
+
+
+class AsyncCache(Generic[K, V]):
+    """An async-aware TTL and LRU cache.
+
+    Values are fresh for `ttl` seconds, then stale for `stale_ttl` seconds.
+    `get_or_load` answers a stale value right away and refreshes it in the
+    background (stale-while-revalidate), an expired or missing value is
+    loaded once no matter how many callers ask for it at the same time
+    (single-flight).
+
+    A loader returning None means the value doesn't exist (ex. a city that
+    is not found), that answer is cached for `negative_ttl` seconds. The
+    exceptions raised by a loader are never cached.
+
+    The least recently used values are evicted once the total weight of the
+    cache goes over `max_size`, every value weights 1 unless a `weigher` is
+    given (ex. ``len`` for bytes).
+
+    :param ttl: The number of seconds a value is fresh.
+    :type ttl: float
+    :param max_size: The maximum total weight of the values.
+    :type max_size: int
+    :param stale_ttl: The number of seconds an expired value can still be
+    answered while it is refreshed, default to 0 (disabled).
+    :type stale_ttl: float
+    :param negative_ttl: The number of seconds a missing value (None) is
+    cached, default to `ttl`.
+    :type negative_ttl: Optional[float]
+    :param weigher: The function returning the weight of a value.
+    :type weigher: Optional[Callable[[V], int]]
+    :param clock: The function returning the current time in seconds.
+    :type clock: Callable[[], float]
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_size: int = 1024,
+        stale_ttl: float = 0,
+        negative_ttl: Optional[float] = None,
+        weigher: Optional[Callable[[V], int]] = None,
+        clock: Callable[[], float] = monotonic,
+    ):
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+        self.stale_ttl: float = stale_ttl
+        self.negative_ttl: float = ttl if negative_ttl is None else negative_ttl
+        self.weigher: Optional[Callable[[V], int]] = weigher
+        self.clock: Callable[[], float] = clock
+        self.stats: CacheStats = CacheStats()
+
+        self.__entries: OrderedDict[K, _Entry] = OrderedDict()
+        self.__weight: int = 0
+        self.__loading: Dict[K, asyncio.Future] = {}
+        self.__refreshes: Set[asyncio.Task] = set()
+
+    @property
+    def weight(self) -> int:
+        """Returns the total weight of the cached values."""
+        return self.__weight
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: K) -> bool:
+        entry = self.__entries.get(key)
+        return entry is not None and self.clock() < entry.fresh_until
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Returns the fresh value of a key, without loading it.
+
+        :param key: The key of the value
+        :type key: K
+        :param default: The value returned if the key is not fresh
+        :type default: Optional[V]
+
+        :return: The value or the default
+        :rtype: Optional[V]
+        """
+        entry = self.__entries.get(key)
+
+        if entry is None or self.clock() >= entry.fresh_until:
+            return default
+
+        self.__entries.move_to_end(key)
+        return entry.value
+
+    def set(self, key: K, value: Optional[V], ttl: Optional[float] = None):
+        """Caches a value, None being cached as a missing value.
+
+        :param key: The key of the value
+        :type key: K
+        :param value: The value to cache
+        :type value: Optional[V]
+        :param ttl: The number of seconds the value is fresh, default to the
+        `ttl` of the cache, or its `negative_ttl` for None.
+        :type ttl: Optional[float]
+        """
+        if ttl is None:
+            ttl = self.ttl if value is not None else self.negative_ttl
+
+        self.invalidate(key)
+
+        if ttl <= 0:
+            return
+
+        weight = 0 if value is None or self.weigher is None else self.weigher(value)
+        weight = max(weight, 1)
+
+        # Larger than the whole cache, caching it would evict everything else
+        if weight > self.max_size:
+            return
+
+        now = self.clock()
+        self.__entries[key] = _Entry(
+            value, weight, now + ttl, now + ttl + self.stale_ttl
+        )
+        self.__weight += weight
+
+        self.__evict()
+
+    def invalidate(self, key: K):
+        """Removes the value of a key.
+
+        :param key: The key of the value
+        :type key: K
+        """
+        if (entry := self.__entries.pop(key, None)) is not None:
+            self.__weight -= entry.weight
+
+    def clear(self):
+        """Removes every value."""
+        self.__entries.clear()
+        self.__weight = 0
+
+    async def get_or_load(self, key: K, loader: Loader) -> Optional[V]:
+        """Returns the value of a key, loading it if it isn't cached.
+
+        :param key: The key of the value
+        :type key: K
+        :param loader: The coroutine function loading the value, returning
+        None if the value doesn't exist.
+        :type loader: Callable[[], Awaitable[Optional[V]]]
+
+        :return: The value or None if it doesn't exist
+        :rtype: Optional[V]
+
+        :raises Exception: The exception raised by the loader
+        """
+        entry = self.__entries.get(key)
+        now = self.clock()
+
+        if entry is not None:
+            if now < entry.fresh_until:
+                self.stats.hits += 1
+                self.__entries.move_to_end(key)
+                return entry.value
+
+            if now < entry.stale_until:
+                self.stats.stale_hits += 1
+                self.__entries.move_to_end(key)
+                self.__refresh(key, loader)
+                return entry.value
+
+            self.invalidate(key)
+
+        self.stats.misses += 1
+
+        # Shielded so a cancelled caller does not cancel the others
+        return await asyncio.shield(self.__load(key, loader))
+
+    def __load(self, key: K, loader: Loader) -> asyncio.Future:
+        if (result := self.__loading.get(key)) is None:
+            result = asyncio.ensure_future(self.__call(key, loader))
+            self.__loading[key] = result
+            result.add_done_callback(lambda _: self.__loading.pop(key, None))
+        return result
+
+    def __refresh(self, key: K, loader: Loader):
+        if key in self.__loading:
+            return
+
+        refresh = self.__load(key, loader)
+        self.__refreshes.add(refresh)
+        refresh.add_done_callback(self.__refreshed)
+
+    def __refreshed(self, refresh: asyncio.Future):
+        self.__refreshes.discard(refresh)
+
+        # Nobody waits for a refresh, its failure would be lost otherwise
+        if not refresh.cancelled() and (error := refresh.exception()):
+            exception("Failed to refresh a cached value", exc_info=error)
+
+    async def __call(self, key: K, loader: Loader) -> Optional[V]:
+        self.stats.loads += 1
+
+        try:
+            value = await loader()
+        except Exception:
+            self.stats.load_errors += 1
+            raise
+
+        self.set(key, value)
+        return value
+
+    def __evict(self):
+        while self.__weight > self.max_size:
+            _, entry = self.__entries.popitem(last=False)
+            self.__weight -= entry.weight
+            self.stats.evictions += 1
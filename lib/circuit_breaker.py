@@ -0,0 +1,92 @@
+from enum import Enum
+from time import monotonic
+from typing import Callable, Optional
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """Stops calling an upstream that keeps failing.
+
+    The circuit opens after `failure_threshold` consecutive failures, every
+    call is then refused for `reset_timeout` seconds. Once the timeout is
+    over, a single trial call is allowed (half-open), it closes the circuit
+    if it succeeds or opens it again if it fails. A trial whose result is
+    never recorded is replaced after another `reset_timeout`.
+
+    :param failure_threshold: The number of consecutive failures that opens
+    the circuit.
+    :type failure_threshold: int
+    :param reset_timeout: The number of seconds the circuit stays open.
+    :type reset_timeout: float
+    :param clock: The function returning the current time in seconds.
+    :type clock: Callable[[], float]
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        clock: Callable[[], float] = monotonic,
+    ):
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+        self.clock: Callable[[], float] = clock
+
+        self.failures: int = 0
+        self.__opened_at: Optional[float] = None
+        self.__trial_at: Optional[float] = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Returns the state of the circuit."""
+        if self.__opened_at is None:
+            return CircuitState.CLOSED
+        if self.clock() - self.__opened_at < self.reset_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    @property
+    def retry_after(self) -> float:
+        """Returns the number of seconds before the circuit is half-open."""
+        if self.__opened_at is None:
+            return 0
+        return max(0.0, self.__opened_at + self.reset_timeout - self.clock())
+
+    def allow(self) -> bool:
+        """Returns true if a call can be made, a half-open circuit allows a
+        single call until its result is recorded.
+
+        :return: True if the call can be made or False
+        :rtype: bool
+        """
+        state = self.state
+
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.OPEN:
+            return False
+
+        now = self.clock()
+        if self.__trial_at is None or now - self.__trial_at >= self.reset_timeout:
+            self.__trial_at = now
+            return True
+        return False
+
+    def record_success(self):
+        """Records a successful call, closing the circuit."""
+        self.failures = 0
+        self.__opened_at = None
+        self.__trial_at = None
+
+    def record_failure(self):
+        """Records a failed call, opening the circuit after too many."""
+        self.failures += 1
+
+        if self.__trial_at is not None or self.failures >= self.failure_threshold:
+            self.__opened_at = self.clock()
+            self.__trial_at = None
@@ -0,0 +1,169 @@
+import heapq
+import time
+from itertools import count
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple
+
+from discord.ext.commands import BucketType, Cooldown, CooldownMapping
+from discord.ext.commands.cooldowns import DynamicCooldownMapping
+
+# The state of a bucket: its key, window, remaining tokens and last use
+CooldownState = Tuple[Any, float, int, float]
+
+
+class PersistentCooldownMapping(CooldownMapping):
+    """A drop-in replacement of discord.py's `CooldownMapping` that can be
+    saved and restored, and evicts the expired buckets in O(log n).
+
+    discord.py scans every bucket of a command on every invocation to delete
+    the expired ones. Here the buckets are kept in a heap ordered by their
+    expiration, only the expired ones at the top of the heap are looked at.
+    A bucket used again after being pushed is pushed back with its new
+    expiration when it reaches the top, so the heap holds about one entry per
+    live bucket and the memory stays bounded by the members who used the
+    command during the cooldown.
+
+    The buckets used since the last save are tracked, so saving only writes
+    what changed.
+    """
+
+    def __init__(self, original: Optional[Cooldown], type: Callable[[Any], Any]):
+        super().__init__(original, type)
+        self._expirations: List[Tuple[float, int, Any]] = []
+        self._counter = count()
+        self._changed: Set[Any] = set()
+
+    @classmethod
+    def from_mapping(cls, mapping: CooldownMapping) -> "PersistentCooldownMapping":
+        """Creates a persistent mapping with the cooldown of another mapping.
+
+        :param mapping: The mapping to replace.
+        :type mapping: CooldownMapping
+
+        :return: The persistent mapping.
+        :rtype: PersistentCooldownMapping
+        """
+        persistent_mapping = cls(mapping._cooldown, mapping.type)
+
+        for key, bucket in mapping._cache.items():
+            persistent_mapping._add(key, bucket)
+        return persistent_mapping
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def copy(self) -> "PersistentCooldownMapping":
+        return self.from_mapping(self)
+
+    def _verify_cache_integrity(self, current: Optional[float] = None):
+        current = current or time.time()
+        expirations = self._expirations
+
+        while expirations and expirations[0][0] < current:
+            _, _, key = heapq.heappop(expirations)
+            bucket = self._cache.get(key)
+
+            if bucket is None:
+                continue
+
+            expiration = bucket._last + bucket.per
+
+            if current > expiration:
+                del self._cache[key]
+                self._changed.discard(key)
+            else:
+                heapq.heappush(expirations, (expiration, next(self._counter), key))
+
+    def get_bucket(
+        self, message: Any, current: Optional[float] = None
+    ) -> Optional[Cooldown]:
+        if self._type is BucketType.default:
+            return self._cooldown
+
+        self._verify_cache_integrity(current)
+        key = self._bucket_key(message)
+        bucket = self._cache.get(key)
+
+        if bucket is None:
+            bucket = self.create_bucket(message)
+
+            if bucket is None:
+                return None
+
+            # Its last use is set when the bucket is updated, right after
+            bucket._last = current or time.time()
+            self._add(key, bucket)
+
+        self._changed.add(key)
+        return bucket
+
+    def dump(self, changed_only: bool = False) -> List[CooldownState]:
+        """Returns the state of the live buckets.
+
+        :param changed_only: Only the buckets used since the last dump,
+        default to False.
+        :type changed_only: bool
+
+        :return: The key, window, tokens and last use of each bucket.
+        :rtype: List[CooldownState]
+        """
+        keys = self._changed if changed_only else self._cache.keys()
+        states = []
+
+        for key in keys:
+            if bucket := self._cache.get(key):
+                states.append((key, bucket._window, bucket._tokens, bucket._last))
+
+        self._changed = set()
+        return states
+
+    def restore(self, states: Iterable[CooldownState], current: Optional[float] = None):
+        """Restores the state of buckets, the expired ones are skipped.
+
+        :param states: The key, window, tokens and last use of each bucket.
+        :type states: Iterable[CooldownState]
+        :param current: The current time, default to now.
+        :type current: Optional[float]
+        """
+        if self._cooldown is None:
+            return
+
+        current = current or time.time()
+
+        for key, window, tokens, last in states:
+            if current > last + self._cooldown.per:
+                continue
+
+            bucket = self._cooldown.copy()
+            bucket._window, bucket._tokens, bucket._last = window, tokens, last
+            self._add(key, bucket)
+
+    def _add(self, key: Any, bucket: Cooldown):
+        self._cache[key] = bucket
+        # The counter breaks the ties, keys of different types can't be compared
+        heapq.heappush(
+            self._expirations, (bucket._last + bucket.per, next(self._counter), key)
+        )
+
+
+def make_persistent(mapping: CooldownMapping) -> Optional[PersistentCooldownMapping]:
+    """Returns the persistent version of a per bucket cooldown mapping.
+
+    :param mapping: The cooldown mapping of a command.
+    :type mapping: CooldownMapping
+
+    :return: The persistent mapping, the mapping itself if it is already
+    persistent or None if the command has no (per bucket) or a dynamic
+    cooldown.
+    :rtype: Optional[PersistentCooldownMapping]
+    """
+    if isinstance(mapping, PersistentCooldownMapping):
+        return mapping
+
+    # The cooldown of each bucket is created by a factory, there's no single
+    # cooldown to restore the buckets with
+    if isinstance(mapping, DynamicCooldownMapping):
+        return None
+
+    if not mapping.valid or mapping.type is BucketType.default:
+        return None
+    return PersistentCooldownMapping.from_mapping(mapping)
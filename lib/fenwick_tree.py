@@ -0,0 +1,110 @@
+from typing import Iterable, List
+
+
+class FenwickTree:
+    """A Fenwick (binary indexed) tree of counts indexed from 1.
+
+    Adding to an index and summing the counts of a prefix both take
+    O(log n), which makes it an order statistic over small integers: with
+    one count per value, the prefix sum of a value is the number of values
+    lower or equal to it.
+
+    The tree grows (doubling its size) when an index past its end is added.
+
+    :param size: The initial highest index of the tree.
+    :type size: int
+    """
+
+    def __init__(self, size: int = 1):
+        self.__size: int = 1
+        while self.__size < size:
+            self.__size *= 2
+
+        self.__tree: List[int] = [0] * (self.__size + 1)
+        self.__total: int = 0
+
+    @classmethod
+    def from_indexes(cls, indexes: Iterable[int]) -> "FenwickTree":
+        """Creates a tree counting each of the given indexes once, in O(n).
+
+        :param indexes: The indexes to count, from 1.
+        :type indexes: Iterable[int]
+
+        :return: The tree of the indexes.
+        :rtype: FenwickTree
+        """
+        indexes = list(indexes)
+        fenwick_tree = cls(max(indexes, default=1))
+        tree = fenwick_tree.__tree
+
+        for index in indexes:
+            tree[index] += 1
+
+        for index in range(1, len(tree)):
+            parent = index + (index & -index)
+            if parent < len(tree):
+                tree[parent] += tree[index]
+
+        fenwick_tree.__total = len(indexes)
+        return fenwick_tree
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    @property
+    def total(self) -> int:
+        """Returns the sum of every count.
+
+        :return: The total count.
+        :rtype: int
+        """
+        return self.__total
+
+    def add(self, index: int, delta: int = 1):
+        """Adds to the count of an index.
+
+        :param index: The index, from 1.
+        :type index: int
+        :param delta: The number to add to the count.
+        :type delta: int
+        """
+        if index < 1:
+            raise IndexError("The indexes of a Fenwick tree start at 1.")
+
+        while index > self.__size:
+            self.__grow()
+
+        self.__total += delta
+        tree = self.__tree
+
+        while index <= self.__size:
+            tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, index: int) -> int:
+        """Returns the sum of the counts from 1 to an index, included.
+
+        :param index: The last index of the prefix.
+        :type index: int
+
+        :return: The sum of the counts of the prefix.
+        :rtype: int
+        """
+        if index >= self.__size:
+            return self.__total
+
+        total = 0
+        tree = self.__tree
+
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def __grow(self):
+        # The size is a power of two, the new last node covers the whole tree
+        # and every other new node covers only new (empty) indexes.
+        self.__tree.extend([0] * self.__size)
+        self.__size *= 2
+        self.__tree[self.__size] = self.__total
@@ -0,0 +1,168 @@
+import asyncio
+import heapq
+from datetime import datetime, timedelta, timezone
+from itertools import count
+from logging import exception
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from apscheduler.triggers.base import BaseTrigger
+
+# The longest sleep of the dispatcher, so it catches up with clock changes
+MAX_SLEEP = 3600
+
+
+class HeapScheduler:
+    """Fires many recurring jobs from a single task.
+
+    The next fire time of each job is kept in a min-heap. The dispatcher
+    sleeps until the earliest one, pops every due job, passes their keys to
+    the callback at once and pushes their following fire time back, which
+    makes scheduling and firing a job O(log n) no matter how many jobs there
+    are.
+
+    A job scheduled again or unscheduled leaves its previous entry in the
+    heap, the entry is skipped when it is popped. A job whose fire times
+    were missed (ex. the dispatcher was late) is fired once and its next
+    fire time is the first one after now, like the coalescing of APScheduler.
+
+    :param callback: The coroutine called with the keys of the due jobs.
+    :type callback: Callable[[List[Hashable]], Awaitable[None]]
+    """
+
+    def __init__(self, callback: Callable[[List[Hashable]], Awaitable[None]]):
+        self.callback = callback
+
+        self.__heap: List[Tuple[datetime, int, Hashable]] = []
+        self.__jobs: Dict[Hashable, Tuple[BaseTrigger, datetime, int]] = {}
+        self.__counter = count()
+        self.__changed = asyncio.Event()
+        self.__task: Optional[asyncio.Task] = None
+        self.__callbacks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self.__jobs)
+
+    def schedule(
+        self, key: Hashable, trigger: BaseTrigger, now: Optional[datetime] = None
+    ):
+        """Schedules a job, or reschedules it if it is already scheduled.
+
+        :param key: The key of the job, given to the callback.
+        :type key: Hashable
+        :param trigger: The trigger computing the fire times of the job.
+        :type trigger: BaseTrigger
+        :param now: The current time, default to now.
+        :type now: Optional[datetime]
+        """
+        now = now or datetime.now(timezone.utc)
+        fire_time = trigger.get_next_fire_time(None, now)
+
+        if fire_time is None:
+            self.unschedule(key)
+        else:
+            self.__push(key, trigger, fire_time)
+
+    def unschedule(self, key: Hashable):
+        """Unschedules a job.
+
+        :param key: The key of the job.
+        :type key: Hashable
+        """
+        self.__jobs.pop(key, None)
+
+    def next_fire_time(self, key: Hashable) -> Optional[datetime]:
+        """Returns the next time a job will be fired.
+
+        :param key: The key of the job.
+        :type key: Hashable
+
+        :return: The next fire time or None if the job is not scheduled.
+        :rtype: Optional[datetime]
+        """
+        if job := self.__jobs.get(key):
+            return job[1]
+        return None
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[Hashable]:
+        """Pops the jobs due at the given time and schedules their next fire
+        time.
+
+        :param now: The current time, default to now.
+        :type now: Optional[datetime]
+
+        :return: The keys of the due jobs.
+        :rtype: List[Hashable]
+        """
+        now = now or datetime.now(timezone.utc)
+        heap = self.__heap
+        due = []
+
+        while heap and heap[0][0] <= now:
+            fire_time, entry, key = heapq.heappop(heap)
+            job = self.__jobs.get(key)
+
+            if job is None or job[2] != entry:
+                continue  # Rescheduled or unscheduled
+
+            due.append(key)
+            trigger = job[0]
+
+            next_fire_time = trigger.get_next_fire_time(fire_time, now)
+
+            # Skips the missed fire times instead of popping the job again
+            if next_fire_time is not None and next_fire_time <= now:
+                next_fire_time = trigger.get_next_fire_time(
+                    None, now + timedelta(microseconds=1)
+                )
+
+            if next_fire_time:
+                self.__push(key, trigger, next_fire_time)
+            else:
+                del self.__jobs[key]
+
+        return due
+
+    def start(self):
+        """Starts the dispatcher in the running event loop."""
+        if self.__task is None:
+            self.__task = asyncio.create_task(self.__run())
+
+    def stop(self):
+        """Stops the dispatcher, the jobs stay scheduled."""
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+
+    def __push(self, key: Hashable, trigger: BaseTrigger, fire_time: datetime):
+        entry = next(self.__counter)
+
+        self.__jobs[key] = (trigger, fire_time, entry)
+        heapq.heappush(self.__heap, (fire_time, entry, key))
+
+        if self.__heap[0][1] == entry:
+            self.__changed.set()  # Wakes the dispatcher for an earlier job
+
+    async def __run(self):
+        while True:
+            self.__changed.clear()
+
+            if due := self.pop_due():
+                task = asyncio.create_task(self.__fire(due))
+                self.__callbacks.add(task)
+                task.add_done_callback(self.__callbacks.discard)
+
+            timeout = MAX_SLEEP
+            if self.__heap:
+                delay = self.__heap[0][0] - datetime.now(timezone.utc)
+                timeout = min(max(delay.total_seconds(), 0), MAX_SLEEP)
+
+            try:
+                await asyncio.wait_for(self.__changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def __fire(self, keys: List[Hashable]):
+        try:
+            await self.callback(keys)
+        except Exception:
+            exception(f"Unable to run the scheduled jobs {keys}")
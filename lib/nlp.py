@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from lib.sentiment import SentimentAnalyzer
+from lib.tokenizer import tokenize
+
+# Created once per process by `initialize`, the VADER lexicon is only loaded
+# when the analyzer is created.
+_analyzer: Optional[SentimentAnalyzer] = None
+
+
+@dataclass(frozen=True)
+class NLPResult:
+    """The tokens and the VADER scores of a text.
+
+    :param tokens: The lowercased tokens of the text
+    :type tokens: Tuple[str, ...]
+    :param scores: The VADER scores of the text (neg, neu, pos and compound)
+    :type scores: Dict[str, float]
+    """
+
+    tokens: Tuple[str, ...]
+    scores: Dict[str, float]
+
+    @property
+    def polarity(self) -> int:
+        """Returns the sentiment polarity of the text.
+
+        :returns:
+            -1 iff the text is more negative than positive
+             0 iff the text is neutral
+             1 iff the text is more positive than negative
+        """
+        sv = self.scores
+        if sv["neu"] + sv["pos"] < sv["neg"] or sv["pos"] == 0.0:
+            if sv["neg"] > sv["pos"]:
+                return -1
+            return 0
+        return 1
+
+
+def initialize():
+    """Creates the sentiment analyzer of the current process.
+
+    It is used as the initializer of the NLP worker processes so the lexicon
+    is loaded once per worker instead of once per batch.
+    """
+    global _analyzer
+
+    _analyzer = SentimentAnalyzer()
+
+
+def analyze_texts(texts: Sequence[str]) -> List[NLPResult]:
+    """Tokenizes and scores a batch of texts.
+
+    :param texts: The texts to analyze
+    :type texts: Sequence[str]
+
+    :return: The result of each text, in the same order
+    :rtype: List[NLPResult]
+    """
+    if _analyzer is None:
+        initialize()
+
+    scores = _analyzer.polarity_scores_batch(texts)
+
+    return [
+        NLPResult(
+            tokens=tuple(token.lower() for token in tokenize(text)),
+            scores=text_scores,
+        )
+        for text, text_scores in zip(texts, scores)
+    ]
@@ -0,0 +1,153 @@
+import string
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+from nltk.sentiment.vader import SentimentIntensityAnalyzer, SentiText
+
+PUNCTUATION = string.punctuation
+
+# The scores VADER gives to a text without any word (ex. "", "a ?")
+EMPTY_SCORES = {"neg": 0.0, "neu": 0.0, "pos": 0.0, "compound": 0.0}
+
+# The scores VADER gives to a text without any word of its lexicon
+NEUTRAL_SCORES = {"neg": 0.0, "neu": 1.0, "pos": 0.0, "compound": 0.0}
+
+
+class _SentiText(SentiText):
+    """NLTK's `SentiText` without the mapping of every word combined with
+    every punctuation, which is built for each text only to strip the
+    punctuation around the words.
+
+    A word is stripped when it is an alphanumeric word of more than one
+    character with a punctuation of `PUNC_LIST` either before or after it,
+    exactly like NLTK does.
+    """
+
+    def _words_and_emoticons(self) -> List[str]:
+        punc_list = self.PUNC_LIST
+        words_and_emoticons = []
+
+        for word in self.text.split():
+            if len(word) < 2:
+                continue
+
+            stripped = word.strip(PUNCTUATION)
+
+            if len(stripped) > 1 and stripped != word:
+                start = word.find(stripped)
+                before, after = word[:start], word[start + len(stripped) :]
+
+                if (
+                    bool(before) != bool(after)
+                    and (before or after) in punc_list
+                    and not self.REGEX_REMOVE_PUNCTUATION.search(stripped)
+                ):
+                    word = stripped
+
+            words_and_emoticons.append(word)
+        return words_and_emoticons
+
+
+@lru_cache(maxsize=None)
+def _parse_lexicon(lexicon_file: str) -> Dict[str, float]:
+    lexicon = {}
+
+    for line in lexicon_file.split("\n"):
+        word, measure = line.strip().split("\t")[0:2]
+        lexicon[word] = float(measure)
+    return lexicon
+
+
+class SentimentAnalyzer(SentimentIntensityAnalyzer):
+    """A drop-in replacement of NLTK's `SentimentIntensityAnalyzer` that
+    returns the same scores, faster.
+
+    The lexicon is parsed once per process and shared by every analyzer.
+
+    Most messages do not contain a single word of the VADER lexicon, in which
+    case every word has a valence of zero and the scores are known in advance.
+    Those messages are answered without running the VADER rules, the others
+    go through the rules of NLTK with a cheaper word extraction.
+    """
+
+    def make_lex_dict(self) -> Dict[str, float]:
+        return _parse_lexicon(self.lexicon_file)
+
+    def has_sentiment_words(self, text: str) -> bool:
+        """Returns true if a word of the text could be in the lexicon.
+
+        VADER looks up each whitespace separated word of more than one
+        character, lowercased, either as is or without its surrounding
+        punctuation, so both forms are checked.
+
+        :param text: The text to check
+        :type text: str
+
+        :return: True if the text has to be scored by VADER or False
+        :rtype: bool
+        """
+        lexicon = self.lexicon
+
+        for word in text.lower().split():
+            if word in lexicon or word.strip(PUNCTUATION) in lexicon:
+                return True
+        return False
+
+    def polarity_scores(self, text: str) -> Dict[str, float]:
+        """Returns the VADER scores of a text.
+
+        :param text: The text to score
+        :type text: str
+
+        :return: The neg, neu, pos and compound scores of the text
+        :rtype: Dict[str, float]
+        """
+        if not isinstance(text, str):
+            return super().polarity_scores(text)
+
+        if not any(len(word) > 1 for word in text.split()):
+            return dict(EMPTY_SCORES)
+
+        if not self.has_sentiment_words(text):
+            return dict(NEUTRAL_SCORES)
+
+        return self.__score(text)
+
+    def __score(self, text: str) -> Dict[str, float]:
+        # Same as `SentimentIntensityAnalyzer.polarity_scores` with `_SentiText`
+        sentitext = _SentiText(
+            text, self.constants.PUNC_LIST, self.constants.REGEX_REMOVE_PUNCTUATION
+        )
+        words_and_emoticons = sentitext.words_and_emoticons
+        sentiments = []
+
+        first_index = {}
+        for index, token in enumerate(words_and_emoticons):
+            first_index.setdefault(token, index)
+
+        for item in words_and_emoticons:
+            i = first_index[item]
+            if (
+                i < len(words_and_emoticons) - 1
+                and item.lower() == "kind"
+                and words_and_emoticons[i + 1].lower() == "of"
+            ) or item.lower() in self.constants.BOOSTER_DICT:
+                sentiments.append(0)
+                continue
+
+            sentiments = self.sentiment_valence(0, sentitext, item, i, sentiments)
+
+        sentiments = self._but_check(words_and_emoticons, sentiments)
+
+        return self.score_valence(sentiments, text)
+
+    def polarity_scores_batch(self, texts: Iterable[str]) -> List[Dict[str, float]]:
+        """Returns the VADER scores of each text.
+
+        :param texts: The texts to score
+        :type texts: Iterable[str]
+
+        :return: The scores of each text, in the same order
+        :rtype: List[Dict[str, float]]
+        """
+        return [self.polarity_scores(text) for text in texts]
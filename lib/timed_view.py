@@ -1,29 +1,42 @@
-from asyncio import Task, create_task
-from asyncio import sleep as async_sleep
+import math
+from asyncio import get_running_loop
 from datetime import timedelta
 from typing import Optional
 
 from discord.ui import View
 
+from lib.timer_wheel import Timer, TimerWheel
+
 
 class TimedView(View):
     """A discord.ui.View class that implements a timer.
 
-    The view will call an event (`on_time_update`)
-    each seconds until the timer elapsed.
+    The view will call an event (`on_timer_update`)
+    every `update_interval` seconds until the timer elapsed.
     Once the timer elapsed, another event (`on_timer_elapsed`) is called.
 
+    The timers of every view are driven by a single shared `TimerWheel`
+    instead of a task per view. A stopped view stops being updated.
+
     :param seconds: The time in seconds to display the view,
     default to 900 seconds (15 minutes).
-
     :type seconds: int
+    :param update_interval: The number of seconds between two updates,
+    default to 1 second. Views editing a message should use a longer interval
+    to limit the number of edits.
+    :type update_interval: int
     """
 
-    def __init__(self, seconds: int = 900):
+    timer_wheel: TimerWheel = TimerWheel()
+
+    def __init__(self, seconds: int = 900, update_interval: int = 1):
         super().__init__(timeout=None)
 
+        self.__deadline: Optional[float] = None
+        self.__timer: Optional[Timer] = None
+
         self.seconds: int = seconds
-        self.__timer_task: Optional[Task[None]] = None
+        self.update_interval: int = update_interval
 
     @property
     def seconds(self) -> int:
@@ -32,6 +45,9 @@ class TimedView(View):
         :return: The remaining seconds
         :rtype: int
         """
+        if self.__deadline is not None:
+            remaining = self.__deadline - get_running_loop().time()
+            return max(math.ceil(remaining), 0)
         return self.__seconds
 
     @seconds.setter
@@ -47,6 +63,9 @@ class TimedView(View):
 
         self.__seconds = seconds
 
+        if self.__deadline is not None:
+            self.__deadline = get_running_loop().time() + seconds
+
     @property
     def remaining_time(self) -> str:
         """Returns the timer's remaining time in HH:MM:SS.
@@ -57,22 +76,30 @@ class TimedView(View):
         return str(timedelta(seconds=self.seconds))
 
     def start_timer(self):
-        """Starts the view's timer task"""
-        self.__timer_task = create_task(
-            self.__impl_timer_task(), name=f"grace-timed-view-timer-{self.id}"
-        )
+        """Starts the view's timer"""
+        self.__deadline = get_running_loop().time() + self.__seconds
+        self.__timer = self.timer_wheel.schedule(0, self.__on_tick)
 
     def cancel_timer(self):
-        """Cancels the view's timer task"""
-        self.__timer_task.cancel()
+        """Cancels the view's timer"""
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+
+    async def __on_tick(self):
+        if self.is_finished():
+            self.__timer = None
+            return  # Nobody is watching the view anymore
+
+        if self.has_time_elapsed():
+            self.__timer = None
+            await self.on_timer_elapsed()
+            return
 
-    async def __impl_timer_task(self):
-        while not self.has_time_elapsed():
-            await self.on_timer_update()
+        delay = min(self.update_interval, self.__deadline - get_running_loop().time())
+        self.__timer = self.timer_wheel.schedule(delay, self.__on_tick)
 
-            self.__seconds -= 1
-            await async_sleep(1)
-        await self.on_timer_elapsed()
+        await self.on_timer_update()
 
     async def on_timer_update(self):
         """A callback that is called at each timer update.
@@ -0,0 +1,173 @@
+import asyncio
+import inspect
+import math
+from logging import exception
+from typing import Any, Callable, List, Optional, Set
+
+
+class Timer:
+    """A callback scheduled in a `TimerWheel`.
+
+    :param expires: The tick at which the timer fires.
+    :type expires: int
+    :param callback: The function (or coroutine function) called when the
+    timer fires.
+    :type callback: Callable[[], Any]
+    """
+
+    __slots__ = ("expires", "callback", "cancelled")
+
+    def __init__(self, expires: int, callback: Callable[[], Any]):
+        self.expires: int = expires
+        self.callback: Callable[[], Any] = callback
+        self.cancelled: bool = False
+
+    def cancel(self):
+        """Cancels the timer, it is dropped when its slot is reached."""
+        self.cancelled = True
+
+
+class TimerWheel:
+    """A hierarchical timing wheel firing many timers from a single task.
+
+    The timers are placed in the slots of a few wheels of increasing span
+    (ex. 60 slots of 1 second, then 60 slots of 1 minute, then 60 slots of
+    1 hour). Each tick fires the current slot of the first wheel, and when a
+    wheel completes a turn the next slot of the wheel above is cascaded into
+    the wheels below. Scheduling and cancelling a timer are O(1) no matter
+    how many timers there are. Timers further than the last wheel are
+    cascaded until they fit.
+
+    The task only runs while there are timers scheduled, without a running
+    event loop the wheel has to be advanced manually with `advance`.
+
+    :param resolution: The duration of a tick in seconds, default to 1.
+    :type resolution: float
+    :param slots: The number of slots of each wheel, default to 60.
+    :type slots: int
+    :param levels: The number of wheels, default to 3.
+    :type levels: int
+    """
+
+    def __init__(self, resolution: float = 1.0, slots: int = 60, levels: int = 3):
+        self.resolution: float = resolution
+        self.slots: int = slots
+
+        self.__spans: List[int] = [slots**level for level in range(levels)]
+        self.__wheels: List[List[List[Timer]]] = [
+            [[] for _ in range(slots)] for _ in range(levels)
+        ]
+        self.__tick: int = 0
+        self.__count: int = 0
+        self.__task: Optional[asyncio.Task] = None
+        self.__callbacks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        """Returns the number of scheduled timers, cancelled ones included
+        until their slot is reached."""
+        return self.__count
+
+    @property
+    def tick(self) -> int:
+        """Returns the number of ticks since the wheel was created.
+
+        :return: The current tick
+        :rtype: int
+        """
+        return self.__tick
+
+    def schedule(self, delay: float, callback: Callable[[], Any]) -> Timer:
+        """Schedules a callback after a delay, rounded up to the next tick.
+
+        The callback can be a coroutine function, in which case it runs in
+        its own task so a slow callback doesn't delay the other timers.
+
+        :param delay: The delay in seconds.
+        :type delay: float
+        :param callback: The function to call.
+        :type callback: Callable[[], Any]
+
+        :return: The timer, which can be cancelled.
+        :rtype: Timer
+        """
+        ticks = max(math.ceil(delay / self.resolution), 1)
+        timer = Timer(self.__tick + ticks, callback)
+
+        self.__insert(timer)
+        self.__count += 1
+
+        if self.__task is None:
+            try:
+                self.__task = asyncio.get_running_loop().create_task(self.__run())
+            except RuntimeError:
+                pass  # Advanced manually without an event loop
+
+        return timer
+
+    def advance(self):
+        """Moves the wheel forward by one tick and fires the due timers."""
+        self.__tick += 1
+        tick = self.__tick
+
+        for level in range(len(self.__wheels) - 1, 0, -1):
+            span = self.__spans[level]
+
+            if tick % span == 0:
+                slot = self.__wheels[level][(tick // span) % self.slots]
+                timers, slot[:] = list(slot), []
+
+                for timer in timers:
+                    self.__insert(timer)
+
+        slot = self.__wheels[0][tick % self.slots]
+        timers, slot[:] = list(slot), []
+
+        for timer in timers:
+            self.__count -= 1
+
+            if not timer.cancelled:
+                self.__fire(timer)
+
+    def __insert(self, timer: Timer):
+        delta = max(timer.expires - self.__tick, 0)
+
+        for level, span in enumerate(self.__spans):
+            if delta < span * self.slots:
+                index = (timer.expires // span) % self.slots
+                self.__wheels[level][index].append(timer)
+                return
+
+        # Further than the last wheel, cascaded again in its last slot
+        span = self.__spans[-1]
+        index = ((self.__tick // span) + self.slots - 1) % self.slots
+        self.__wheels[-1][index].append(timer)
+
+    def __fire(self, timer: Timer):
+        try:
+            result = timer.callback()
+        except Exception:
+            exception("Timer callback failed")
+            return
+
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self.__callbacks.add(task)
+            task.add_done_callback(self.__on_callback_done)
+
+    def __on_callback_done(self, task: asyncio.Task):
+        self.__callbacks.discard(task)
+
+        if not task.cancelled() and task.exception():
+            exception("Timer callback failed", exc_info=task.exception())
+
+    async def __run(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
+        try:
+            while self.__count:
+                next_tick += self.resolution
+                await asyncio.sleep(max(next_tick - loop.time(), 0))
+                self.advance()
+        finally:
+            self.__task = None
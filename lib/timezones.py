@@ -0,0 +1,211 @@
+import json
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import pytz
+
+TIMEZONE_INDEX_PATH = Path(__file__).parent.parent / "assets" / "timezones.json"
+
+# Abbreviations only used before this date are ignored by the generated index
+ABBREVIATIONS_SINCE = datetime(2000, 1, 1)
+
+# Mapping for common timezone abbreviations to their UTC offsets.
+#
+# These are matched in any case and take precedence over the generated index
+# (see `generate_timezone_index`), which means they also settle the ambiguous
+# abbreviations (ex. "ist" is used in India, Ireland and Israel).
+timezone_abbreviations = {
+    # North American
+    "pst": "America/Los_Angeles",  # Pacific Standard Time
+    "pdt": "America/Los_Angeles",  # Pacific Daylight Time
+    "mst": "America/Denver",  # Mountain Standard Time
+    "mdt": "America/Denver",  # Mountain Daylight Time
+    "cst": "America/Chicago",  # Central Standard Time
+    "cdt": "America/Chicago",  # Central Daylight Time
+    "est": "America/New_York",  # Eastern Standard Time
+    "edt": "America/New_York",  # Eastern Daylight Time
+    # International standards
+    "gmt": "Etc/GMT",  # Greenwich Mean Time
+    "utc": "UTC",  # Coordinated Universal Time
+    # European
+    "bst": "Europe/London",  # British Summer Time
+    "cet": "Europe/Paris",  # Central European Time
+    "cest": "Europe/Paris",  # Central European Summer Time
+    # Asia-Pacific
+    "hkt": "Asia/Hong_Kong",  # Hong Kong Time
+    "ist": "Asia/Kolkata",  # India Standard Time
+    "jst": "Asia/Tokyo",  # Japan Standard Time
+    "aest": "Australia/Sydney",  # Australian Eastern Standard Time
+    "aedt": "Australia/Sydney",  # Australian Eastern Daylight Time
+}
+
+
+@dataclass(frozen=True)
+class TimezoneMention:
+    """A timezone abbreviation found in a text.
+
+    :param abbreviation: The abbreviation as written in the text
+    :type abbreviation: str
+    :param zone: The name of the timezone of the abbreviation
+    :type zone: str
+    :param start: The index of the abbreviation in the text
+    :type start: int
+    :param end: The index following the abbreviation in the text
+    :type end: int
+    """
+
+    abbreviation: str
+    zone: str
+    start: int
+    end: int
+
+
+def _abbreviation_offsets(zone: str) -> Dict[str, Tuple[timedelta, bool]]:
+    """Returns the abbreviations used by a zone since `ABBREVIATIONS_SINCE`
+    with their most recent UTC offset and whether it is a daylight saving
+    abbreviation.
+    """
+    tz = pytz.timezone(zone)
+
+    if not hasattr(tz, "_transition_info"):
+        return {tz.tzname(None): (tz.utcoffset(None), False)}
+
+    offsets = {}
+    transition_times = tz._utc_transition_times[1:] + [datetime.max]
+
+    for until, (offset, dst, abbreviation) in zip(
+        transition_times, tz._transition_info
+    ):
+        if until >= ABBREVIATIONS_SINCE:
+            offsets[abbreviation] = (offset, bool(dst))
+    return offsets
+
+
+def generate_timezone_index() -> Dict[str, str]:
+    """Generates the abbreviation to timezone index from the pytz database.
+
+    Only alphabetic abbreviations are kept (ex. "+03" and "LMT" are not). An
+    abbreviation used with different UTC offsets (ex. "CST" in Chicago and in
+    Shanghai) is ambiguous and left out, those are settled by
+    `timezone_abbreviations`. When several zones use the same abbreviation,
+    a zone that uses it all year is preferred, then the first in
+    alphabetical order.
+
+    :return: The timezone of each abbreviation
+    :rtype: Dict[str, str]
+    """
+    offsets: Dict[str, Set[timedelta]] = {}
+    candidates: Dict[str, List[Tuple[bool, str]]] = {}
+
+    for zone in sorted(pytz.common_timezones):
+        zone_offsets = _abbreviation_offsets(zone)
+        is_fixed = len(zone_offsets) == 1
+
+        for abbreviation, (offset, _) in zone_offsets.items():
+            if not abbreviation.isalpha() or abbreviation == "LMT":
+                continue
+
+            offsets.setdefault(abbreviation, set()).add(offset)
+            candidates.setdefault(abbreviation, []).append((not is_fixed, zone))
+
+    return {
+        abbreviation: min(candidates[abbreviation])[1]
+        for abbreviation in sorted(candidates)
+        if len(offsets[abbreviation]) == 1
+    }
+
+
+def write_timezone_index(path: Path = TIMEZONE_INDEX_PATH):
+    """Generates and writes the timezone index as compact JSON.
+
+    The zones are stored once and the abbreviations refer to them by index.
+
+    :param path: The path of the index file
+    :type path: Path
+    """
+    index = generate_timezone_index()
+    zones = sorted(set(index.values()))
+
+    data = {
+        "zones": zones,
+        "abbreviations": {abbr: zones.index(zone) for abbr, zone in index.items()},
+    }
+
+    with open(path, "w") as file:
+        json.dump(data, file, separators=(",", ":"))
+        file.write("\n")
+
+
+@lru_cache(maxsize=None)
+def load_timezone_index() -> Dict[str, str]:
+    """Loads the generated timezone index, once, on first use.
+
+    :return: The timezone of each abbreviation, keyed in their original case
+    :rtype: Dict[str, str]
+    """
+    try:
+        with open(TIMEZONE_INDEX_PATH) as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return {}
+
+    zones = data["zones"]
+    return {abbr: zones[zone] for abbr, zone in data["abbreviations"].items()}
+
+
+@lru_cache(maxsize=None)
+def _abbreviation_pattern() -> re.Pattern:
+    """Returns the pattern of the words that could be an abbreviation.
+
+    Words are looked up in the tables instead of matching every abbreviation
+    in a regex, so the cost of a text doesn't grow with the tables.
+    """
+    lengths = [len(abbr) for abbr in timezone_abbreviations]
+    lengths += [len(abbr) for abbr in load_timezone_index()]
+
+    return re.compile(rf"\b[A-Za-z]{{{min(lengths)},{max(lengths)}}}\b")
+
+
+def get_timezone(abbreviation: str) -> Optional[str]:
+    """Returns the timezone of an abbreviation.
+
+    The abbreviations of `timezone_abbreviations` are matched in any case, the
+    generated ones only as written in the database (ex. "EAT" but not "eat").
+
+    :param abbreviation: The abbreviation as written
+    :type abbreviation: str
+
+    :return: The name of the timezone or None
+    :rtype: Optional[str]
+    """
+    if zone := timezone_abbreviations.get(abbreviation.lower()):
+        return zone
+    return load_timezone_index().get(abbreviation)
+
+
+def find_timezones(text: str) -> List[TimezoneMention]:
+    """Returns every known timezone abbreviation found in a text.
+
+    :param text: The text to search.
+    :type text: str
+
+    :return: The abbreviations in order of appearance.
+    :rtype: List[TimezoneMention]
+    """
+    mentions = []
+
+    for match in _abbreviation_pattern().finditer(text):
+        if zone := get_timezone(match.group()):
+            mentions.append(TimezoneMention(match.group(), zone, *match.span()))
+    return mentions
+
+
+if __name__ == "__main__":
+    write_timezone_index()
+    print(
+        f"{len(load_timezone_index())} abbreviations written to {TIMEZONE_INDEX_PATH}"
+    )
@@ -0,0 +1,71 @@
+import re
+from functools import lru_cache
+from typing import Tuple
+
+from nltk.tokenize import TweetTokenizer
+
+# Texts made only of these characters can't contain a URL, an emoticon, an
+# HTML entity, a number or a phone number, the only tokens they can produce
+# are words, usernames, hashtags and single punctuations.
+FAST_TEXT_PATTERN = re.compile(r"[A-Za-z \t\n\r\f\v.,!?'\"()*#@\-]*")
+
+# Unless a dot is followed by a letter or a dash (URL, domain or email) or by
+# another dot (ellipsis).
+UNSAFE_DOT_PATTERN = re.compile(r"\.(?:[A-Za-z\-]|\s*\.)")
+
+# Same as NLTK, sequences of 4 or more of the same punctuation are shortened.
+HANG_PATTERN = re.compile(r"([^A-Za-z])\1{3,}")
+
+# Same order as NLTK: usernames, hashtags, words with apostrophes or dashes,
+# words and everything else that isn't whitespace.
+FAST_TOKEN_PATTERN = re.compile(
+    r"""
+    @\w+
+    |
+    \#+\w+[\w'\-]*\w
+    |
+    [A-Za-z](?:[A-Za-z]|['\-])+[A-Za-z]
+    |
+    \w+
+    |
+    \S
+    """,
+    re.VERBOSE,
+)
+
+_tweet_tokenizer = TweetTokenizer()
+
+
+def is_fast_text(text: str) -> bool:
+    """Returns true if the text can be tokenized without NLTK.
+
+    :param text: The text to check
+    :type text: str
+
+    :return: True if the fast path gives the same tokens as NLTK or False
+    :rtype: bool
+    """
+    return (
+        text.isascii()
+        and FAST_TEXT_PATTERN.fullmatch(text) is not None
+        and UNSAFE_DOT_PATTERN.search(text) is None
+    )
+
+
+@lru_cache(maxsize=4096)
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Splits a text into the same tokens as NLTK's `TweetTokenizer`.
+
+    Plain ASCII texts (words, usernames, hashtags and punctuation) are
+    tokenized with a single small regex, the others are given to NLTK. The
+    tokens of the most recent texts are cached.
+
+    :param text: The text to tokenize
+    :type text: str
+
+    :return: The tokens of the text, case preserved
+    :rtype: Tuple[str, ...]
+    """
+    if is_fast_text(text):
+        return tuple(FAST_TOKEN_PATTERN.findall(HANG_PATTERN.sub(r"\1\1\1", text)))
+    return tuple(_tweet_tokenizer.tokenize(text))
@@ -0,0 +1,84 @@
+import time
+from unittest.mock import MagicMock
+
+from discord.ext.commands import (
+    BucketType,
+    Cooldown,
+    command,
+    cooldown,
+    dynamic_cooldown,
+)
+from discord.utils import utcnow
+
+from bot.classes.cooldown_store import CooldownStore
+from bot.models.command_cooldown import CommandCooldown
+from lib.cooldowns import PersistentCooldownMapping
+
+MEMBER_ID = 823178343943897089
+
+
+def make_command():
+    @command(name="cooldown_store_test")
+    @cooldown(1, 3600, BucketType.user)
+    async def cooldown_store_test(ctx):
+        pass
+
+    return cooldown_store_test
+
+
+def test_cooldowns_survive_a_restart():
+    """Verify that a flushed cooldown is restored by a new store."""
+    ctx = MagicMock(author=MagicMock(id=MEMBER_ID))
+    ctx.message.edited_at = None
+    ctx.message.created_at = utcnow()
+
+    try:
+        store = CooldownStore()
+        cmd = make_command()
+        store.attach(cmd)
+
+        assert isinstance(cmd._buckets, PersistentCooldownMapping)
+        cmd._buckets.update_rate_limit(ctx)
+        store.flush()
+
+        restarted_store = CooldownStore()
+        restarted_cmd = make_command()
+        restarted_store.attach(restarted_cmd)
+
+        assert len(restarted_store) == 1
+        assert restarted_cmd.is_on_cooldown(ctx)
+    finally:
+        for saved in CommandCooldown.where(command="cooldown_store_test").all():
+            saved.delete()
+
+
+def test_dynamic_cooldowns_are_not_replaced():
+    """Verify that a command with a dynamic cooldown can still be invoked."""
+    ctx = MagicMock(author=MagicMock(id=MEMBER_ID))
+    ctx.message.edited_at = None
+    ctx.message.created_at = utcnow()
+
+    @command(name="dynamic_cooldown_store_test")
+    @dynamic_cooldown(lambda _: Cooldown(1, 3600), BucketType.user)
+    async def dynamic_cooldown_store_test(ctx):
+        pass
+
+    store = CooldownStore()
+    store.attach(dynamic_cooldown_store_test)
+    dynamic_cooldown_store_test._prepare_cooldowns(ctx)
+
+    assert not isinstance(
+        dynamic_cooldown_store_test._buckets, PersistentCooldownMapping
+    )
+    assert dynamic_cooldown_store_test.is_on_cooldown(ctx)
+    assert len(store) == 0
+
+
+def test_flush_deletes_expired_cooldowns():
+    """Verify that the expired cooldowns are deleted from the database."""
+    CommandCooldown.save("cooldown_store_test", 60, [(MEMBER_ID, 0.0, 0, 0.0)])
+
+    CooldownStore().flush()
+
+    assert CommandCooldown.where(command="cooldown_store_test").count() == 0
+    assert CommandCooldown.where(CommandCooldown.expires_at < time.time()).count() == 0
@@ -0,0 +1,90 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from discord import NotFound
+
+from bot.classes.display_names import DisplayNames
+
+
+def build_user(name: str) -> MagicMock:
+    user = MagicMock()
+    user.display_name = name
+    return user
+
+
+@pytest.fixture
+def bot():
+    bot = MagicMock()
+    bot.get_user.return_value = None
+    bot.fetches = 0
+    bot.running = 0
+    bot.max_running = 0
+
+    async def fetch_user(user_id):
+        bot.fetches += 1
+        bot.running += 1
+        bot.max_running = max(bot.max_running, bot.running)
+        await asyncio.sleep(0.01)
+        bot.running -= 1
+
+        if user_id == 0:
+            raise NotFound(MagicMock(status=404), "Unknown User")
+        return build_user(f"user {user_id}")
+
+    bot.fetch_user = fetch_user
+    return bot
+
+
+@pytest.mark.asyncio
+async def test_members_are_resolved_from_the_cache(bot):
+    """Verify that cached members are not fetched."""
+    guild = MagicMock()
+    guild.get_member.side_effect = lambda user_id: build_user("Grace")
+
+    names = await DisplayNames(bot).resolve([1, 2], guild)
+
+    assert names == {1: "Grace", 2: "Grace"}
+    assert bot.fetches == 0
+
+
+@pytest.mark.asyncio
+async def test_missing_users_are_fetched_concurrently(bot):
+    """Verify that missing users are fetched once, a few at a time."""
+    display_names = DisplayNames(bot, max_concurrency=3)
+
+    names = await display_names.resolve(range(1, 11))
+    assert names[7] == "user 7"
+    assert bot.fetches == 10
+    assert 1 < bot.max_running <= 3
+
+    await display_names.resolve(range(1, 11))
+    assert bot.fetches == 10
+
+
+@pytest.mark.asyncio
+async def test_fetched_names_expire(bot):
+    """Verify that fetched names are fetched again after their TTL."""
+    display_names = DisplayNames(bot, ttl=0)
+
+    await display_names.resolve([1])
+    await display_names.resolve([1])
+
+    assert bot.fetches == 2
+
+
+@pytest.mark.asyncio
+async def test_fetched_names_are_bounded(bot):
+    """Verify that only the most recent fetched names are kept."""
+    display_names = DisplayNames(bot, max_size=2)
+
+    await display_names.resolve([1, 2, 3])
+
+    assert display_names.get_cached(1) is None
+    assert display_names.get_cached(3) == "user 3"
+
+
+@pytest.mark.asyncio
+async def test_unknown_users(bot):
+    """Verify that users that can't be fetched have a placeholder name."""
+    assert await DisplayNames(bot).resolve([0]) == {0: "Unknown user"}
@@ -0,0 +1,68 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bot.classes.message_analysis import CodeBlock, MessageAnalysis
+
+
+def build_analysis(content: str) -> MessageAnalysis:
+    message = MagicMock()
+    message.content = content
+    return MessageAnalysis(message)
+
+
+def test_tokens_are_lowercased():
+    """Verify that the tokens of the message are lowercased."""
+    analysis = build_analysis("Linus Torvalds wrote #Linux")
+
+    assert analysis.tokens == ("linus", "torvalds", "wrote", "#linux")
+    assert analysis.token_set == {"linus", "torvalds", "wrote", "#linux"}
+
+
+def test_tokens_are_computed_once():
+    """Verify that the message is tokenized only once per analysis."""
+    analysis = build_analysis("Hello world")
+
+    with patch("bot.classes.message_analysis.tokenize") as tokenize:
+        tokenize.return_value = ("Hello", "world")
+
+        assert analysis.tokens == analysis.tokens
+        assert analysis.token_set == {"hello", "world"}
+        tokenize.assert_called_once_with("Hello world")
+
+
+def test_analysis_is_immutable():
+    """Verify that an analysis cannot be modified by a listener."""
+    analysis = build_analysis("Hello world")
+
+    with pytest.raises(AttributeError):
+        analysis.message = MagicMock()
+
+
+def test_code_blocks():
+    """Verify that every fenced code block is extracted with its language."""
+    analysis = build_analysis(
+        "```py\nprint('hi')\n``` and ```mermaid\ngraph TD;\nA-->B\n```"
+    )
+
+    assert analysis.code_blocks == (
+        CodeBlock("py", "print('hi')\n"),
+        CodeBlock("mermaid", "graph TD;\nA-->B\n"),
+    )
+    assert analysis.code_block("mermaid").code == "graph TD;\nA-->B\n"
+    assert analysis.code_block("rust") is None
+
+
+def test_subreddits():
+    """Verify that subreddit mentions are extracted but not links."""
+    analysis = build_analysis("Check r/python and https://reddit.com/r/rust")
+
+    assert analysis.subreddits == {"python"}
+
+
+def test_timezones():
+    """Verify that timezone abbreviations are matched on whole words only."""
+    timezones = build_analysis("Let's meet at 5PM EST").timezones
+
+    assert [timezone.abbreviation for timezone in timezones] == ["EST"]
+    assert build_analysis("This is a test").timezones == ()
@@ -0,0 +1,34 @@
+from datetime import date, datetime
+
+import pytest
+
+from bot.classes.period import Period
+
+
+def test_week_starts_on_monday():
+    """Test that a week starts on the Monday before the given time"""
+    assert Period.WEEK.start(datetime(2024, 5, 1, 12)) == date(2024, 4, 29)
+    assert Period.WEEK.previous_start(date(2024, 4, 29)) == date(2024, 4, 22)
+
+
+def test_month_starts_on_first_day():
+    """Test that a month starts on its first day"""
+    assert Period.MONTH.start(datetime(2024, 3, 31)) == date(2024, 3, 1)
+    assert Period.MONTH.previous_start(date(2024, 3, 1)) == date(2024, 2, 1)
+    assert Period.MONTH.previous_start(date(2024, 1, 1)) == date(2023, 12, 1)
+
+
+def test_all_has_no_start():
+    """Test that the whole history has no start"""
+    assert Period.ALL.start(datetime(2024, 5, 1)) is None
+    assert Period.ALL.previous_start(date(2024, 5, 1)) is None
+
+
+def test_period_from_name():
+    """Test that a period is found by its name, in any case"""
+    assert Period("week") is Period.WEEK
+    assert Period("Month") is Period.MONTH
+    assert Period(1) is Period.WEEK
+
+    with pytest.raises(ValueError):
+        Period("year")
@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from bot.classes.pun_cooldowns import PunCooldowns
+from bot.models.extensions.language.pun import Pun
+
+NOW = datetime(2025, 10, 10, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def pun():
+    pun = Pun.create(text="Time flies like an arrow. Fruit flies like a banana.")
+
+    yield pun
+    pun.delete()
+
+
+@pytest.fixture
+def pun_cooldowns():
+    return PunCooldowns(cooldown_minutes=60)
+
+
+def test_can_invoke_never_invoked_pun(pun_cooldowns, pun):
+    """Verify that a pun that was never invoked can be invoked."""
+    assert pun_cooldowns.can_invoke(pun.id, NOW)
+
+
+def test_cannot_invoke_during_cooldown(pun_cooldowns, pun):
+    """Verify that a pun cannot be invoked until its cooldown is over."""
+    pun_cooldowns.invoke(pun.id, NOW)
+
+    assert not pun_cooldowns.can_invoke(pun.id, NOW + timedelta(minutes=30))
+    assert pun_cooldowns.can_invoke(pun.id, NOW + timedelta(minutes=61))
+
+
+def test_update_cooldown(pun_cooldowns, pun):
+    """Verify that changing the cooldown applies to the next checks."""
+    pun_cooldowns.invoke(pun.id, NOW)
+    pun_cooldowns.cooldown_minutes = 10
+
+    assert pun_cooldowns.can_invoke(pun.id, NOW + timedelta(minutes=11))
+
+
+def test_flush_and_load(pun_cooldowns, pun):
+    """Verify that invocations are written in batch and restored on load."""
+    pun_cooldowns.invoke(pun.id, NOW)
+    assert pun_cooldowns.unsaved_count == 1
+
+    pun_cooldowns.flush()
+    assert pun_cooldowns.unsaved_count == 0
+
+    restored_cooldowns = PunCooldowns()
+    restored_cooldowns.load()
+
+    assert not restored_cooldowns.can_invoke(pun.id, NOW + timedelta(minutes=30))
@@ -0,0 +1,50 @@
+import pytest
+
+from bot.classes.pun_index import PunIndex
+from bot.models.extensions.language.pun import Pun
+
+
+@pytest.fixture
+def pun():
+    pun = Pun.create(text="I'm reading a book about anti-gravity.")
+    pun.add_pun_word("gravity", ":apple:")
+    pun.add_pun_word("book", ":book:")
+
+    yield pun
+    pun.delete()
+
+
+@pytest.fixture
+def pun_index(pun):
+    pun_index = PunIndex()
+    pun_index.load()
+    return pun_index
+
+
+def test_match_pun_words(pun_index, pun):
+    """Verify that a pun is matched once even if many of its words match."""
+    pun_words, puns = pun_index.match({"a", "gravity", "book"})
+
+    assert sorted(pun_word.word for pun_word in pun_words) == ["book", "gravity"]
+    assert [p.id for p in puns] == [pun.id]
+
+
+def test_no_match(pun_index):
+    """Verify that nothing is matched when no pun word is in the tokens."""
+    assert pun_index.match({"hello", "world"}) == ([], [])
+
+
+def test_add_and_remove_pun_word(pun_index, pun):
+    """Verify that the index is updated when pun words are added or removed."""
+    pun_index.add_pun_word(pun.add_pun_word("Newton", ":apple:"))
+    assert pun_index.match({"newton"})[1][0].id == pun.id
+
+    pun_index.remove_pun_word(pun.id, "Newton")
+    assert pun_index.match({"newton"}) == ([], [])
+
+
+def test_remove_pun(pun_index, pun):
+    """Verify that removing a pun removes all of its words from the index."""
+    pun_index.remove_pun(pun.id)
+
+    assert pun_index.match({"gravity", "book"}) == ([], [])
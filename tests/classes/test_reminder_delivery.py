@@ -0,0 +1,51 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bot.classes.reminder_delivery import ReminderDelivery
+
+
+def reminders(channel_id, count):
+    return [MagicMock(channel_id=channel_id) for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_reminders_are_grouped_per_channel():
+    """Verify that the reminders are sent at most 10 per message."""
+    send = AsyncMock()
+    delivery = ReminderDelivery(send, delay=0.01)
+
+    await delivery.deliver(reminders(1, 12) + reminders(2, 3))
+
+    batches = sorted((call.args[0], len(call.args[1])) for call in send.await_args_list)
+    assert batches == [(1, 2), (1, 10), (2, 3)]
+
+
+@pytest.mark.asyncio
+async def test_reminders_due_within_the_delay_are_grouped():
+    """Verify that the reminders of separate batches are sent together."""
+    send = AsyncMock()
+    delivery = ReminderDelivery(send, delay=0.05)
+
+    async def deliver_later():
+        await asyncio.sleep(0.01)
+        await delivery.deliver(reminders(1, 2))
+
+    await asyncio.gather(delivery.deliver(reminders(1, 3)), deliver_later())
+
+    send.assert_awaited_once()
+    assert len(send.await_args.args[1]) == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_does_not_stop_the_others():
+    """Verify that a batch failing to be sent is skipped."""
+    send = AsyncMock(side_effect=[Exception("Oops"), None])
+    delivery = ReminderDelivery(send, delay=0, max_batch=1)
+    batch = reminders(1, 2)
+
+    sent = await delivery.deliver(batch)
+
+    assert send.await_count == 2
+    assert sent == [batch[1]]
@@ -0,0 +1,102 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from bot.classes.reminder_scheduler import ReminderScheduler
+from bot.models.extensions.reminder import Reminder
+
+MEMBER_ID = 823178343943897092
+NOW = datetime.now(timezone.utc)
+
+
+def create_reminder(delta: timedelta) -> Reminder:
+    return Reminder.create(
+        member_id=MEMBER_ID, channel_id=1, message="Reminder", remind_at=NOW + delta
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_reminders():
+    yield
+
+    Reminder.delete_all(reminder.id for reminder in Reminder.pending(MEMBER_ID, 100))
+
+
+async def noop(_):
+    pass
+
+
+def test_only_the_window_is_loaded():
+    """Verify that the later reminders are loaded with their window."""
+    create_reminder(timedelta(minutes=-1))
+    create_reminder(timedelta(minutes=5))
+    create_reminder(timedelta(hours=3))
+
+    reminder_scheduler = ReminderScheduler(noop, window=timedelta(minutes=10))
+    reminder_scheduler.load_window(NOW)
+
+    assert len(reminder_scheduler) == 2
+
+    reminder_scheduler.load_window(NOW + timedelta(hours=3))
+    assert len(reminder_scheduler) == 3
+
+
+def test_add_outside_the_window():
+    """Verify that a new reminder is only scheduled if due in the window."""
+    reminder_scheduler = ReminderScheduler(noop, window=timedelta(minutes=10))
+    reminder_scheduler.load_window(NOW)
+
+    reminder_scheduler.add(create_reminder(timedelta(minutes=5)))
+    reminder_scheduler.add(create_reminder(timedelta(days=1)))
+
+    assert len(reminder_scheduler) == 1
+
+
+@pytest.mark.asyncio
+async def test_overdue_reminders_are_sent_on_start():
+    """Verify that the reminders due during a restart are sent and deleted."""
+    overdue = create_reminder(timedelta(minutes=-1))
+    cancelled = create_reminder(timedelta(minutes=-1))
+    delivered = asyncio.Queue()
+
+    async def deliver(reminders):
+        await delivered.put([reminder.id for reminder in reminders])
+        return reminders
+
+    reminder_scheduler = ReminderScheduler(deliver)
+    reminder_scheduler.start()
+
+    try:
+        reminder_scheduler.remove(cancelled)
+        cancelled.delete()
+
+        assert await asyncio.wait_for(delivered.get(), 1) == [overdue.id]
+    finally:
+        reminder_scheduler.stop()
+
+    await asyncio.sleep(0)
+    assert Reminder.pending(MEMBER_ID) == []
+
+
+@pytest.mark.asyncio
+async def test_unsent_reminders_are_kept():
+    """Verify that only the reminders that were sent are deleted."""
+    sent = create_reminder(timedelta(minutes=-2))
+    unsent = create_reminder(timedelta(minutes=-1))
+    delivered = asyncio.Event()
+
+    async def deliver(reminders):
+        delivered.set()
+        return [reminder for reminder in reminders if reminder.id == sent.id]
+
+    reminder_scheduler = ReminderScheduler(deliver)
+    reminder_scheduler.start()
+
+    try:
+        await asyncio.wait_for(delivered.wait(), 1)
+    finally:
+        reminder_scheduler.stop()
+
+    await asyncio.sleep(0)
+    assert [reminder.id for reminder in Reminder.pending(MEMBER_ID)] == [unsent.id]
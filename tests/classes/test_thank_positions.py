@@ -0,0 +1,42 @@
+from bot.classes.thank_positions import ThankPositions
+from bot.models.extensions.thank import Thank
+
+HELPER_ID = 381004230475726852
+
+
+def test_positions():
+    """Verify that members with the same count share the same position."""
+    positions = ThankPositions()
+    positions.update({1: 5, 2: 3, 3: 5, 4: 1})
+
+    assert len(positions) == 4
+    assert positions.get(1) == positions.get(3) == 1
+    assert positions.get(2) == 3
+    assert positions.get(4) == 4
+    assert positions.get(5) is None
+
+
+def test_update_moves_member():
+    """Verify that a new count replaces the previous one."""
+    positions = ThankPositions()
+    positions.update({1: 2, 2: 3})
+    positions.update({1: 4})
+
+    assert len(positions) == 2
+    assert positions.get(1) == 1
+    assert positions.get(2) == 2
+
+
+def test_load():
+    """Verify that the positions are loaded from the database."""
+    Thank.increment(HELPER_ID)
+
+    try:
+        positions = ThankPositions()
+        positions.load()
+
+        expected = Thank.where(Thank.count > 1).count() + 1
+        assert positions.get(HELPER_ID) == expected
+        assert len(positions) == Thank.where(Thank.count > 0).count()
+    finally:
+        Thank.find_by(member_id=HELPER_ID).delete()
@@ -0,0 +1,80 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from discord import NotFound
+from discord import Thread as DiscordThread
+
+from bot.classes.thread_states import ThreadStates
+
+
+def discord_thread(thread_id, archived=False, locked=False):
+    thread = MagicMock(spec=DiscordThread)
+    thread.id = thread_id
+    thread.archived = archived
+    thread.locked = locked
+    return thread
+
+
+@pytest.fixture
+def bot():
+    bot = MagicMock()
+    bot.get_channel.return_value = None
+    bot.fetch_channel = AsyncMock()
+    return bot
+
+
+@pytest.mark.asyncio
+async def test_resolve_from_events(bot):
+    """Verify that the states received from events are not fetched."""
+    thread_states = ThreadStates(bot)
+    thread_states.set(discord_thread(1))
+    thread_states.set(discord_thread(2, archived=True))
+
+    assert await thread_states.resolve([1, 2]) == {1: True, 2: False}
+    bot.fetch_channel.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_resolve_from_gateway_cache(bot):
+    """Verify that the threads in the gateway cache are not fetched."""
+    bot.get_channel.return_value = discord_thread(1, locked=True)
+
+    assert await ThreadStates(bot).resolve([1]) == {1: False}
+    bot.fetch_channel.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_resolve_fetches_concurrently(bot):
+    """Verify that the unknown threads are fetched at most n at once."""
+    running = 0
+    max_running = 0
+
+    async def fetch_channel(thread_id):
+        nonlocal running, max_running
+
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+        return discord_thread(thread_id)
+
+    bot.fetch_channel.side_effect = fetch_channel
+    thread_states = ThreadStates(bot, max_concurrency=3)
+
+    states = await thread_states.resolve(range(10))
+
+    assert all(states.values())
+    assert max_running == 3
+
+    await thread_states.resolve(range(10))
+    assert bot.fetch_channel.await_count == 10
+
+
+@pytest.mark.asyncio
+async def test_deleted_threads_are_closed(bot):
+    """Verify that threads that can't be fetched are considered closed."""
+    bot.fetch_channel.side_effect = NotFound(MagicMock(status=404), "Not found")
+
+    assert await ThreadStates(bot).resolve([1]) == {1: False}
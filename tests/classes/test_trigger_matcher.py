@@ -0,0 +1,54 @@
+import pytest
+
+from bot.classes.trigger_matcher import TriggerMatcher
+from bot.models.extensions.language.trigger import Trigger
+
+
+@pytest.fixture(scope="module")
+def trigger_matcher():
+    tux_trigger = Trigger.create(
+        name="Tux",
+        positive_emoji_code=":penguin:",
+        negative_emoji_code=":pouting_face:",
+    )
+    tux_trigger.add_trigger_word("tux")
+    tux_trigger.add_trigger_word("kernel")
+    tux_trigger.add_exclusion("panic attack")
+
+    ferris_trigger = Trigger.create(
+        name="Ferris",
+        positive_emoji_code=":crab:",
+        negative_emoji_code=":crab:",
+    )
+    ferris_trigger.add_trigger_word("ferris")
+
+    trigger_matcher = TriggerMatcher()
+    trigger_matcher.load()
+
+    return trigger_matcher
+
+
+def test_match_triggers(trigger_matcher):
+    """Verify that every trigger is matched in a single pass."""
+    triggers = trigger_matcher.match(("tux", "and", "kernel", "meet", "ferris"))
+
+    assert [trigger.name for trigger in triggers] == ["Tux", "Ferris"]
+
+
+def test_match_excluded_phrase(trigger_matcher):
+    """Verify that a trigger word followed by an excluded phrase is ignored."""
+    assert trigger_matcher.match(("a", "kernel", "panic", "attack")) == []
+    assert trigger_matcher.match(("kernel", "panic")) != []
+
+
+def test_match_excluded_and_included_words(trigger_matcher):
+    """Verify that a trigger is matched if any of its words is not excluded."""
+    triggers = trigger_matcher.match(("kernel", "panic", "attack", "and", "tux"))
+
+    assert [trigger.name for trigger in triggers] == ["Tux"]
+
+
+def test_get_trigger(trigger_matcher):
+    """Verify that a compiled trigger can be retrieved by its name."""
+    assert trigger_matcher.get("Tux").positive_emoji == "🐧"
+    assert trigger_matcher.get("Beastie") is None
@@ -0,0 +1,45 @@
+import pytest
+
+from bot.classes.user_timezones import UserTimezones
+from bot.models.extensions.user_timezone import UserTimezone
+
+MEMBER_ID = 823178343943897088
+
+
+@pytest.fixture
+def user_timezone():
+    user_timezone = UserTimezone.set_timezone(MEMBER_ID, "America/Toronto")
+
+    yield user_timezone
+    if user_timezone := UserTimezone.find(MEMBER_ID):
+        user_timezone.delete()
+
+
+def test_set_timezone_updates_existing_row(user_timezone):
+    """Verify that setting a timezone twice updates the member's row."""
+    UserTimezone.set_timezone(MEMBER_ID, "Europe/Paris")
+
+    assert UserTimezone.where(member_id=MEMBER_ID).count() == 1
+    assert UserTimezone.find(MEMBER_ID).timezone == "Europe/Paris"
+
+
+def test_load(user_timezone):
+    """Verify that the timezones are loaded from the database."""
+    user_timezones = UserTimezones()
+    user_timezones.load()
+
+    assert user_timezones.get(MEMBER_ID) == "America/Toronto"
+    assert user_timezones.get(1) is None
+
+
+def test_set_and_remove():
+    """Verify that the map is updated without the database."""
+    user_timezones = UserTimezones()
+
+    user_timezones.set(1, "Asia/Tokyo")
+    user_timezones.set(2, "".join(["Asia/", "Tokyo"]))
+    assert user_timezones.get(1) is user_timezones.get(2)
+
+    user_timezones.remove(1)
+    assert user_timezones.get(1) is None
+    assert len(user_timezones) == 1
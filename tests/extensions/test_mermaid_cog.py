@@ -0,0 +1,78 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bot.classes.message_analysis import MessageAnalysis
+from bot.extensions.mermaid_cog import MermaidCog
+
+
+@pytest.fixture
+def mock_bot():
+    """Create a mock Discord bot instance."""
+    bot = MagicMock()
+    bot.app.config.get = MagicMock(return_value="http://127.0.0.1")
+    bot.get_context = AsyncMock(return_value=MagicMock(command=None, reply=AsyncMock()))
+    return bot
+
+
+@pytest.fixture
+def mermaid_cog(mock_bot):
+    """Instantiate the MermaidCog with a mock bot."""
+    mermaid_cog = MermaidCog(mock_bot, edit_delay=0.02)
+    mermaid_cog.generate_diagram_embed = AsyncMock(return_value=MagicMock())
+    return mermaid_cog
+
+
+def message(content: str, message_id: int = 1) -> MagicMock:
+    return MagicMock(id=message_id, content=content)
+
+
+@pytest.mark.asyncio
+async def test_edits_are_debounced(mermaid_cog):
+    """Verify that only the last of quick edits is rendered."""
+    first = message("```mermaid\ngraph TD;\nA-->B\n```")
+    second = message("```mermaid\ngraph TD;\nA-->C\n```")
+    third = message("```mermaid\ngraph TD;\nA-->D\n```")
+
+    await mermaid_cog.on_message_edit(first, second)
+    await mermaid_cog.on_message_edit(second, third)
+    await asyncio.sleep(0.05)
+
+    mermaid_cog.generate_diagram_embed.assert_awaited_once_with("graph TD;\nA-->D")
+    assert mermaid_cog.pending_edits == {}
+
+
+@pytest.mark.asyncio
+async def test_unchanged_diagram_is_not_rendered(mermaid_cog):
+    """Verify that editing the text around a diagram does not render it."""
+    before = message("```mermaid\ngraph TD;\nA-->B\n```")
+    after = message("Look at this:\n```mermaid\ngraph TD;\nA-->B\n```")
+
+    await mermaid_cog.on_message_edit(before, after)
+    await asyncio.sleep(0.05)
+
+    mermaid_cog.generate_diagram_embed.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_messages_without_diagram_are_not_parsed(mermaid_cog, mock_bot):
+    """Verify that messages without a mermaid fence skip the command parsing."""
+    for content in ("hello", "```py\nprint('mermaid')\n```", "```mermaid```"):
+        analysis = MessageAnalysis(message(content))
+        await mermaid_cog.on_message_analysis(analysis)
+
+    mock_bot.get_context.assert_not_awaited()
+    mermaid_cog.generate_diagram_embed.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_diagram_is_rendered(mermaid_cog, mock_bot):
+    """Verify that a message with a mermaid block is rendered."""
+    diagram = message("Look:\n```mermaid\ngraph TD;\nA-->B\n```")
+    diagram.reference = None
+
+    await mermaid_cog.on_message_analysis(MessageAnalysis(diagram))
+
+    mock_bot.get_context.assert_awaited_once_with(diagram)
+    mermaid_cog.generate_diagram_embed.assert_awaited_once_with("graph TD;\nA-->B")
@@ -6,8 +6,12 @@ from freezegun import freeze_time
 from unittest.mock import MagicMock, AsyncMock
 from discord import Embed
 from bot.extensions.reminder_cog import ReminderCog
+from bot.models.extensions.reminder import Reminder
 from dateutil.tz import tzlocal
 
+MEMBER_ID = 823178343943897090
+CHANNEL_ID = 823178343943897091
+
 
 @pytest.fixture
 def mock_bot():
@@ -22,7 +26,9 @@ def mock_bot():
 @pytest.fixture
 def reminder_cog(mock_bot):
     """Instantiate the ReminderCog with a mock bot."""
-    return ReminderCog(mock_bot)
+    yield ReminderCog(mock_bot)
+
+    Reminder.delete_all(reminder.id for reminder in Reminder.pending(MEMBER_ID))
 
 
 @pytest.mark.parametrize(
@@ -92,7 +98,9 @@ async def test_reminder_valid_input(reminder_cog, timer):
     """Verify that reminder works with valid input."""
     with freeze_time("2025-02-20 12:00:01"):
         ctx = AsyncMock()
+        ctx.author.id = MEMBER_ID
         ctx.author.display_name = "Astra Al-Maarifa"
+        ctx.channel.id = CHANNEL_ID
 
         message = "Time for a break!"
         await reminder_cog.reminder.callback(
@@ -111,14 +119,11 @@ async def test_reminder_valid_input(reminder_cog, timer):
         assert "You will be reminded on" in sent_Embed.description
         assert sent_Embed.author.name == ctx.author.display_name
 
-        reminder_cog.bot.scheduler.add_job.assert_called_once()
-        _, kwargs = reminder_cog.bot.scheduler.add_job.call_args
-        assert kwargs["args"][0] == ctx
-        assert kwargs["args"][1] == message
-        assert kwargs["id"].startswith(
-            f"reminder_{ctx.author.id}_{datetime.now().timestamp()}"
-        )
-        assert kwargs["run_date"] >= datetime.now(tz=tzlocal())
+        reminder = Reminder.pending(MEMBER_ID)[-1]
+        assert reminder.member_name == ctx.author.display_name
+        assert reminder.channel_id == CHANNEL_ID
+        assert reminder.message == message
+        assert reminder.remind_at_utc >= datetime.now(tz=tzlocal())
 
 
 @pytest.mark.asyncio
@@ -137,6 +142,7 @@ async def test_reminder_valid_input(reminder_cog, timer):
 async def test_reminder_invalid_input(reminder_cog, timer):
     """Verify that reminder fails with invalid input."""
     ctx = AsyncMock()
+    ctx.author.id = MEMBER_ID
 
     message = "Time for a break!"
     await reminder_cog.reminder.callback(
@@ -149,4 +155,80 @@ async def test_reminder_invalid_input(reminder_cog, timer):
     ctx.send.assert_awaited_once()
     args, _ = ctx.send.call_args
     assert "Invalid time format" in args[0]
-    reminder_cog.bot.scheduler.add_job.assert_not_called()
+    assert Reminder.pending(MEMBER_ID) == []
+
+
+@pytest.mark.asyncio
+async def test_list_and_cancel_reminders(reminder_cog):
+    """Verify that a member lists and cancels their own reminders."""
+    reminder = Reminder.create(
+        member_id=MEMBER_ID,
+        channel_id=CHANNEL_ID,
+        message="Stretch",
+        remind_at=datetime.now(tz=tzlocal()) + timedelta(hours=1),
+    )
+
+    ctx = AsyncMock()
+    ctx.author.id = MEMBER_ID
+    ctx.author.display_name = "Astra Al-Maarifa"
+
+    await reminder_cog.list_reminders.callback(reminder_cog, ctx)
+
+    embed = ctx.send.call_args.kwargs["embed"]
+    assert embed.fields[0].name.startswith(f"[{reminder.id}]")
+    assert embed.fields[0].value == "Stretch"
+
+    ctx.author.id = MEMBER_ID + 1
+    await reminder_cog.cancel_reminder.callback(reminder_cog, ctx, reminder.id)
+    assert "not found" in ctx.send.call_args.args[0]
+
+    ctx.author.id = MEMBER_ID
+    await reminder_cog.cancel_reminder.callback(reminder_cog, ctx, reminder.id)
+    assert Reminder.find(reminder.id) is None
+
+
+@pytest.mark.asyncio
+async def test_send_reminder_batch(reminder_cog, mock_bot):
+    """Verify that the reminders of a channel are sent in a single message."""
+    channel = MagicMock()
+    channel.send = AsyncMock()
+    mock_bot.get_channel.return_value = channel
+    mock_bot.get_user.return_value = None
+
+    batch = [
+        Reminder(member_id=MEMBER_ID, channel_id=CHANNEL_ID, message="One"),
+        Reminder(member_id=MEMBER_ID, channel_id=CHANNEL_ID, message="Two"),
+    ]
+
+    await reminder_cog.send_reminder_batch(CHANNEL_ID, batch)
+
+    channel.send.assert_awaited_once()
+    args, kwargs = channel.send.await_args
+    assert args[0] == f"<@{MEMBER_ID}>"
+    assert [embed.description for embed in kwargs["embeds"]] == ["One", "Two"]
+    assert kwargs["file"].filename == "stopwatch.png"
+
+
+@pytest.mark.asyncio
+async def test_send_reminder_batch_uncached_member(reminder_cog, mock_bot):
+    """Verify that a member missing from the cache doesn't get an empty author."""
+    channel = MagicMock()
+    channel.send = AsyncMock()
+    mock_bot.get_channel.return_value = channel
+    mock_bot.get_user.return_value = None
+
+    batch = [
+        Reminder(
+            member_id=MEMBER_ID,
+            member_name="Astra Al-Maarifa",
+            channel_id=CHANNEL_ID,
+            message="One",
+        ),
+        Reminder(member_id=MEMBER_ID, channel_id=CHANNEL_ID, message="Two"),
+    ]
+
+    await reminder_cog.send_reminder_batch(CHANNEL_ID, batch)
+
+    embeds = channel.send.await_args.kwargs["embeds"]
+    assert embeds[0].author.name == "Astra Al-Maarifa"
+    assert embeds[1].author.name is None
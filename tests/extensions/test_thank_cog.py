@@ -0,0 +1,159 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from discord.ext.commands import BadArgument
+from discord.ext.commands.view import StringView
+from freezegun import freeze_time
+
+from bot.classes.period import Period
+from bot.extensions.thank_cog import ThankCog, format_position_change
+from bot.models.extensions.thank import Thank
+from bot.models.extensions.thank_event import ThankEvent
+from bot.models.extensions.thank_rollup import ThankRollup
+
+HELPER_ID = 381004230475726851
+
+
+@pytest.fixture
+def mock_bot():
+    """Create a mock Discord bot instance."""
+    bot = MagicMock()
+    bot.default_color = 0xFFFFFF
+    bot.get_user.return_value = None
+    bot.fetch_user = AsyncMock(return_value=MagicMock(display_name="Helper"))
+    return bot
+
+
+@pytest.fixture
+def thank_cog(mock_bot):
+    """Instantiate the ThankCog with a mock bot."""
+    return ThankCog(mock_bot)
+
+
+@pytest.fixture
+def helper():
+    Thank.increment(HELPER_ID)
+
+    yield HELPER_ID
+
+    for model in (Thank, ThankEvent, ThankRollup):
+        for record in model.where(member_id=HELPER_ID).all():
+            record.delete()
+
+
+@pytest.fixture
+def ctx():
+    ctx = MagicMock()
+    ctx.guild = None
+    ctx.reply = AsyncMock()
+    return ctx
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_is_cached(thank_cog, ctx, helper, mock_bot):
+    """Verify that the leaderboard is rendered once until the thanks change."""
+    await thank_cog.thank_leaderboard.callback(thank_cog, ctx, top=50)
+    await thank_cog.thank_leaderboard.callback(thank_cog, ctx, top=50)
+
+    first_embed = ctx.reply.call_args_list[0].kwargs["embed"]
+    second_embed = ctx.reply.call_args_list[1].kwargs["embed"]
+
+    assert first_embed is second_embed
+    assert "**Helper**" in first_embed.description
+    assert mock_bot.fetch_user.await_count <= 1
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_size_is_limited(thank_cog, ctx, helper):
+    """Verify that a large top shares the cached leaderboard of the largest."""
+    await thank_cog.thank_leaderboard.callback(thank_cog, ctx, top=30)
+    await thank_cog.thank_leaderboard.callback(thank_cog, ctx, top=1000)
+
+    first_embed = ctx.reply.call_args_list[0].kwargs["embed"]
+    second_embed = ctx.reply.call_args_list[1].kwargs["embed"]
+
+    assert first_embed is second_embed
+    assert first_embed.title == "Helpers Leaderboard Top 25"
+    assert len(thank_cog.leaderboards) == 1
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_is_rendered_when_thanks_change(thank_cog, ctx, helper):
+    """Verify that the leaderboard is rendered again after a thank."""
+    await thank_cog.thank_leaderboard.callback(thank_cog, ctx, top=50)
+    Thank.increment(helper)
+    await thank_cog.thank_leaderboard.callback(thank_cog, ctx, top=50)
+
+    first_embed = ctx.reply.call_args_list[0].kwargs["embed"]
+    second_embed = ctx.reply.call_args_list[1].kwargs["embed"]
+
+    assert first_embed is not second_embed
+    assert "with 2 thank(s)" in second_embed.description
+
+
+@pytest.mark.asyncio
+async def test_weekly_leaderboard(thank_cog, ctx, helper):
+    """Verify that the weekly leaderboard shows the thanks of the week."""
+    await thank_cog.thank_leaderboard.callback(
+        thank_cog, ctx, top=50, period=Period.WEEK
+    )
+
+    embed = ctx.reply.call_args.kwargs["embed"]
+
+    assert embed.title == "Helpers Leaderboard Top 25 (Week)"
+    assert "**Helper** with 1 thank(s) (new)" in embed.description
+
+
+@pytest.mark.asyncio
+async def test_weekly_leaderboard_changes_with_the_week(thank_cog, ctx, helper):
+    """Verify that a new week shows a new leaderboard without new thanks."""
+    Thank.increment(helper, time=datetime(2024, 5, 1, tzinfo=timezone.utc))
+
+    with freeze_time("2024-05-05"):
+        await thank_cog.thank_leaderboard.callback(
+            thank_cog, ctx, top=50, period=Period.WEEK
+        )
+    with freeze_time("2024-05-06"):
+        await thank_cog.thank_leaderboard.callback(
+            thank_cog, ctx, top=50, period=Period.WEEK
+        )
+
+    assert "**Helper**" in ctx.reply.call_args_list[0].kwargs["embed"].description
+    assert ctx.reply.call_args_list[1].args == ("No helpers found.",)
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_period_from_prefix_command(thank_cog, ctx):
+    """Verify that the period of a prefix command is given by its name."""
+    ctx.interaction = None
+    ctx.view = StringView("10 week")
+    await thank_cog.thank_leaderboard._parse_arguments(ctx)
+
+    assert ctx.args[-2:] == [10, Period.WEEK]
+
+    ctx.view = StringView("10 year")
+    with pytest.raises(BadArgument):
+        await thank_cog.thank_leaderboard._parse_arguments(ctx)
+
+
+def test_format_position_change():
+    """Verify the change of position since the previous period."""
+    assert format_position_change(1, None) == "new"
+    assert format_position_change(1, 3) == "▲2"
+    assert format_position_change(4, 3) == "▼1"
+    assert format_position_change(2, 2) == "="
+
+
+@pytest.mark.asyncio
+async def test_rank_shows_position(thank_cog, ctx, helper):
+    """Verify that the rank shows the position of the member."""
+    thank_cog.cog_load()
+    ctx.author.id = helper
+
+    await thank_cog.send_author_rank(ctx)
+
+    embed = ctx.reply.call_args.kwargs["embed"]
+    position = thank_cog.positions.get(helper)
+
+    assert f"Your position is: **#{position:,}** of" in embed.description
@@ -3,6 +3,7 @@ import pytest
 from bot.extensions.threads_cog import ThreadsCog
 from unittest.mock import AsyncMock, MagicMock
 from bot.models.extensions.thread import Thread
+from bot.classes.recurrence import Recurrence
 
 
 @pytest.fixture
@@ -28,10 +29,11 @@ def dummy_modal(monkeypatch):
     called_args = {}
 
     class DummyModal:
-        def __init__(self, recurrence, reminder=None, thread=None):
+        def __init__(self, recurrence, reminder=None, thread=None, **kwargs):
             called_args["recurrence"] = recurrence
             called_args["reminder"] = reminder
             called_args["thread"] = thread
+            called_args.update(kwargs)
 
     monkeypatch.setattr("bot.extensions.threads_cog.ThreadModal", DummyModal)
 
@@ -214,3 +216,88 @@ async def test_cog_unload_removes_jobs(threads_cog, mock_bot):
     mock_bot.scheduler.remove_job.assert_any_call(job1.id)
     mock_bot.scheduler.remove_job.assert_any_call(job2.id)
     assert mock_bot.scheduler.remove_job.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_post_threads_continues_after_failure(threads_cog):
+    """Test that a thread failing to be posted does not stop the others."""
+    threads = [MagicMock(id=1), MagicMock(id=2), MagicMock(id=3)]
+    threads_cog.post_thread = AsyncMock(side_effect=[None, Exception("Oops"), None])
+
+    await threads_cog.post_threads(threads)
+
+    assert threads_cog.post_thread.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_schedule_thread(threads_cog):
+    """Test that a thread is scheduled with its own schedule and timezone."""
+    thread = Thread.create(
+        title="Scheduled Thread",
+        content="This is a scheduled thread.",
+        recurrence=Recurrence.NONE,
+        daily_reminder=False,
+        schedule="0 9 * * mon-fri",
+        timezone="Europe/Paris",
+    )
+
+    threads_cog.schedule_thread(thread)
+    next_fire_time = threads_cog.thread_scheduler.next_fire_time(thread.id)
+
+    assert (next_fire_time.hour, next_fire_time.minute) == (9, 0)
+    assert next_fire_time.weekday() < 5
+    assert str(next_fire_time.tzinfo) == "Europe/Paris"
+
+    thread.update(schedule=None)
+    threads_cog.schedule_thread(thread)
+
+    assert threads_cog.thread_scheduler.next_fire_time(thread.id) is None
+
+
+@pytest.mark.asyncio
+async def test_create_with_invalid_schedule(threads_cog):
+    """Test that an invalid schedule is refused before opening the modal."""
+    ctx = MagicMock()
+    ctx.send = AsyncMock()
+    ctx.interaction.response.send_modal = AsyncMock()
+
+    await threads_cog.create.callback(
+        threads_cog,
+        ctx,
+        recurrence=Recurrence.NONE,
+        reminder=False,
+        schedule="every day",
+    )
+
+    ctx.interaction.response.send_modal.assert_not_awaited()
+    assert "Invalid schedule" in ctx.send.await_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_update_keeps_schedule_and_timezone(threads_cog, dummy_modal):
+    """Test that an update without schedule and timezone keeps the thread's."""
+    thread = Thread.create(
+        title="Scheduled Thread",
+        content="This is a scheduled thread.",
+        recurrence=Recurrence.NONE,
+        daily_reminder=False,
+        schedule="0 9 * * mon-fri",
+        timezone="Europe/Paris",
+    )
+    ctx = MagicMock()
+    ctx.interaction.response.send_modal = AsyncMock()
+
+    try:
+        await threads_cog.update.callback(
+            threads_cog,
+            ctx,
+            thread=thread.id,
+            recurrence=Recurrence.WEEKLY,
+            reminder=True,
+        )
+    finally:
+        thread.delete()
+
+    ctx.interaction.response.send_modal.assert_awaited_once()
+    assert dummy_modal["schedule"] == "0 9 * * mon-fri"
+    assert dummy_modal["timezone"] == "Europe/Paris"
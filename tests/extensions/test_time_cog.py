@@ -4,7 +4,9 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 import pytz
 
-from bot.extensions.time_cog import TimeCog
+from bot.classes.message_analysis import MessageAnalysis
+from bot.extensions.time_cog import TimeCog, parse_time, split_time_expressions
+from lib.timezones import get_timezone
 
 
 @pytest.fixture
@@ -19,15 +21,10 @@ def time_cog(mock_bot):
     return TimeCog(mock_bot)
 
 
-def test_build_regex(time_cog):
-    """Test that build regex includes common timezone abbreviations."""
-    pattern = time_cog._build_regex()
-    assert "pst" in pattern
-    assert "est" in pattern
-    assert "utc" in pattern
-    assert "jst" in pattern
-    assert "cet" in pattern
-    assert "hkt" in pattern
+def test_common_timezones():
+    """Test that common timezone abbreviations are known."""
+    for abbreviation in ["pst", "est", "utc", "jst", "cet", "hkt", "AKST", "NZDT"]:
+        assert get_timezone(abbreviation) is not None
 
 
 def test_build_relative_date_today(time_cog):
@@ -44,12 +41,46 @@ def test_build_relative_date_tomorrow(time_cog):
     assert "2025-10-11" in result
 
 
-def test_build_timestamp_with_timezone(time_cog):
+def test_build_timestamps_with_timezone(time_cog):
     """Check that timestamp parsing works."""
-    utc = pytz.UTC
-    result = time_cog._build_timestamp(utc, "2025-10-10 5PM UTC")
-    assert isinstance(result, int)
-    assert result == 1760115600
+    now = datetime(2025, 10, 10, tzinfo=pytz.UTC)
+    result = time_cog._build_timestamps("2025-10-10 5pm utc", now)
+    assert result == [1760115600]
+
+
+def test_build_timestamps_with_multiple_times(time_cog):
+    """Check that every time expression is converted, using the previous date."""
+    now = datetime(2025, 10, 1, tzinfo=pytz.UTC)
+    result = time_cog._build_timestamps("2025-10-10 at 5pm est or 6pm cet", now)
+    assert result == [1760130000, 1760112000]
+
+
+def test_split_time_expressions_whole_words():
+    """Check that abbreviations inside words (ex. "est" in "test") are ignored."""
+    assert split_time_expressions("We test at 5pm CET") == [
+        ("we test at 5pm cet", "Europe/Paris")
+    ]
+    assert split_time_expressions("5pm pst or 8pm est") == [
+        ("5pm pst", "America/Los_Angeles"),
+        ("or 8pm est", "America/New_York"),
+    ]
+
+
+def test_parse_time_is_cached():
+    """Check that a time expression is parsed once per date."""
+    parse_time.cache_clear()
+    default = datetime(2025, 10, 10)
+
+    first = parse_time("at 5pm utc", "UTC", default)
+    second = parse_time("at 5pm utc", "UTC", default)
+
+    assert first is second
+    assert parse_time.cache_info().hits == 1
+
+
+def test_parse_time_without_time():
+    """Check that expressions without a time are not parsed."""
+    assert parse_time("nothing to see in utc", "UTC", datetime(2025, 10, 10)) is None
 
 
 @pytest.mark.asyncio
@@ -60,7 +91,7 @@ async def test_on_message_valid_timestamp(time_cog):
     mock_message.content = "Let's meet at 17:44 JST"
     mock_message.reply = AsyncMock()
 
-    await time_cog.on_message(mock_message)
+    await time_cog.on_message_analysis(MessageAnalysis(mock_message))
 
     mock_message.reply.assert_called_once()
     call_arg = mock_message.reply.call_args[0][0]
@@ -76,10 +107,67 @@ async def test_on_message_valid_timezone(time_cog):
     mock_message.content = "Let's meet tomorrow at 5PM EST"
     mock_message.reply = AsyncMock()
 
-    await time_cog.on_message(mock_message)
+    await time_cog.on_message_analysis(MessageAnalysis(mock_message))
     mock_message.reply.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_on_message_multiple_times(time_cog):
+    """Ensure that every time of a message is converted in a single reply."""
+    mock_message = MagicMock()
+    mock_message.author.bot = False
+    mock_message.content = "2025-10-10 at 5pm EST or 6pm CET"
+    mock_message.reply = AsyncMock()
+
+    await time_cog.on_message_analysis(MessageAnalysis(mock_message))
+
+    mock_message.reply.assert_called_once_with("<t:1760130000:F>\n<t:1760112000:F>")
+
+
+@pytest.mark.asyncio
+async def test_on_message_generated_timezone(time_cog):
+    """Ensure that abbreviations of the generated index are converted."""
+    mock_message = MagicMock()
+    mock_message.author.bot = False
+    mock_message.content = "2025-10-10 at 9am NZDT"
+    mock_message.reply = AsyncMock()
+
+    await time_cog.on_message_analysis(MessageAnalysis(mock_message))
+
+    mock_message.reply.assert_called_once_with("<t:1760040000:F>")
+
+
+@pytest.mark.asyncio
+async def test_on_message_member_timezone(time_cog):
+    """Ensure that times are converted with the timezone of the author."""
+    time_cog.user_timezones.set(42, "Europe/Paris")
+
+    mock_message = MagicMock()
+    mock_message.author.bot = False
+    mock_message.author.id = 42
+    mock_message.content = "2025-10-10 meet at 5pm"
+    mock_message.reply = AsyncMock()
+
+    await time_cog.on_message_analysis(MessageAnalysis(mock_message))
+
+    mock_message.reply.assert_called_once_with("<t:1760108400:F>")
+
+
+@pytest.mark.asyncio
+async def test_ignores_member_timezone_without_time(time_cog):
+    """Ensure that messages without a time are ignored for members with a timezone."""
+    time_cog.user_timezones.set(42, "Europe/Paris")
+
+    mock_message = MagicMock()
+    mock_message.author.bot = False
+    mock_message.author.id = 42
+    mock_message.content = "What are you doing today?"
+    mock_message.reply = AsyncMock()
+
+    await time_cog.on_message_analysis(MessageAnalysis(mock_message))
+    mock_message.reply.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_ignores_on_message_without_timezone(time_cog):
     """Ensure that messages without timezones are not triggered."""
@@ -88,7 +176,7 @@ async def test_ignores_on_message_without_timezone(time_cog):
     mock_message.content = "Let's meet at 5pm"
     mock_message.reply = AsyncMock()
 
-    await time_cog.on_message(mock_message)
+    await time_cog.on_message_analysis(MessageAnalysis(mock_message))
     mock_message.reply.assert_not_called()
 
 
@@ -100,7 +188,7 @@ async def test_on_message_ignores_bot_messages(time_cog):
     mock_message.content = "5pm PST"
     mock_message.reply = AsyncMock()
 
-    await time_cog.on_message(mock_message)
+    await time_cog.on_message_analysis(MessageAnalysis(mock_message))
     mock_message.reply.assert_not_called()
 
 
@@ -112,5 +200,5 @@ async def test_on_message_without_time(time_cog):
     mock_message.content = "What are you doing today?"
     mock_message.reply = AsyncMock()
 
-    await time_cog.on_message(mock_message)
+    await time_cog.on_message_analysis(MessageAnalysis(mock_message))
     mock_message.reply.assert_not_called()
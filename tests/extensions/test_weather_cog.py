@@ -0,0 +1,106 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import ClientError
+
+from bot.extensions.weather_cog import WeatherCog, normalize_city
+from bot.services.http_service import CircuitOpenError, HTTPResponse
+
+MONTREAL = {"name": "Montreal", "coord": {"lon": -73.59, "lat": 45.51}}
+
+
+def response(status: int, body: bytes = b"{}") -> HTTPResponse:
+    return HTTPResponse(status, MagicMock(), body)
+
+
+@pytest.fixture
+def mock_bot():
+    """Create a mock Discord bot instance with a slow OpenWeather."""
+    bot = MagicMock(default_color=0x2376FF)
+
+    async def get(_, params):
+        await asyncio.sleep(0.01)
+
+        if params["q"].strip().lower() == "montreal":
+            return response(200, b'{"name": "Montreal"}')
+        return response(404)
+
+    bot.http_service.get = AsyncMock(side_effect=get)
+    return bot
+
+
+@pytest.fixture
+def weather_cog(mock_bot):
+    """Instantiate the WeatherCog with a mock bot."""
+    return WeatherCog(mock_bot)
+
+
+def test_normalize_city():
+    """Test that the case and the spacing of a city are ignored"""
+    assert normalize_city("  New   York ") == normalize_city("new york")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_a_request(weather_cog, mock_bot):
+    """Test that the lookups of a city made at once send a single request"""
+    results = await asyncio.gather(
+        weather_cog.get_weather("Montreal"),
+        weather_cog.get_weather("montreal"),
+        weather_cog.get_weather(" MONTREAL "),
+    )
+
+    assert results == [{"name": "Montreal"}] * 3
+    assert mock_bot.http_service.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_weather_is_cached(weather_cog, mock_bot):
+    """Test that the weather of a city and unknown cities are cached"""
+    await weather_cog.get_weather("Montreal")
+    await weather_cog.get_weather("Montreal")
+    assert await weather_cog.get_weather("Atlantis") is None
+    assert await weather_cog.get_weather("Atlantis") is None
+
+    assert mock_bot.http_service.get.await_count == 2
+    assert weather_cog.weather_cache.stats.hit_ratio == 0.5
+
+
+@pytest.mark.asyncio
+async def test_unavailable_upstream_is_not_cached(weather_cog, mock_bot):
+    """Test that a failed lookup is tried again"""
+    mock_bot.http_service.get = AsyncMock(return_value=response(503))
+
+    with pytest.raises(ClientError):
+        await weather_cog.get_weather("Montreal")
+    with pytest.raises(ClientError):
+        await weather_cog.get_weather("Montreal")
+
+    assert mock_bot.http_service.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_city_is_reported(weather_cog, mock_bot):
+    """Test that an unknown city is reported without looking for its time"""
+    weather_cog.get_timezone = MagicMock()
+    ctx = MagicMock(interaction=None, send=AsyncMock())
+
+    await weather_cog.weather.callback(weather_cog, ctx, city_input="atlantis")
+
+    weather_cog.get_timezone.assert_not_called()
+    assert ctx.send.await_args.kwargs["embed"].description == "Atlantis No Found!"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [ClientError("Oops"), asyncio.TimeoutError(), CircuitOpenError("api", 30)],
+)
+async def test_unavailable_weather_is_reported(weather_cog, mock_bot, error):
+    """Test that an unavailable OpenWeather isn't reported as an unknown city"""
+    mock_bot.http_service.get = AsyncMock(side_effect=error)
+    ctx = MagicMock(interaction=None, send=AsyncMock())
+
+    await weather_cog.weather.callback(weather_cog, ctx, city_input="montreal")
+
+    ctx.send.assert_awaited_once_with("Weather is unavailable, try again later.")
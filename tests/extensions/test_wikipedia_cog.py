@@ -0,0 +1,53 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bot.extensions.wikipedia_cog import Wikipedia, search_results
+from bot.services.http_service import CircuitOpenError, HTTPResponse
+
+RESULTS = b'["python", ["Python"], [""], ["https://en.wikipedia.org/wiki/Python"]]'
+
+
+def http_service(**kwargs) -> MagicMock:
+    service = MagicMock()
+    service.get = AsyncMock(**kwargs)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_search_results():
+    """Test that the results of Wikipedia are returned"""
+    service = http_service(return_value=HTTPResponse(200, MagicMock(), RESULTS))
+
+    assert (await search_results(service, "python"))[1] == ["Python"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"return_value": HTTPResponse(503, MagicMock(), b"<html>Error</html>")},
+        {"return_value": HTTPResponse(200, MagicMock(), b"<html>Error</html>")},
+        {"side_effect": asyncio.TimeoutError()},
+        {"side_effect": CircuitOpenError("en.wikipedia.org", 30)},
+    ],
+)
+async def test_unavailable_wikipedia(kwargs):
+    """Test that no results are returned when Wikipedia can't answer"""
+    assert await search_results(http_service(**kwargs), "python") is None
+
+
+@pytest.mark.asyncio
+async def test_wiki_reports_unavailable_wikipedia():
+    """Test that the user is told when Wikipedia is unavailable"""
+    bot = MagicMock()
+    bot.http_service = http_service(side_effect=asyncio.TimeoutError())
+    cog = Wikipedia(bot)
+    ctx = MagicMock(send=AsyncMock())
+
+    await cog.wiki.callback(cog, ctx, search="python")
+
+    ctx.send.assert_awaited_once_with(
+        "Wikipedia is unavailable, try again later.", ephemeral=True
+    )
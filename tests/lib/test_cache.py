@@ -0,0 +1,186 @@
+import asyncio
+
+import pytest
+
+from lib.cache import AsyncCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Loader:
+    """Counts its calls and returns the key, waiting a bit to let concurrent
+    callers pile up."""
+
+    def __init__(self, value="value", error=None):
+        self.value = value
+        self.error = error
+        self.calls = 0
+
+    def __call__(self):
+        return self.load()
+
+    async def load(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+
+        if self.error:
+            raise self.error
+        return self.value
+
+
+def test_values_expire():
+    """Test that a value is only returned while it is fresh"""
+    clock = Clock()
+    cache = AsyncCache(ttl=10, clock=clock)
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    assert "key" in cache
+
+    clock.now = 10
+
+    assert cache.get("key") is None
+    assert "key" not in cache
+
+
+def test_least_recently_used_values_are_evicted():
+    """Test that the least recently used values are evicted first"""
+    cache = AsyncCache(ttl=10, max_size=2)
+    cache.set("first", 1)
+    cache.set("second", 2)
+    cache.get("first")
+    cache.set("third", 3)
+
+    assert cache.get("first") == 1
+    assert cache.get("second") is None
+    assert cache.get("third") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_values_are_evicted_by_weight():
+    """Test that the weigher is used to limit the size of the cache"""
+    cache = AsyncCache(ttl=10, max_size=10, weigher=len)
+    cache.set("small", b"1234")
+    cache.set("medium", b"123456")
+    cache.set("large", b"12345678")
+    cache.set("too large", b"12345678901")
+
+    assert cache.weight == 8
+    assert list(filter(cache.get, ["small", "medium", "large", "too large"])) == [
+        "large"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_a_load():
+    """Test that concurrent lookups of the same key are loaded once"""
+    cache = AsyncCache(ttl=10)
+    loader = Loader()
+
+    values = await asyncio.gather(*(cache.get_or_load("key", loader) for _ in range(5)))
+
+    assert values == ["value"] * 5
+    assert loader.calls == 1
+    assert cache.stats.misses == 5
+    assert cache.stats.loads == 1
+
+
+@pytest.mark.asyncio
+async def test_hits_are_counted():
+    """Test that the cached values are not loaded again"""
+    cache = AsyncCache(ttl=10)
+    loader = Loader()
+
+    await cache.get_or_load("key", loader)
+    await cache.get_or_load("key", loader)
+    await cache.get_or_load("key", loader)
+
+    assert loader.calls == 1
+    assert cache.stats.hits == 2
+    assert cache.stats.hit_ratio == 2 / 3
+
+
+@pytest.mark.asyncio
+async def test_stale_values_are_revalidated():
+    """Test that a stale value is returned while it is refreshed"""
+    clock = Clock()
+    cache = AsyncCache(ttl=10, stale_ttl=10, clock=clock)
+    await cache.get_or_load("key", Loader("old"))
+
+    clock.now = 15
+    loader = Loader("new")
+
+    assert await cache.get_or_load("key", loader) == "old"
+    assert await cache.get_or_load("key", loader) == "old"
+
+    await asyncio.sleep(0.02)
+
+    assert await cache.get_or_load("key", loader) == "new"
+    assert loader.calls == 1
+    assert cache.stats.stale_hits == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_revalidation_keeps_stale_value():
+    """Test that a failed refresh keeps answering the stale value"""
+    clock = Clock()
+    cache = AsyncCache(ttl=10, stale_ttl=10, clock=clock)
+    await cache.get_or_load("key", Loader("old"))
+
+    clock.now = 15
+
+    assert await cache.get_or_load("key", Loader(error=ValueError())) == "old"
+    await asyncio.sleep(0.02)
+
+    assert await cache.get_or_load("key", Loader("new")) == "old"
+    assert cache.stats.load_errors == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_stale_values_are_loaded():
+    """Test that a value is loaded again once it is too stale"""
+    clock = Clock()
+    cache = AsyncCache(ttl=10, stale_ttl=10, clock=clock)
+    await cache.get_or_load("key", Loader("old"))
+
+    clock.now = 20
+
+    assert await cache.get_or_load("key", Loader("new")) == "new"
+
+
+@pytest.mark.asyncio
+async def test_missing_values_are_cached():
+    """Test that a value that doesn't exist is cached for `negative_ttl`"""
+    clock = Clock()
+    cache = AsyncCache(ttl=60, negative_ttl=10, clock=clock)
+    loader = Loader(None)
+
+    assert await cache.get_or_load("key", loader) is None
+    assert await cache.get_or_load("key", loader) is None
+    assert loader.calls == 1
+
+    clock.now = 10
+
+    assert await cache.get_or_load("key", loader) is None
+    assert loader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    """Test that a failed load is tried again"""
+    cache = AsyncCache(ttl=10)
+    loader = Loader(error=ValueError())
+
+    with pytest.raises(ValueError):
+        await cache.get_or_load("key", loader)
+    with pytest.raises(ValueError):
+        await cache.get_or_load("key", loader)
+
+    assert loader.calls == 2
+    assert len(cache) == 0
@@ -0,0 +1,74 @@
+from lib.circuit_breaker import CircuitBreaker, CircuitState
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_opens_after_consecutive_failures():
+    """Test that the circuit opens after too many consecutive failures"""
+    circuit = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=Clock())
+
+    circuit.record_failure()
+    circuit.record_failure()
+    circuit.record_success()
+    circuit.record_failure()
+    circuit.record_failure()
+
+    assert circuit.allow()
+
+    circuit.record_failure()
+
+    assert circuit.state is CircuitState.OPEN
+    assert not circuit.allow()
+    assert circuit.retry_after == 10
+
+
+def test_half_open_allows_a_single_trial():
+    """Test that a single call is allowed once the circuit is half-open"""
+    clock = Clock()
+    circuit = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    circuit.record_failure()
+
+    clock.now = 10
+
+    assert circuit.state is CircuitState.HALF_OPEN
+    assert circuit.allow()
+    assert not circuit.allow()
+
+    circuit.record_success()
+
+    assert circuit.state is CircuitState.CLOSED
+    assert circuit.allow()
+
+
+def test_failed_trial_opens_the_circuit():
+    """Test that a failed trial opens the circuit again"""
+    clock = Clock()
+    circuit = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+    for _ in range(3):
+        circuit.record_failure()
+
+    clock.now = 10
+    assert circuit.allow()
+    circuit.record_failure()
+
+    assert circuit.state is CircuitState.OPEN
+    assert circuit.retry_after == 10
+
+
+def test_lost_trial_is_replaced():
+    """Test that a trial without result doesn't keep the circuit half-open"""
+    clock = Clock()
+    circuit = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    circuit.record_failure()
+
+    clock.now = 10
+    assert circuit.allow()
+
+    clock.now = 20
+    assert circuit.allow()
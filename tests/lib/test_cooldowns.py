@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock
+
+from discord.ext.commands import BucketType, CooldownMapping
+from discord.ext.commands.cooldowns import DynamicCooldownMapping
+
+from lib.cooldowns import PersistentCooldownMapping, make_persistent
+
+
+def message(author_id):
+    return MagicMock(author=MagicMock(id=author_id))
+
+
+def test_rate_limit():
+    """Test that the buckets are rate limited like discord.py"""
+    mapping = PersistentCooldownMapping.from_cooldown(1, 60, BucketType.user)
+
+    assert mapping.update_rate_limit(message(1), current=1000.0) is None
+    assert mapping.update_rate_limit(message(1), current=1010.0) == 50.0
+    assert mapping.update_rate_limit(message(2), current=1010.0) is None
+
+
+def test_expired_buckets_are_evicted():
+    """Test that the buckets are deleted once expired"""
+    mapping = PersistentCooldownMapping.from_cooldown(1, 60, BucketType.user)
+
+    for author_id in range(1000):
+        mapping.update_rate_limit(message(author_id), current=1000.0)
+
+    mapping.update_rate_limit(message(1), current=1050.0)
+    assert len(mapping) == 1000
+
+    mapping.get_bucket(message(1), current=1070.0)
+    assert len(mapping) == 1
+    assert len(mapping._expirations) == 1
+
+
+def test_dump_and_restore():
+    """Test that a restored mapping keeps the cooldowns"""
+    mapping = PersistentCooldownMapping.from_cooldown(1, 60, BucketType.user)
+    mapping.update_rate_limit(message(1), current=1000.0)
+    mapping.update_rate_limit(message(2), current=900.0)
+
+    restored = PersistentCooldownMapping.from_cooldown(1, 60, BucketType.user)
+    restored.restore(mapping.dump(), current=1010.0)
+
+    assert len(restored) == 1
+    assert restored.update_rate_limit(message(1), current=1010.0) == 50.0
+
+
+def test_dump_changed_only():
+    """Test that only the buckets used since the last dump are dumped"""
+    mapping = PersistentCooldownMapping.from_cooldown(2, 60, BucketType.user)
+    mapping.update_rate_limit(message(1), current=1000.0)
+    mapping.update_rate_limit(message(2), current=1000.0)
+    mapping.dump(changed_only=True)
+
+    mapping.update_rate_limit(message(2), current=1001.0)
+
+    assert [state[0] for state in mapping.dump(changed_only=True)] == [2]
+    assert mapping.dump(changed_only=True) == []
+
+
+def test_make_persistent():
+    """Test that only per bucket cooldowns are made persistent"""
+    mapping = CooldownMapping.from_cooldown(1, 60, BucketType.user)
+
+    assert isinstance(make_persistent(mapping), PersistentCooldownMapping)
+    assert make_persistent(CooldownMapping(None, BucketType.default)) is None
+    assert (
+        make_persistent(DynamicCooldownMapping(lambda _: None, BucketType.user)) is None
+    )
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from lib.fenwick_tree import FenwickTree
+
+
+def test_prefix_sum():
+    """Test that the prefix sums count the indexes lower or equal"""
+    tree = FenwickTree(8)
+
+    for index in (1, 3, 3, 8):
+        tree.add(index)
+
+    assert [tree.prefix_sum(index) for index in range(9)] == [0, 1, 1, 3, 3, 3, 3, 3, 4]
+    assert tree.total == 4
+
+
+def test_grows_past_its_size():
+    """Test that adding past the end grows the tree without losing counts"""
+    tree = FenwickTree(2)
+    tree.add(2)
+    tree.add(100)
+
+    assert tree.size >= 100
+    assert tree.prefix_sum(2) == 1
+    assert tree.prefix_sum(99) == 1
+    assert tree.prefix_sum(100) == 2
+
+
+def test_from_indexes_matches_adds():
+    """Test that a tree built at once is the same as one built by adds"""
+    indexes = [random.randint(1, 300) for _ in range(1000)]
+    built = FenwickTree.from_indexes(indexes)
+    added = FenwickTree()
+
+    for index in indexes:
+        added.add(index)
+
+    for index in range(1, 301):
+        expected = sum(1 for value in indexes if value <= index)
+        assert built.prefix_sum(index) == added.prefix_sum(index) == expected
+
+
+def test_index_starts_at_one():
+    """Test that index 0 can't be added"""
+    with pytest.raises(IndexError):
+        FenwickTree().add(0)
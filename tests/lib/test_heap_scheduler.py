@@ -0,0 +1,93 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from lib.heap_scheduler import HeapScheduler
+
+NOW = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+async def noop(_):
+    pass
+
+
+def daily_at(hour):
+    return CronTrigger(hour=hour, minute=0, timezone="UTC")
+
+
+def test_pop_due_in_order():
+    """Test that the due jobs are popped and rescheduled"""
+    scheduler = HeapScheduler(noop)
+    scheduler.schedule("late", daily_at(15), now=NOW)
+    scheduler.schedule("early", daily_at(13), now=NOW)
+
+    assert scheduler.pop_due(NOW) == []
+    assert scheduler.pop_due(NOW.replace(hour=16)) == ["early", "late"]
+    assert scheduler.next_fire_time("early") == NOW.replace(day=2, hour=13)
+
+
+def test_reschedule_and_unschedule():
+    """Test that the previous fire time of a job is ignored"""
+    scheduler = HeapScheduler(noop)
+    scheduler.schedule("rescheduled", daily_at(13), now=NOW)
+    scheduler.schedule("unscheduled", daily_at(13), now=NOW)
+
+    scheduler.schedule("rescheduled", daily_at(18), now=NOW)
+    scheduler.unschedule("unscheduled")
+
+    assert len(scheduler) == 1
+    assert scheduler.pop_due(NOW.replace(hour=14)) == []
+    assert scheduler.pop_due(NOW.replace(hour=18)) == ["rescheduled"]
+
+
+def test_many_jobs():
+    """Test that only the due jobs are fired among many"""
+    scheduler = HeapScheduler(noop)
+
+    for hour in range(24):
+        for minute in range(0, 60, 5):
+            scheduler.schedule(
+                (hour, minute),
+                CronTrigger(hour=hour, minute=minute, timezone="UTC"),
+                now=NOW,
+            )
+
+    due = scheduler.pop_due(NOW + timedelta(minutes=30))
+
+    assert due == [(12, minute) for minute in range(0, 35, 5)]
+    assert len(scheduler) == 24 * 12
+
+
+def test_late_dispatch_skips_missed_fire_times():
+    """Test that a late job is popped once and rescheduled after now"""
+    scheduler = HeapScheduler(noop)
+    scheduler.schedule("hourly", CronTrigger(minute=0, timezone="UTC"), now=NOW)
+    scheduler.schedule("interval", IntervalTrigger(seconds=1, start_date=NOW), now=NOW)
+
+    late = NOW + timedelta(hours=3, minutes=5)
+
+    assert sorted(scheduler.pop_due(late)) == ["hourly", "interval"]
+    assert scheduler.next_fire_time("hourly") == NOW.replace(hour=16)
+    assert scheduler.next_fire_time("interval") == late + timedelta(seconds=1)
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_fires_jobs():
+    """Test that the dispatcher calls the callback with the due jobs"""
+    fired = asyncio.Queue()
+
+    async def callback(keys):
+        await fired.put(keys)
+
+    scheduler = HeapScheduler(callback)
+    scheduler.start()
+
+    try:
+        scheduler.schedule("job", IntervalTrigger(seconds=0.05))
+
+        assert await asyncio.wait_for(fired.get(), 1) == ["job"]
+    finally:
+        scheduler.stop()
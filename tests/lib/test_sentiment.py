@@ -0,0 +1,101 @@
+import random
+
+import pytest
+from nltk.sentiment.vader import SentimentIntensityAnalyzer, VaderConstants
+
+from lib.sentiment import EMPTY_SCORES, NEUTRAL_SCORES, SentimentAnalyzer
+
+NEUTRAL_WORDS = [
+    "the", "linux", "kernel", "python", "grace", "a", "I", "it", "of", "kind",
+    "to", "is", "was", "code", "merge", "review", "@grace", "#rust", "r/python",
+]  # fmt: skip
+PUNCTUATION = ["", "", "", ".", "!", "?", ",", "!!!", "?!", "...", "'", '"', ":"]
+
+
+@pytest.fixture(scope="module")
+def nltk_analyzer():
+    return SentimentIntensityAnalyzer()
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return SentimentAnalyzer()
+
+
+def generate_corpus(analyzer: SentimentAnalyzer, size: int):
+    """Generates random messages mixing neutral words, lexicon words, boosters,
+    negations, idioms, capitalization and punctuation."""
+    rng = random.Random(1337)
+
+    lexicon = sorted(analyzer.lexicon)
+    constants = VaderConstants()
+    modifiers = sorted(constants.BOOSTER_DICT) + sorted(constants.NEGATE)
+    modifiers += ["but", "never", "so", "this", "least", "kind of", "yeah right"]
+
+    for _ in range(size):
+        words = []
+
+        for _ in range(rng.randint(0, 12)):
+            roll = rng.random()
+
+            if roll < 0.6:
+                word = rng.choice(NEUTRAL_WORDS)
+            elif roll < 0.8:
+                word = rng.choice(lexicon)
+            else:
+                word = rng.choice(modifiers)
+
+            if rng.random() < 0.1:
+                word = word.upper()
+            prefix = rng.choice(PUNCTUATION) if rng.random() < 0.2 else ""
+            words.append(prefix + word + rng.choice(PUNCTUATION))
+
+        yield " ".join(words)
+
+
+def test_parity_with_nltk(analyzer, nltk_analyzer):
+    """Verify that the scores are the same as NLTK's on a large corpus."""
+    for text in generate_corpus(analyzer, 20_000):
+        assert analyzer.polarity_scores(text) == nltk_analyzer.polarity_scores(text), (
+            text
+        )
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", " ", "a", "a ? !", "The kernel was merged", "#happy", "@love", "linux."],
+)
+def test_parity_without_sentiment_words(analyzer, nltk_analyzer, text):
+    """Verify that the scores of texts without sentiment words are unchanged."""
+    assert analyzer.polarity_scores(text) == nltk_analyzer.polarity_scores(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [":) great", "(great)", "!!great", "great!?!", "'love'", "don't!", "so.good"],
+)
+def test_parity_with_punctuation(analyzer, nltk_analyzer, text):
+    """Verify that the punctuation around the words is stripped like NLTK."""
+    assert analyzer.polarity_scores(text) == nltk_analyzer.polarity_scores(text)
+
+
+def test_scores_without_sentiment_words(analyzer):
+    """Verify that texts without sentiment words skip the VADER rules."""
+    assert analyzer.polarity_scores("") == EMPTY_SCORES
+    assert analyzer.polarity_scores("The kernel was merged") == NEUTRAL_SCORES
+    assert not analyzer.has_sentiment_words("The kernel was merged")
+    assert analyzer.has_sentiment_words("The kernel is GREAT!")
+
+
+def test_batch(analyzer, nltk_analyzer):
+    """Verify that a batch is scored in order."""
+    texts = ["I love it", "I hate it", "It is a kernel"]
+
+    assert analyzer.polarity_scores_batch(texts) == [
+        nltk_analyzer.polarity_scores(text) for text in texts
+    ]
+
+
+def test_lexicon_is_loaded_once(analyzer):
+    """Verify that every analyzer shares the same lexicon."""
+    assert SentimentAnalyzer().lexicon is analyzer.lexicon
@@ -0,0 +1,78 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from lib.timed_view import TimedView
+from lib.timer_wheel import TimerWheel
+
+
+def advance(wheel, ticks):
+    for _ in range(ticks):
+        wheel.advance()
+
+
+def test_timers_fire_at_their_tick():
+    """Test that timers of every wheel fire at their tick"""
+    wheel = TimerWheel(slots=10, levels=3)
+    fired = []
+
+    for delay in (1, 9, 10, 55, 999, 5000):
+        wheel.schedule(delay, lambda delay=delay: fired.append((delay, wheel.tick)))
+
+    advance(wheel, 5000)
+
+    assert fired == [(1, 1), (9, 9), (10, 10), (55, 55), (999, 999), (5000, 5000)]
+    assert len(wheel) == 0
+
+
+def test_cancelled_timers_do_not_fire():
+    """Test that a cancelled timer is dropped"""
+    wheel = TimerWheel(slots=10)
+    callback = MagicMock()
+
+    wheel.schedule(25, callback).cancel()
+    advance(wheel, 30)
+
+    callback.assert_not_called()
+
+
+def test_many_timers():
+    """Test that only the due timers fire among many"""
+    wheel = TimerWheel()
+    fired = []
+
+    for delay in range(1, 10001):
+        wheel.schedule(delay, lambda delay=delay: fired.append(delay))
+
+    advance(wheel, 100)
+
+    assert fired == list(range(1, 101))
+    assert len(wheel) == 9900
+
+
+class CountdownView(TimedView):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.updates = []
+
+    async def on_timer_update(self):
+        self.updates.append(self.seconds)
+
+
+@pytest.mark.asyncio
+async def test_timed_views_share_the_wheel(monkeypatch):
+    """Test that views are updated at their cadence until they elapse"""
+    monkeypatch.setattr(TimedView, "timer_wheel", TimerWheel(resolution=0.01))
+
+    fast = CountdownView(seconds=1, update_interval=1)
+    stopped = CountdownView(seconds=1)
+
+    fast.start_timer()
+    stopped.start_timer()
+    stopped.stop()
+
+    await asyncio.wait_for(fast.wait(), 2)
+
+    assert fast.updates == [1]
+    assert stopped.updates == []
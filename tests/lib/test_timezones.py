@@ -0,0 +1,50 @@
+from lib.timezones import (
+    find_timezones,
+    generate_timezone_index,
+    get_timezone,
+    load_timezone_index,
+)
+
+
+def test_generated_index_skips_ambiguous_abbreviations():
+    """Verify that abbreviations used with different offsets are left out."""
+    index = generate_timezone_index()
+
+    assert index["AEST"] == "Australia/Brisbane"
+    assert index["EAT"] == "Africa/Addis_Ababa"
+    assert "CST" not in index
+    assert "IST" not in index
+    assert "LMT" not in index
+
+
+def test_index_is_loaded_once():
+    """Verify that the index file is loaded lazily, once."""
+    assert load_timezone_index() is load_timezone_index()
+    assert load_timezone_index()["NZST"] == "Antarctica/McMurdo"
+
+
+def test_curated_abbreviations_take_precedence():
+    """Verify that curated abbreviations settle ambiguous ones in any case."""
+    assert get_timezone("IST") == "Asia/Kolkata"
+    assert get_timezone("ist") == "Asia/Kolkata"
+    assert get_timezone("CET") == "Europe/Paris"
+
+
+def test_generated_abbreviations_are_case_sensitive():
+    """Verify that generated abbreviations don't match common words."""
+    assert get_timezone("EAT") == "Africa/Addis_Ababa"
+    assert get_timezone("eat") is None
+    assert get_timezone("Wat") is None
+
+
+def test_find_timezones():
+    """Verify that every abbreviation is found on whole words with its span."""
+    text = "Lunch at 1pm EAT, let's eat then call at 5pm pst"
+    timezones = find_timezones(text)
+
+    assert [(tz.abbreviation, tz.zone) for tz in timezones] == [
+        ("EAT", "Africa/Addis_Ababa"),
+        ("pst", "America/Los_Angeles"),
+    ]
+    assert text[timezones[0].start : timezones[0].end] == "EAT"
+    assert find_timezones("This is a test") == []
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+from nltk.tokenize import TweetTokenizer
+
+from lib.tokenizer import is_fast_text, tokenize
+
+WORDS = ["linux", "Linus", "don't", "rock-n-roll", "#rust", "@grace", "I", "##x"]
+SEPARATORS = ["", " ", ". ", ".", ",", "!!!!", "?", " - ", "'", "(", ")", '"', "#"]
+
+
+@pytest.fixture(scope="module")
+def tweet_tokenizer():
+    return TweetTokenizer()
+
+
+def generate_corpus(size: int):
+    rng = random.Random(1337)
+    alphabet = "abcXYZ  .,!?'\"()*#@-\n\t"
+
+    for _ in range(size):
+        if rng.random() < 0.5:
+            yield "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 25)))
+        else:
+            yield "".join(
+                rng.choice(WORDS) + rng.choice(SEPARATORS)
+                for _ in range(rng.randint(0, 8))
+            )
+
+
+def test_parity_with_nltk(tweet_tokenizer):
+    """Verify that the tokens are the same as NLTK's on a large corpus."""
+    for text in generate_corpus(50_000):
+        assert tokenize(text) == tuple(tweet_tokenizer.tokenize(text)), text
+
+
+@pytest.mark.parametrize(
+    "text, tokens",
+    [
+        ("Hello, world!", ("Hello", ",", "world", "!")),
+        ("@grace likes #python", ("@grace", "likes", "#python")),
+        ("Linus doesn't rock-n-roll", ("Linus", "doesn't", "rock-n-roll")),
+        ("What!!!!!", ("What", "!", "!", "!")),
+    ],
+)
+def test_fast_path(text, tokens):
+    """Verify that plain ASCII messages are tokenized without NLTK."""
+    assert is_fast_text(text)
+    assert tokenize(text) == tokens
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "see https://github.com/Code-Society-Lab",
+        "grace.codesociety.xyz",
+        "wait... what",
+        "I <3 linux :)",
+        "call 555-123-4567",
+        "Rust is 🦀🦀",
+        "tom &amp; jerry",
+        "café",
+    ],
+)
+def test_fallback(tweet_tokenizer, text):
+    """Verify that other messages are tokenized by NLTK."""
+    assert not is_fast_text(text)
+    assert tokenize(text) == tuple(tweet_tokenizer.tokenize(text))
+
+
+def test_tokens_are_cached():
+    """Verify that the tokens of a text are computed once."""
+    tokenize.cache_clear()
+
+    assert tokenize("cached text") is tokenize("cached text")
+    assert tokenize.cache_info().hits == 1
@@ -0,0 +1,106 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+
+import pytest
+
+from bot.classes.period import Period
+from bot.models.extensions.thank import Thank
+from bot.models.extensions.thank_event import ThankEvent
+from bot.models.extensions.thank_rollup import ThankRollup
+
+HELPER_ID = 381004230475726849
+OTHER_HELPER_ID = 381004230475726850
+
+
+@pytest.fixture(autouse=True)
+def clear_thanks():
+    yield
+
+    for model in (Thank, ThankEvent, ThankRollup):
+        for record in model.where(
+            model.member_id.in_([HELPER_ID, OTHER_HELPER_ID])
+        ).all():
+            record.delete()
+
+
+def test_increment_creates_missing_thanks():
+    """Test that the first thank of a member creates their record"""
+    assert Thank.increment(HELPER_ID) == {HELPER_ID: 1}
+    assert Thank.find_by(member_id=HELPER_ID).count == 1
+
+
+def test_increment_many_members():
+    """Test that many members are thanked at once, only once each"""
+    Thank.increment(HELPER_ID)
+
+    counts = Thank.increment(HELPER_ID, OTHER_HELPER_ID, HELPER_ID)
+
+    assert counts == {HELPER_ID: 2, OTHER_HELPER_ID: 1}
+    assert Thank.find_by(member_id=OTHER_HELPER_ID).count == 1
+
+
+def test_increment_without_members():
+    """Test that nothing is done without members"""
+    assert Thank.increment() == {}
+
+
+def test_concurrent_increments():
+    """Test that concurrent thanks are not lost"""
+    Thank.increment(HELPER_ID)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: Thank.increment(HELPER_ID), range(20)))
+
+    assert Thank.find_by(member_id=HELPER_ID).count == 21
+
+
+def test_increment_logs_events():
+    """Test that every thank is logged with its author"""
+    Thank.increment(HELPER_ID, OTHER_HELPER_ID, author_id=1)
+
+    events = ThankEvent.where(member_id=HELPER_ID).all()
+
+    assert len(events) == 1
+    assert events[0].author_id == 1
+
+
+def test_increment_updates_rollups():
+    """Test that the weekly and monthly rollups are updated"""
+    time = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+    Thank.increment(HELPER_ID, time=time)
+    Thank.increment(HELPER_ID, OTHER_HELPER_ID, time=time)
+
+    assert ThankRollup.top(Period.WEEK, date(2024, 4, 29), 10) == [
+        (HELPER_ID, 2),
+        (OTHER_HELPER_ID, 1),
+    ]
+    assert ThankRollup.top(Period.MONTH, date(2024, 5, 1), 1) == [(HELPER_ID, 2)]
+    assert ThankRollup.top(Period.MONTH, date(2024, 4, 1), 10) == []
+
+
+def test_rollup_positions():
+    """Test that members with the same count share a position"""
+    time = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+    Thank.increment(HELPER_ID, OTHER_HELPER_ID, time=time)
+
+    positions = ThankRollup.positions(
+        Period.MONTH, date(2024, 5, 1), [HELPER_ID, OTHER_HELPER_ID]
+    )
+
+    assert positions[HELPER_ID] == positions[OTHER_HELPER_ID] == 1
+
+
+def test_rollup_positions_of_listed_members():
+    """Test that only the positions of the given members are returned"""
+    time = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+    Thank.increment(HELPER_ID, OTHER_HELPER_ID, time=time)
+    Thank.increment(HELPER_ID, time=time)
+
+    assert ThankRollup.positions(Period.MONTH, date(2024, 5, 1), [OTHER_HELPER_ID]) == {
+        OTHER_HELPER_ID: 2
+    }
+    assert ThankRollup.positions(Period.MONTH, date(2024, 4, 1), [HELPER_ID]) == {}
+    assert ThankRollup.positions(Period.MONTH, date(2024, 5, 1), []) == {}
@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from bot.services.http_service import CircuitOpenError, HTTPService
+
+
+@pytest_asyncio.fixture
+async def upstream():
+    """A local upstream, `/flaky` fails twice before answering, `/down`
+    always fails and `/slow` takes a second to answer."""
+    requests = []
+
+    async def flaky(request):
+        requests.append(request.path)
+
+        if requests.count("/flaky") <= 2:
+            return web.Response(status=503)
+        return web.json_response({"answer": 42})
+
+    async def down(request):
+        requests.append(request.path)
+        return web.Response(status=500)
+
+    async def slow(request):
+        requests.append(request.path)
+        await asyncio.sleep(1)
+        return web.Response()
+
+    async def create(request):
+        requests.append(request.path)
+        return web.Response(status=503)
+
+    app = web.Application()
+    app.router.add_get("/flaky", flaky)
+    app.router.add_get("/down", down)
+    app.router.add_get("/slow", slow)
+    app.router.add_post("/create", create)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    port = runner.addresses[0][1]
+    yield f"http://127.0.0.1:{port}", requests
+
+    await runner.cleanup()
+
+
+@pytest_asyncio.fixture
+async def http_service():
+    http_service = HTTPService(
+        timeout=0.2, retries=2, backoff=0.01, failure_threshold=3, reset_timeout=0.1
+    )
+
+    yield http_service
+    await http_service.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_are_retried(http_service, upstream):
+    """Test that an idempotent request is retried until it succeeds"""
+    url, requests = upstream
+
+    response = await http_service.get(f"{url}/flaky")
+
+    assert response.ok
+    assert response.json() == {"answer": 42}
+    assert requests == ["/flaky"] * 3
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_requests_are_not_retried(http_service, upstream):
+    """Test that a POST request is sent once"""
+    url, requests = upstream
+
+    response = await http_service.request("POST", f"{url}/create")
+
+    assert response.status == 503
+    assert requests == ["/create"]
+
+
+@pytest.mark.asyncio
+async def test_slow_requests_time_out(http_service, upstream):
+    """Test that a slow upstream is abandoned after the timeout"""
+    url, requests = upstream
+
+    with pytest.raises(asyncio.TimeoutError):
+        await http_service.get(f"{url}/slow", retries=0)
+
+    assert requests == ["/slow"]
+
+
+@pytest.mark.asyncio
+async def test_failing_upstream_opens_its_circuit(http_service, upstream):
+    """Test that an upstream that keeps failing is not requested anymore"""
+    url, requests = upstream
+
+    response = await http_service.get(f"{url}/down")
+    assert response.status == 500
+
+    with pytest.raises(CircuitOpenError):
+        await http_service.get(f"{url}/down")
+
+    assert requests == ["/down"] * 3
+
+
+@pytest.mark.asyncio
+async def test_circuit_closes_once_upstream_recovers(http_service, upstream):
+    """Test that a successful trial closes the circuit"""
+    url, requests = upstream
+
+    await http_service.get(f"{url}/flaky", retries=1)
+    await http_service.get(f"{url}/down", retries=0)
+
+    with pytest.raises(CircuitOpenError):
+        await http_service.get(f"{url}/flaky")
+
+    await asyncio.sleep(0.1)
+
+    response = await http_service.get(f"{url}/flaky")
+    assert response.ok
+    assert requests == ["/flaky", "/flaky", "/down", "/flaky"]
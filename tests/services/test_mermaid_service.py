@@ -0,0 +1,112 @@
+import asyncio
+import base64
+import json
+import zlib
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from bot.services.http_service import HTTPService
+from bot.services.mermaid_service import MermaidService
+
+
+def decode_diagram(encoded: str) -> str:
+    encoded = encoded.removeprefix("pako:").replace("-", "+").replace("_", "/")
+    data = zlib.decompress(base64.b64decode(encoded + "=" * (-len(encoded) % 4)))
+
+    return json.loads(data)["code"]
+
+
+@pytest_asyncio.fixture
+async def mermaid_ink():
+    """A local stand-in for mermaid.ink, diagrams containing 'error' are
+    invalid and diagrams containing 'down' fail."""
+    requests = []
+
+    async def render(request):
+        diagram = decode_diagram(request.match_info["diagram"])
+        requests.append(diagram)
+
+        await asyncio.sleep(0.01)
+
+        if "down" in diagram:
+            return web.Response(status=503)
+        if "error" in diagram:
+            return web.Response(status=400)
+        return web.Response(body=b"image")
+
+    app = web.Application()
+    app.router.add_get("/img/{diagram}", render)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    port = runner.addresses[0][1]
+    yield f"http://127.0.0.1:{port}", requests
+
+    await runner.cleanup()
+
+
+@pytest_asyncio.fixture
+async def mermaid_service(mermaid_ink):
+    url, _ = mermaid_ink
+    http_service = HTTPService()
+
+    yield MermaidService(http_service, url)
+    await http_service.close()
+
+
+@pytest.mark.asyncio
+async def test_valid_diagram(mermaid_service, mermaid_ink):
+    """Test that a valid diagram returns its URL"""
+    url, _ = mermaid_ink
+
+    diagram_url = await mermaid_service.generate("graph TD;\nA-->B")
+
+    assert diagram_url.startswith(f"{url}/img/pako:")
+
+
+@pytest.mark.asyncio
+async def test_invalid_diagram(mermaid_service):
+    """Test that an invalid diagram returns None"""
+    assert await mermaid_service.generate("graph error") is None
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached(mermaid_service, mermaid_ink):
+    """Test that a diagram is validated once"""
+    _, requests = mermaid_ink
+
+    first_url = await mermaid_service.generate("graph TD;\nA-->B")
+    second_url = await mermaid_service.generate("graph TD;\nA-->B")
+    await mermaid_service.generate("graph error")
+    await mermaid_service.generate("graph error")
+
+    assert first_url == second_url
+    assert requests == ["graph TD;\nA-->B", "graph error"]
+
+
+@pytest.mark.asyncio
+async def test_identical_diagrams_share_a_request(mermaid_service, mermaid_ink):
+    """Test that identical diagrams requested at once are validated once"""
+    _, requests = mermaid_ink
+
+    urls = await asyncio.gather(
+        *(mermaid_service.generate("graph TD;\nA-->B") for _ in range(5))
+    )
+
+    assert len(set(urls)) == 1
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_unavailable_service_is_not_cached(mermaid_service, mermaid_ink):
+    """Test that a failed validation is tried again"""
+    _, requests = mermaid_ink
+
+    assert await mermaid_service.generate("graph down") is None
+    assert await mermaid_service.generate("graph down") is None
+    assert len(requests) == 2
@@ -0,0 +1,107 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from bot.services.nlp_service import NLPService
+from lib.nlp import NLPResult, analyze_texts
+
+
+@pytest.fixture(scope="module")
+def nlp_service():
+    service = NLPService(workers=1, batch_size=4)
+    yield service
+    service.shutdown()
+
+
+def build_message(message_id: int, content: str) -> MagicMock:
+    message = MagicMock()
+    message.id = message_id
+    message.content = content
+    return message
+
+
+def test_polarity():
+    """Verify that the polarity follows the VADER scores."""
+    assert analyze_texts(["I love Linux"])[0].polarity == 1
+    assert analyze_texts(["I hate Linux"])[0].polarity == -1
+    assert analyze_texts(["Linux is a kernel"])[0].polarity == 0
+
+
+@pytest.mark.asyncio
+async def test_analyze_in_workers(nlp_service):
+    """Verify that the workers return the same result as an in-process analysis."""
+    texts = [f"Linus wrote {i} great patches!" for i in range(10)]
+    results = [await nlp_service.analyze(text) for text in texts]
+
+    assert results == analyze_texts(texts)
+    assert results[0].tokens == ("linus", "wrote", "0", "great", "patches", "!")
+    assert nlp_service.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch(nlp_service):
+    """Verify that concurrent requests are batched and resolved in order."""
+    texts = [f"message number {i} is awful" for i in range(9)]
+    tasks = [asyncio.ensure_future(nlp_service.analyze(text)) for text in texts]
+
+    await asyncio.sleep(0)
+    assert nlp_service.queue_depth == len(texts)
+
+    results = await asyncio.gather(*tasks)
+
+    assert [result.tokens[2] for result in results] == [str(i) for i in range(9)]
+    assert nlp_service.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_analyze_message_is_memoized(nlp_service):
+    """Verify that a message is analyzed at most once."""
+    message = build_message(1, "Grace is wonderful")
+
+    first = await nlp_service.analyze_message(message)
+    second = await nlp_service.analyze_message(message)
+
+    assert isinstance(first, NLPResult)
+    assert first is second
+    assert first.polarity == 1
+
+
+@pytest.mark.asyncio
+async def test_memoization_is_bounded():
+    """Verify that only the most recent results are kept in memory."""
+    service = NLPService(workers=1, cache_size=2)
+
+    try:
+        for message_id in range(3):
+            await service.analyze_message(build_message(message_id, "hello"))
+
+        assert service.cached_count == 2
+    finally:
+        service.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_is_replaced():
+    """Verify that the texts are still analyzed after a worker died."""
+    service = NLPService(workers=1)
+
+    try:
+        await service.analyze("hello")
+        executor = service.executor
+
+        for process in list(executor._processes.values()):
+            process.kill()
+
+        for _ in range(100):
+            if executor._broken:
+                break
+            await asyncio.sleep(0.05)
+
+        # A broken pool used to leave the texts waiting forever
+        result = await asyncio.wait_for(service.analyze("hello world"), 30)
+
+        assert result.tokens == ("hello", "world")
+        assert service.executor is not executor
+    finally:
+        service.shutdown()